@@ -0,0 +1,173 @@
+# admission.py
+"""
+Arka uçlar (python-run, pylint, javac, java-run, judge0) için kabul kontrolü.
+
+Her arka ucun kendi eşzamanlılık sınırı ve sınırlı bir bekleme kuyruğu vardır:
+sonsuz döngülü gönderimler yalnızca python-run yuvalarını doldurur, pylint veya
+Judge0 isteklerini bekletmez. Kuyruk doluysa ya da bekleme süresi dolarsa
+BackendBusy fırlatılır; app bunu Retry-After başlıklı 429 cevabına çevirir.
+
+Bekleyenler istemci başına ayrı kuyruklarda tutulur ve boşalan yuva istemciler
+arasında sırayla (round-robin) verilir; tek bir kullanıcının art arda yolladığı
+istekler diğer kullanıcıların önüne geçemez. İstemci kimliği istek başında
+`current_client` context değişkenine yazılır.
+
+Sınırlar gunicorn worker'ı (süreç) başınadır.
+"""
+import contextvars
+import math
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+from metrics import count_rejected
+
+current_client = contextvars.ContextVar("current_client", default="anonymous")
+
+
+def _env_int(backend, setting, default):
+    return int(os.environ.get(f"LIMIT_{backend.upper().replace('-', '_')}_{setting}", default))
+
+
+def _env_float(backend, setting, default):
+    return float(os.environ.get(f"LIMIT_{backend.upper().replace('-', '_')}_{setting}", default))
+
+
+# arka uç -> (eşzamanlılık, kuyruk derinliği, bekleme süresi sn)
+# Ör. LIMIT_PYTHON_RUN_CONCURRENCY=4, LIMIT_JUDGE0_QUEUE=32, LIMIT_PYLINT_WAIT=5
+BACKEND_DEFAULTS = {
+    "python-run": (4, 16, 5.0),
+    "pylint": (2, 16, 10.0),  # lint_pool boyutuyla aynı
+    "javac": (1, 8, 10.0),  # tek JVM daemon'u
+    "java-run": (2, 16, 10.0),  # java_daemon.JavaRunPool boyutuyla aynı
+    "judge0": (8, 32, 10.0),
+}
+# Bir istemcinin bir arka uçta aynı anda kuyrukta bekletebileceği istek sayısı
+LIMIT_PER_CLIENT_QUEUE = int(os.environ.get("LIMIT_PER_CLIENT_QUEUE", 4))
+# X-Forwarded-For'a adres ekleyen güvenilir proxy sayısı (Render: 1; doğrudan erişimde 0)
+TRUSTED_PROXY_HOPS = int(os.environ.get("TRUSTED_PROXY_HOPS", 1))
+
+
+class BackendBusy(Exception):
+    def __init__(self, backend, retry_after):
+        super().__init__(f"{backend} şu anda meşgul, lütfen {retry_after} saniye sonra tekrar deneyin.")
+        self.backend = backend
+        self.retry_after = retry_after
+
+
+class Limiter:
+    def __init__(self, name, concurrency, queue_depth, wait_timeout, per_client_queue=LIMIT_PER_CLIENT_QUEUE):
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self.queue_depth = max(0, queue_depth)
+        self.wait_timeout = wait_timeout
+        self.per_client_queue = max(1, per_client_queue)
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting = 0
+        self._queues = OrderedDict()  # istemci -> bekleyen biletler (deque)
+        self._granted = set()
+        self._hold_avg = 1.0  # yuvanın ortalama tutulma süresi (Retry-After tahmini için)
+        self.rejected = 0
+
+    def _retry_after(self):
+        # kuyruktakilerin hepsi eritilene kadar geçecek yaklaşık süre
+        return max(1, math.ceil(self._hold_avg * (self._waiting + 1) / self.concurrency))
+
+    def _grant_next(self):
+        while self._active < self.concurrency and self._queues:
+            client, tickets = next(iter(self._queues.items()))
+            ticket = tickets.popleft()
+            if tickets:
+                self._queues.move_to_end(client)  # sıradaki istemciye geç
+            else:
+                del self._queues[client]
+            self._waiting -= 1
+            self._active += 1
+            self._granted.add(ticket)
+        self._cond.notify_all()
+
+    def _remove(self, client, ticket):
+        tickets = self._queues.get(client)
+        if tickets is not None and ticket in tickets:
+            tickets.remove(ticket)
+            self._waiting -= 1
+            if not tickets:
+                del self._queues[client]
+
+    def acquire(self, client=None, wait=None):
+        """wait: bekleme süresi üst sınırı (ör. isteğin kalan süre bütçesi); varsayılan wait_timeout."""
+        client = client or current_client.get()
+        with self._cond:
+            if self._active < self.concurrency and not self._queues:
+                self._active += 1
+                return
+            tickets = self._queues.get(client, ())
+            if self._waiting >= self.queue_depth or len(tickets) >= self.per_client_queue:
+                self.rejected += 1
+                count_rejected(self.name)
+                raise BackendBusy(self.name, self._retry_after())
+
+            ticket = object()
+            self._queues.setdefault(client, deque()).append(ticket)
+            self._waiting += 1
+            deadline = time.monotonic() + (self.wait_timeout if wait is None else min(wait, self.wait_timeout))
+            while ticket not in self._granted:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._remove(client, ticket)
+                    self.rejected += 1
+                    count_rejected(self.name)
+                    raise BackendBusy(self.name, self._retry_after())
+                self._cond.wait(remaining)
+            self._granted.discard(ticket)
+
+    def release(self, held=None):
+        with self._cond:
+            self._active -= 1
+            if held is not None:
+                self._hold_avg = 0.8 * self._hold_avg + 0.2 * held
+            self._grant_next()
+
+    @contextmanager
+    def slot(self, client=None, wait=None):
+        self.acquire(client, wait)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - started)
+
+    def stats(self):
+        with self._cond:
+            return {"active": self._active, "waiting": self._waiting, "clients_waiting": len(self._queues),
+                    "concurrency": self.concurrency, "queue_depth": self.queue_depth, "rejected": self.rejected}
+
+
+limiters = {
+    name: Limiter(name,
+                  _env_int(name, "CONCURRENCY", concurrency),
+                  _env_int(name, "QUEUE", queue_depth),
+                  _env_float(name, "WAIT", wait))
+    for name, (concurrency, queue_depth, wait) in BACKEND_DEFAULTS.items()
+}
+
+
+def limit(backend, wait=None):
+    """`with limit("pylint"): ...` — yuva alınamazsa BackendBusy fırlatır."""
+    return limiters[backend].slot(wait=wait)
+
+
+def client_id_from_request(req):
+    """
+    İstemci adresi. X-Forwarded-For'un soldaki girdileri istemci tarafından uydurulabilir;
+    werkzeug ProxyFix(x_for=N) gibi, güvenilen N proxy'nin eklediği sağdan N. adres kullanılır.
+    Başlık yoksa ya da beklenenden kısaysa (proxy'yi atlayan istek) remote_addr.
+    """
+    if TRUSTED_PROXY_HOPS > 0:
+        forwarded = [addr.strip() for addr in req.headers.get("X-Forwarded-For", "").split(",") if addr.strip()]
+        if len(forwarded) >= TRUSTED_PROXY_HOPS:
+            return forwarded[-TRUSTED_PROXY_HOPS]
+    return req.remote_addr or "anonymous"
@@ -1,8 +1,9 @@
 # analyze.py
 from flask import Flask, request, jsonify
-from pylint import epylint as lint
-from java_runner import analyze_java
-import tempfile
+from java_backends import route_java, is_cacheable as java_cacheable, JavaBackendsUnavailable
+from lint_pool import lint_code
+from result_cache import analysis_cache, make_key
+from admission import BackendBusy, limit, current_client, client_id_from_request
 import os
 
 app = Flask(__name__)
@@ -11,32 +12,33 @@ def analyze_python(code: str):
     """
     Python kodunu Pylint ile analiz eder ve hataları JSON olarak döndürür.
     """
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".py")
-    temp_file.write(code.encode("utf-8"))
-    temp_file.close()
-
-    (pylint_stdout, pylint_stderr) = lint.py_run(temp_file.name, return_std=True)
-    stdout = pylint_stdout.getvalue()
-    stderr = pylint_stderr.getvalue()
-
-    os.unlink(temp_file.name)  # geçici dosyayı sil
-
     errors = []
-    for line in stdout.splitlines():
-        # Pylint formatı: path:line:col: type: message
-        parts = line.split(":", 3)
-        if len(parts) == 4:
-            _, line_no, _, message = parts
-            errors.append({
-                "error_type": "PythonLint",
-                "line": line_no.strip(),
-                "original_message": message.strip(),
-                "explanation": "Python kodu Pylint ile analiz edildi.",
-                "solution": "Hata mesajına göre kodu düzeltin."
-            })
+    with limit("pylint"):
+        items = lint_code(code)
+    for item in items:
+        errors.append({
+            "error_type": "PythonLint",
+            "line": item.get("line", "?"),
+            "original_message": f"[{item.get('message-id')}({item.get('symbol')})] {item.get('message', '')}",
+            "explanation": "Python kodu Pylint ile analiz edildi.",
+            "solution": "Hata mesajına göre kodu düzeltin."
+        })
 
     return {"compiled": True, "compilation_errors": errors}
 
+def _is_cacheable(result):
+    # Zaman aşımı ve beklenmeyen hatalar sunucu yüküne bağlı; önbelleğe alınmaz
+    if "backend" in result:
+        return java_cacheable(result)
+    for err in result.get("compilation_errors", []):
+        if err.get("error_type") != "PythonLint":
+            return False
+    return True
+
+@app.before_request
+def _identify_client():
+    current_client.set(client_id_from_request(request))
+
 @app.route("/analyze", methods=["POST"])
 def analyze_code():
     data = request.json or {}
@@ -46,12 +48,23 @@ def analyze_code():
     if not code.strip():
         return jsonify({"error": "Kod boş olamaz."}), 400
 
+    cache_key = make_key(code, programming_language, endpoint="analyze.py")
+    cached = analysis_cache.get(cache_key)
+    if cached is not None:
+        return jsonify(cached)
+
     try:
         if programming_language == "java":
-            result = analyze_java(code)
+            result = route_java(code)  # yerel javac veya Judge0 (bkz. java_backends.py)
         else:
             result = analyze_python(code)
+        if _is_cacheable(result):
+            analysis_cache.put(cache_key, result)
         return jsonify(result)
+    except BackendBusy as e:
+        return jsonify({"error": str(e), "retry_after": e.retry_after}), 429, {"Retry-After": str(e.retry_after)}
+    except JavaBackendsUnavailable as e:
+        return jsonify({"error": str(e)}), 503
     except Exception as e:
         return jsonify({
             "compiled": False,
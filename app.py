@@ -1,40 +1,120 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, g
 from flask_cors import CORS
 import subprocess
+import signal
 import json
 import os
-import tempfile
 import sys
 import traceback
-import requests
-from judge0_client import run_code_on_judge0
+import time
+import queue
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from lint_pool import lint_code, iter_lint_code, LINT_TIMEOUT
+from incremental import lint_incremental
+from fast_checker import check as fast_check
+from result_cache import analysis_cache, make_key
+from singleflight import coalesce
+from project import (ProjectError, load_json_files, load_zip, detect_language, analyze_python_project,
+                     PROJECT_MAX_BYTES)
+from judge import JudgeError, parse_cases, judge as judge_code
+from budget import Budget, BudgetError, parse_budget
+from sandbox import run_python, run_subprocess, SandboxUnavailable
+from capture import OutputLimitExceeded
+from admission import BackendBusy, limit, limiters, current_client, client_id_from_request
+from metrics import (stage_timer, count_timeout, count_findings, start_request, finish_request,
+                     server_timing_header, log_event, render as render_metrics)
 
 
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "*"}})
 
-def run_code_safely(code, timeout_sec=3):
-    temp_filename = None
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".py", mode="w", encoding="utf-8") as tmp:
-            tmp.write(code)
-            temp_filename = tmp.name
 
-        proc = subprocess.run(
-            [sys.executable, temp_filename],
-            capture_output=True,
-            text=True,
-            timeout=timeout_sec
-        )
+# Java ve Judge0 modülleri (requests, java_backends, java_runner, judge0_jobs) ilk Java /
+# Judge0 isteğinde içe aktarılır; gunicorn master'ı (preload_app) ve yalnızca Python
+# isteği alan worker'lar onları hiç yüklemez.
+def _judge0_errors():
+    """Judge0 iletişim hataları; requests hiç yüklenmediyse böyle bir hata oluşmuş olamaz."""
+    requests = sys.modules.get("requests")
+    return requests.exceptions.RequestException if requests else ()
+
+
+
+@app.before_request
+def _identify_client():
+    # admission: bekleme kuyruklarında istemciler arası adil sıra için
+    current_client.set(client_id_from_request(request))
+    start_request()
+    g.started = time.perf_counter()
+
+
+@app.after_request
+def _record_request(response):
+    elapsed = time.perf_counter() - g.get("started", time.perf_counter())
+    endpoint = request.endpoint or "unknown"
+    finish_request(endpoint, response.status_code, elapsed)
+    timing = server_timing_header()
+    # Akış cevaplarında başlık gövdeden önce gider; aşamalar SSE olaylarında raporlanır
+    response.headers["Server-Timing"] = (timing + ", " if timing else "") + f"total;dur={elapsed * 1000:.1f}"
+    log_event("request", endpoint=endpoint, status=response.status_code, duration_ms=round(elapsed * 1000, 1),
+              client=current_client.get(), server_timing=timing, **g.get("log_fields", {}))
+    return response
+
+
+@app.errorhandler(BackendBusy)
+def _backend_busy(e):
+    response = jsonify({"error": str(e), "backend": e.backend, "retry_after": e.retry_after})
+    response.status_code = 429
+    response.headers["Retry-After"] = str(e.retry_after)
+    return response
+
+
+def _submit_stage(fn, *args):
+    # context değişkenleri (istemci kimliği) stage thread'ine de taşınır
+    return stage_executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+def run_code_safely(code, timeout_sec=3, profile=False, budget=None):
+    """
+    python-run yuvası alınamazsa BackendBusy fırlatır. budget verilirse yuva beklemesi ve
+    çalıştırma kalan süreyle sınırlanır; bütçe bittiği için kesilen çalıştırma None döndürür.
+    """
+    wait = budget.remaining(reserve=("fast",)) if budget is not None else None
+    with limit("python-run", wait=wait), stage_timer("python_run"):
+        limit_sec = budget.limit(timeout_sec, reserve=("fast",)) if budget is not None else timeout_sec
+        if limit_sec <= 0:
+            return None
+        result = _run_code(code, limit_sec, profile)
+    if result.pop("killed_by_timeout", False):
+        if limit_sec < timeout_sec:
+            return None  # kodun değil bütçenin zaman aşımı
+        count_timeout("python_run")
+    return result
+
+
+def _run_code(code, timeout_sec=3, profile=False):
+    """
+    Sonuçta her zaman "usage" (cpu_time, wall_time, peak_rss_kb), profile True ise "profile",
+    çıktı kısaltıldıysa "truncated" (kısaltılan akışlar) bulunur. Sandbox süre dolduğu için
+    süreci öldürdüyse "killed_by_timeout" True'dur (kodun fırlattığı TimeoutError'dan ayrılır).
+    """
+    try:
+        try:
+            # Önceden ısınmış zygote'tan fork edilen çocukta, bellekten çalıştır
+            proc = run_python(code, timeout=timeout_sec, profile=profile)
+        except SandboxUnavailable:
+            # Kod diske yazılmadan stdin'den verilir; zygote'taki rlimit'ler burada da uygulanır
+            proc = run_subprocess([sys.executable, "-"], timeout=timeout_sec, input=code)
 
         stdout = proc.stdout.strip()
         stderr = proc.stderr.strip()
         returncode = proc.returncode
-
-        try:
-            os.remove(temp_filename)
-        except Exception:
-            pass
+        extra = {"usage": proc.usage}
+        if profile:
+            extra["profile"] = proc.profile
+        if proc.truncated:
+            # stderr'in sonu korunur; traceback satırı ve hata türü yine ayrıştırılabilir
+            extra["truncated"] = list(proc.truncated)
 
         if returncode != 0:
             line_no = "?"
@@ -51,26 +131,34 @@ def run_code_safely(code, timeout_sec=3):
             last_line = stderr.splitlines()[-1] if stderr else ""
             if ": " in last_line:
                 err_type, err_msg = last_line.split(": ", 1)
+            elif last_line.isidentifier():
+                # mesajsız istisnalar (ör. bellek sınırında "MemoryError")
+                err_type, err_msg = last_line, last_line
+            elif returncode == -signal.SIGXCPU:
+                err_type, err_msg = "TimeoutError", "CPU time limit exceeded."
+            elif returncode < 0:
+                # bellek sınırında yorumlayıcı traceback bile yazamadan ölebilir
+                err_type, err_msg = "MemoryError", f"Process killed by signal {signal.Signals(-returncode).name}."
             else:
                 err_type, err_msg = "RuntimeError", stderr
 
-            return {"error": err_msg, "error_type": err_type.strip(), "line": line_no}
+            return {"error": err_msg, "error_type": err_type.strip(), "line": line_no, **extra}
         else:
-            return {"output": stdout}
-
-    except subprocess.TimeoutExpired:
-        try:
-            if temp_filename:
-                os.remove(temp_filename)
-        except Exception:
-            pass
-        return {"error": "Execution timed out.", "error_type": "TimeoutError", "line": "?"}
+            return {"output": stdout, **extra}
+
+    except subprocess.TimeoutExpired as e:
+        extra = {"usage": getattr(e, "usage", None)}
+        if profile:
+            extra["profile"] = getattr(e, "profile", None)
+        return {"error": "Execution timed out.", "error_type": "TimeoutError", "line": "?",
+                "killed_by_timeout": True, **extra}
+    except OutputLimitExceeded as e:
+        extra = {"usage": e.usage, "truncated": list(e.truncated)}
+        if profile:
+            extra["profile"] = e.profile
+        return {"error": f"Output limit of {e.limit // (1024 * 1024)} MB exceeded.",
+                "error_type": "OutputLimitExceeded", "line": "?", **extra}
     except Exception as e:
-        try:
-            if temp_filename:
-                os.remove(temp_filename)
-        except Exception:
-            pass
         tb = traceback.extract_tb(e.__traceback__)
         line_no = tb[-1].lineno if tb else "?"
         return {"error": str(e), "error_type": type(e).__name__, "line": line_no}
@@ -94,6 +182,11 @@ ERROR_TRANSLATIONS = {
         "OverflowError": {"explanation":"Sayı değeri çok büyük.","solution":"Sayı değerlerini makul aralıkta kullanın."},
         "RuntimeError": {"explanation":"Çalışma zamanı hatası.","solution":"Kodun mantığını gözden geçirin, beklenmeyen durumları kontrol edin."},
         "RecursionError": {"explanation":"Fonksiyon çok fazla kez kendini çağırdı (sonsuz döngü).","solution":"Fonksiyonunuzun çıkış koşulunu doğru tanımladığınızdan emin olun."},
+        "MemoryError": {"explanation":"Program izin verilen bellek sınırını aştı (ör. çok büyük bir liste veya sonsuza kadar büyüyen bir yapı).","solution":"Veri yapılarınızın boyutunu kontrol edin; gereksiz kopyalardan kaçının ve büyüyen döngülerin bir bitiş koşulu olduğundan emin olun."},
+        "OutputLimitExceeded": {"explanation":"Program izin verilen çıktı sınırından fazla çıktı üretti ve durduruldu (genellikle sonsuz bir döngü içinde print).","solution":"Döngülerin bir bitiş koşulu olduğundan emin olun ve yalnızca gereken çıktıyı yazdırın."},
+        "UnusedVariable": {"explanation":"Değişkene değer atanmış ama hiç kullanılmamış.","solution":"Değişkeni kullanın ya da gereksizse silin."},
+        "UnreachableCode": {"explanation":"Bu kod hiçbir zaman çalışmaz (return, raise, break veya continue sonrasında).","solution":"Kodu return/break satırından önceye taşıyın ya da silin."},
+        "ShadowedBuiltin": {"explanation":"Python'un yerleşik bir isminin (ör. list, sum, input) üzerine yazılmış.","solution":"Değişkene farklı bir isim verin; aksi halde yerleşik fonksiyon kullanılamaz hale gelir."},
         "NoError": "Kodda hata bulunamadı."
     },
     "en": {
@@ -111,6 +204,11 @@ ERROR_TRANSLATIONS = {
         "OverflowError": {"explanation":"Number value too large.","solution":"Use numbers within a reasonable range."},
         "RuntimeError": {"explanation":"Runtime error occurred.","solution":"Check your code logic and handle unexpected cases."},
         "RecursionError": {"explanation":"Function called itself too many times (infinite loop).","solution":"Make sure your recursive function has a proper exit condition."},
+        "MemoryError": {"explanation":"The program exceeded the allowed memory limit (e.g. a huge list or a structure that grows forever).","solution":"Check the size of your data structures; avoid unnecessary copies and make sure growing loops have an exit condition."},
+        "OutputLimitExceeded": {"explanation":"The program printed more than the allowed output limit and was stopped (usually a print inside an infinite loop).","solution":"Make sure your loops have an exit condition and print only the output you need."},
+        "UnusedVariable": {"explanation":"A value is assigned to a variable that is never used.","solution":"Use the variable or remove it if it is not needed."},
+        "UnreachableCode": {"explanation":"This code can never run (it comes after return, raise, break or continue).","solution":"Move the code before the return/break line or remove it."},
+        "ShadowedBuiltin": {"explanation":"A built-in Python name (e.g. list, sum, input) has been overwritten.","solution":"Choose a different variable name; otherwise the built-in function becomes unusable."},
         "NoError": "No errors found in code."
     },
     "de": {
@@ -128,6 +226,11 @@ ERROR_TRANSLATIONS = {
     "OverflowError": {"explanation":"Zahlenwert zu groß.","solution":"Verwenden Sie Zahlen innerhalb eines angemessenen Bereichs."},
     "RuntimeError": {"explanation":"Laufzeitfehler aufgetreten.","solution":"Überprüfen Sie die Logik Ihres Codes und behandeln Sie unerwartete Fälle."},
     "RecursionError": {"explanation":"Funktion hat sich zu oft selbst aufgerufen (Endlosschleife).","solution":"Stellen Sie sicher, dass Ihre rekursive Funktion eine richtige Abbruchbedingung hat."},
+    "MemoryError": {"explanation":"Das Programm hat das erlaubte Speicherlimit überschritten (z. B. eine riesige Liste oder eine endlos wachsende Struktur).","solution":"Prüfen Sie die Größe Ihrer Datenstrukturen; vermeiden Sie unnötige Kopien und stellen Sie sicher, dass wachsende Schleifen eine Abbruchbedingung haben."},
+    "OutputLimitExceeded": {"explanation":"Das Programm hat mehr als die erlaubte Ausgabemenge erzeugt und wurde gestoppt (meist ein print in einer Endlosschleife).","solution":"Stellen Sie sicher, dass Ihre Schleifen eine Abbruchbedingung haben, und geben Sie nur die benötigte Ausgabe aus."},
+    "UnusedVariable": {"explanation":"Einer Variablen wird ein Wert zugewiesen, der nie verwendet wird.","solution":"Verwenden Sie die Variable oder entfernen Sie sie, wenn sie nicht benötigt wird."},
+    "UnreachableCode": {"explanation":"Dieser Code wird nie ausgeführt (er steht nach return, raise, break oder continue).","solution":"Verschieben Sie den Code vor die return/break-Zeile oder entfernen Sie ihn."},
+    "ShadowedBuiltin": {"explanation":"Ein eingebauter Python-Name (z. B. list, sum, input) wurde überschrieben.","solution":"Wählen Sie einen anderen Variablennamen; sonst ist die eingebaute Funktion nicht mehr nutzbar."},
     "NoError": "Keine Fehler im Code gefunden."
 },
 "ru": {
@@ -145,6 +248,11 @@ ERROR_TRANSLATIONS = {
     "OverflowError": {"explanation":"Значение числа слишком велико.","solution":"Используйте числа в разумных пределах."},
     "RuntimeError": {"explanation":"Произошла ошибка выполнения.","solution":"Проверьте логику кода и обработайте неожиданные ситуации."},
     "RecursionError": {"explanation":"Функция вызвала сама себя слишком много раз (бесконечный цикл).","solution":"Убедитесь, что рекурсивная функция имеет правильное условие выхода."},
+    "MemoryError": {"explanation":"Программа превысила допустимый лимит памяти (например, огромный список или бесконечно растущая структура).","solution":"Проверьте размер структур данных; избегайте лишних копий и убедитесь, что у растущих циклов есть условие выхода."},
+    "OutputLimitExceeded": {"explanation":"Программа вывела больше допустимого объёма и была остановлена (обычно print внутри бесконечного цикла).","solution":"Убедитесь, что у циклов есть условие выхода, и выводите только необходимые данные."},
+    "UnusedVariable": {"explanation":"Переменной присвоено значение, которое нигде не используется.","solution":"Используйте переменную или удалите её, если она не нужна."},
+    "UnreachableCode": {"explanation":"Этот код никогда не выполнится (он стоит после return, raise, break или continue).","solution":"Перенесите код до строки с return/break или удалите его."},
+    "ShadowedBuiltin": {"explanation":"Перезаписано встроенное имя Python (например, list, sum, input).","solution":"Выберите другое имя переменной, иначе встроенная функция станет недоступна."},
     "NoError": "Ошибок в коде не найдено."
 },
 "ar": {
@@ -162,6 +270,11 @@ ERROR_TRANSLATIONS = {
     "OverflowError": {"explanation":"قيمة الرقم كبيرة جدًا.","solution":"استخدم الأرقام ضمن نطاق معقول."},
     "RuntimeError": {"explanation":"حدث خطأ أثناء التشغيل.","solution":"تحقق من منطق الكود وتعامل مع الحالات غير المتوقعة."},
     "RecursionError": {"explanation":"استدعاء الدالة لنفسها مرات كثيرة (حلقة لا نهائية).","solution":"تأكد من أن الدالة المتكررة لها شرط خروج صحيح."},
+    "MemoryError": {"explanation":"تجاوز البرنامج حد الذاكرة المسموح به (مثل قائمة ضخمة أو بنية تنمو بلا نهاية).","solution":"تحقق من حجم هياكل البيانات؛ تجنب النسخ غير الضرورية وتأكد من أن الحلقات المتنامية لها شرط خروج."},
+    "OutputLimitExceeded": {"explanation":"أنتج البرنامج مخرجات أكثر من الحد المسموح به وتم إيقافه (عادةً print داخل حلقة لا نهائية).","solution":"تأكد من أن الحلقات لها شرط خروج واطبع فقط المخرجات التي تحتاجها."},
+    "UnusedVariable": {"explanation":"تم إسناد قيمة إلى متغير لا يُستخدم أبدًا.","solution":"استخدم المتغير أو احذفه إذا لم يكن ضروريًا."},
+    "UnreachableCode": {"explanation":"هذا الكود لن يُنفَّذ أبدًا (يأتي بعد return أو raise أو break أو continue).","solution":"انقل الكود قبل سطر return/break أو احذفه."},
+    "ShadowedBuiltin": {"explanation":"تمت الكتابة فوق اسم مدمج في بايثون (مثل list أو sum أو input).","solution":"اختر اسمًا مختلفًا للمتغير؛ وإلا تصبح الدالة المدمجة غير قابلة للاستخدام."},
     "NoError": "لم يتم العثور على أي أخطاء في الكود."
 },
 "zh": {
@@ -179,6 +292,11 @@ ERROR_TRANSLATIONS = {
     "OverflowError": {"explanation":"数字值过大。","solution":"使用合理范围内的数字。"},
     "RuntimeError": {"explanation":"运行时错误。","solution":"检查代码逻辑并处理意外情况。"},
     "RecursionError": {"explanation":"函数调用自身次数过多（无限循环）。","solution":"确保递归函数有正确的退出条件。"},
+    "MemoryError": {"explanation":"程序超出了允许的内存限制（例如巨大的列表或无限增长的结构）。","solution":"检查数据结构的大小；避免不必要的复制，并确保不断增长的循环有退出条件。"},
+    "OutputLimitExceeded": {"explanation":"程序的输出超过了允许的上限，已被终止（通常是无限循环中的 print）。","solution":"确保循环有退出条件，并且只打印需要的输出。"},
+    "UnusedVariable": {"explanation":"变量被赋值但从未使用。","solution":"使用该变量，或在不需要时将其删除。"},
+    "UnreachableCode": {"explanation":"这段代码永远不会执行（位于 return、raise、break 或 continue 之后）。","solution":"将代码移到 return/break 语句之前，或将其删除。"},
+    "ShadowedBuiltin": {"explanation":"覆盖了 Python 的内置名称（例如 list、sum、input）。","solution":"请换一个变量名，否则该内置函数将无法使用。"},
     "NoError": "代码未发现错误。"
 },
 "es": {
@@ -196,130 +314,687 @@ ERROR_TRANSLATIONS = {
     "OverflowError": {"explanation":"Valor numérico demasiado grande.","solution":"Use números dentro de un rango razonable."},
     "RuntimeError": {"explanation":"Ocurrió un error en tiempo de ejecución.","solution":"Revise la lógica de su código y maneje casos inesperados."},
     "RecursionError": {"explanation":"La función se llamó a sí misma demasiadas veces (bucle infinito).","solution":"Asegúrese de que su función recursiva tenga una condición de salida adecuada."},
+    "MemoryError": {"explanation":"El programa superó el límite de memoria permitido (p. ej. una lista enorme o una estructura que crece sin fin).","solution":"Compruebe el tamaño de sus estructuras de datos; evite copias innecesarias y asegúrese de que los bucles que crecen tengan una condición de salida."},
+    "OutputLimitExceeded": {"explanation":"El programa imprimió más del límite de salida permitido y fue detenido (normalmente un print dentro de un bucle infinito).","solution":"Asegúrese de que sus bucles tengan una condición de salida e imprima solo la salida necesaria."},
+    "UnusedVariable": {"explanation":"Se asigna un valor a una variable que nunca se usa.","solution":"Use la variable o elimínela si no es necesaria."},
+    "UnreachableCode": {"explanation":"Este código nunca se ejecutará (está después de return, raise, break o continue).","solution":"Mueva el código antes de la línea return/break o elimínelo."},
+    "ShadowedBuiltin": {"explanation":"Se ha sobrescrito un nombre integrado de Python (p. ej. list, sum, input).","solution":"Elija otro nombre de variable; de lo contrario la función integrada quedará inutilizable."},
     "NoError": "No se encontraron errores en el código."
 }
 
 }
 
+# Analiz aşamalarını (çalıştırma / pylint) paralel yürütmek için
+stage_executor = ThreadPoolExecutor(max_workers=int(os.environ.get("STAGE_THREADS", 8)),
+                                    thread_name_prefix="stage")
+
+BATCH_MAX_ITEMS = int(os.environ.get("BATCH_MAX_ITEMS", 100))
+BATCH_MAX_CONCURRENCY = int(os.environ.get("BATCH_MAX_CONCURRENCY", 4))
+BATCH_MAX_DEADLINE = float(os.environ.get("BATCH_MAX_DEADLINE", 60))  # saniye
+
+def translate_findings(findings, lang):
+    """Dilden bağımsız bulguları istenen arayüz diline çevirir."""
+    translations = ERROR_TRANSLATIONS.get(lang, ERROR_TRANSLATIONS["en"])
+    translated = []
+    for item in findings:
+        error_info = translations.get(item["error_type"], {})
+        if item.get("stage") == "pylint":
+            explanation = error_info.get("explanation", item["original_message"])
+            solution = error_info.get("solution", "")
+        else:
+            explanation = error_info.get("explanation", "No explanation available.")
+            solution = error_info.get("solution", "No solution available.")
+
+        translated.append({
+            "error_type": item["error_type"],
+            "line": item["line"],
+            "original_message": item["original_message"],
+            "explanation": explanation,
+            "solution": solution
+        })
+    return translated
+
+
+def _syntax_finding(e):
+    return {
+        "error_type": type(e).__name__,
+        "line": getattr(e, "lineno", "?"),
+        "original_message": str(e),
+        "stage": "syntax"
+    }
+
+
+def _runtime_finding(runtime_result):
+    return {
+        "error_type": runtime_result.get("error_type", "RuntimeError"),
+        "line": runtime_result.get("line", "?"),
+        "original_message": runtime_result["error"],
+        "stage": "runtime"
+    }
+
+
+def _lint_finding(item):
+    return {
+        "error_type": item.get("type", "error"),
+        "line": item.get("line", "?"),
+        "original_message": item.get("message", ""),
+        "stage": "pylint"
+    }
+
+
+def _fast_findings(code, runtime_findings=()):
+    """Hızlı AST denetleyicisinin bulguları; çalışma zamanında zaten yakalanan hata tekrar edilmez."""
+    seen = {(f["error_type"], f["line"]) for f in runtime_findings}
+    with stage_timer("fast"):
+        items = fast_check(code)
+    return [dict(item, stage="fast") for item in items
+            if (item["error_type"], item["line"]) not in seen]
+
+
+def _lint_for_session(code, session_id=None, budget=None):
+    """
+    session_id verilmişse yalnızca değişen tanımlar yeniden lint edilir (bkz. incremental.py).
+    budget verilirse pylint kalan sürenin sonunda kesilir (TimeoutError).
+    """
+    wait = budget.remaining() if budget is not None else None
+    with limit("pylint", wait=wait), stage_timer("pylint"):
+        lint = lint_code
+        if budget is not None and budget.deadline is not None:
+            timeout = budget.limit(LINT_TIMEOUT)
+            if timeout <= 0:
+                raise TimeoutError("Süre bütçesi doldu.")
+            lint = lambda source: lint_code(source, timeout=timeout)
+        if session_id:
+            return lint_incremental(session_id, code, lint)
+        return lint(code)
+
+
+def _session_id(data):
+    session_id = data.get("session_id")
+    if isinstance(session_id, (str, int)) and 0 < len(str(session_id)) <= 128:
+        return str(session_id)
+    return None
+
+
+def _budget_stage(budget, stage, fn, *args):
+    """Bütçeli istekte meşgul arka uç ya da süre aşımı aşamayı atlatır (None); bütçesizde hata yükselir."""
+    try:
+        return fn(*args)
+    except (BackendBusy, TimeoutError, FuturesTimeoutError):
+        if budget.deadline is None:
+            raise
+        budget.skip(stage)
+        return None
+
+
+def analyze_python(code, include_all=False, session_id=None, deep=False, profile=False, budget=None):
+    """
+    Python kodunu derler, hızlı AST denetleyicisinden geçirir ve çalıştırır.
+    deep True ise pylint de çalıştırılır (çalıştırmayla paralel).
+    include_all False ise eski öncelik korunur (çalışma zamanı hatası varsa yalnızca o döner);
+    True ise çalışma zamanı hatası ve statik bulgular birlikte döner.
+    session_id verilirse pylint artımlı çalışır; kodun çalıştırılması her zaman tüm dosya üzerindedir.
+    budget (budget.Budget) verilirse aşamalar seviyeye ve süre bütçesine göre planlanır; atlanan /
+    kesilen aşamalar budget.skipped'e yazılır (deep yerine budget.level kullanılır).
+    Çevrilmemiş bulguları {"findings": [...], "cacheable": bool, "usage": {...}} olarak döndürür;
+    profile True ise "profile" (en sıcak fonksiyon ve satırlar) da eklenir.
+    """
+    budget = budget or Budget("deep" if deep else "standard")
+    # ----------------- Sözdizimi kontrolü -----------------
+    try:
+        with stage_timer("compile"):
+            compile(code, "<string>", "exec")
+    except Exception as e:
+        return {"findings": [_syntax_finding(e)], "cacheable": True}
+    budget.plan()
+
+    # ----------------- Pylint (deep ise arka planda) + Runtime kontrolü -----------------
+    lint_future = _submit_stage(_lint_for_session, code, session_id, budget) if budget.wants("pylint") else None
+    runtime_result = None
+    if budget.wants("python_run"):
+        runtime_result = _budget_stage(budget, "python_run", run_code_safely, code, 3, profile, budget)
+        if runtime_result is None:
+            budget.skip("python_run")
+    runtime_result = runtime_result or {}
+    run_info = {key: runtime_result[key] for key in ("usage", "profile", "truncated") if key in runtime_result}
+
+    findings = []
+    cacheable = True
+    if "error" in runtime_result:
+        finding = _runtime_finding(runtime_result)
+        findings.append(finding)
+        cacheable = finding["error_type"] != "TimeoutError"
+        if not include_all:
+            if lint_future is not None:
+                lint_future.cancel()
+            return {"findings": findings, "cacheable": cacheable and not budget.partial, **run_info}
+
+    # ----------------- Hızlı statik kontrol -----------------
+    if budget.wants("fast"):
+        findings.extend(_fast_findings(code, findings))
+
+    # ----------------- Pylint ile çoklu hata kontrolü -----------------
+    if lint_future is not None:
+        # pylint kendi süresini kalan bütçeyle sınırlar; sıraya takılmışsa burada da beklenmez
+        items = _budget_stage(budget, "pylint", lint_future.result, budget.remaining())
+        findings.extend(_lint_finding(item) for item in items or ())
+    return {"findings": findings, "cacheable": cacheable and not budget.partial, **run_info}
+
+
+def _java_cache_key(code):
+    # Hangi arka uç cevaplarsa cevaplasın şema aynı; sonuç arka uçtan bağımsız önbelleklenir
+    return make_key(code, "java", schema="normalized")
+
+
+def run_analysis(code, prog_lang, lang, include_all=False, session_id=None, deep=False, profile=False,
+                 budget=None):
+    """
+    Tek bir gönderimi analiz eder; (cevap gövdesi, HTTP durum kodu, usage) döndürür. usage kodun
+    çalıştırılmasının kaynak kullanımıdır; Java'da, önbellekten dönen ya da çalıştırılmayan kodda None.
+    Python'da profile True ise önbellek atlanır ve gövde {"errors", "result"?, "usage", "profile"} olur.
+    budget (istekte level / deadline_ms) verilirse Python gövdesi {"errors", "result"?, "level",
+    "partial", "skipped_stages"} olur; Java analizi bütçeden etkilenmez. Profil dışındaki gövdeler
+    önbellekten de dönebildiği için usage içermez (aynı girdi her zaman aynı biçimde döner);
+    usage yalnızca üçüncü değerde (/analyze'da X-Run-Usage başlığı).
+    """
+    # ----------------- Java kodu kontrolü (yerel javac veya Judge0, bkz. java_backends.py) -----------------
+    if prog_lang == "java":
+        cache_key = _java_cache_key(code)
+        cached = analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached, 200, None
+        from java_backends import route_java, is_cacheable as java_cacheable, JavaBackendsUnavailable
+        try:
+            # aynı kodla süren bir analiz varsa (bu ya da başka bir worker'da) onun sonucu beklenir
+            result = coalesce(cache_key, lambda: route_java(code))
+        except BackendBusy:
+            raise
+        except JavaBackendsUnavailable as e:
+            return {"error": str(e)}, 503, None
+        except Exception as e:
+            return {"error": "Java analizinde iç hata: " + str(e)}, 500, None
+        if java_cacheable(result):
+            analysis_cache.put(cache_key, result)
+        return result, 200, None
+
+    # ----------------- Python kodu kontrolü -----------------
+    if budget is not None:
+        deep = budget.level == "deep"
+    # standard / deep anahtarları eski deep bayrağıyla aynı kalır
+    level_key = {"level": "quick"} if budget is not None and budget.level == "quick" else {}
+    cache_key = make_key(code, "python", include_all=include_all, deep=deep, **level_key)
+    # profil her seferinde yeni bir çalıştırma ister
+    result = None if profile else analysis_cache.get(cache_key)
+    if result is None:
+        def analyze():
+            return analyze_python(code, include_all=include_all, session_id=session_id, deep=deep,
+                                  profile=profile, budget=budget)
+
+        try:
+            # profil istenen çalıştırmaya, süre bütçesi isteğe özgü; ikisi de birleştirilmez
+            exclusive = profile or (budget is not None and budget.deadline is not None)
+            result = analyze() if exclusive else coalesce(cache_key, analyze)
+        except BackendBusy:
+            raise
+        except Exception as e:
+            return {"error": str(e)}, 200, None
+        if result["cacheable"]:
+            # kaynak kullanımı çalıştırmaya özgü; önbelleğe yalnızca bulgular girer
+            analysis_cache.put(cache_key, {"findings": result["findings"], "cacheable": True})
+
+    count_findings(result["findings"])
+    # Çeviri önbellekten sonra: aynı analiz her arayüz diline hizmet eder
+    errors = translate_findings(result["findings"], lang)
+    no_error_msg = ERROR_TRANSLATIONS.get(lang, ERROR_TRANSLATIONS["en"]).get("NoError", "No errors found in code.")
+    usage = result.get("usage")
+    if profile:
+        body = {"errors": errors, "usage": usage, "profile": result.get("profile")}
+        if result.get("truncated"):
+            body["truncated"] = result["truncated"]
+        if budget is not None:
+            body.update(level=budget.level, partial=budget.partial, skipped_stages=budget.skipped)
+        if not errors:
+            body["result"] = no_error_msg
+        return body, 200, usage
+    if budget is not None:
+        body = {"errors": errors, "level": budget.level, "partial": budget.partial,
+                "skipped_stages": budget.skipped}
+        if not errors:
+            body["result"] = no_error_msg
+        return body, 200, usage
+    if errors:
+        return errors, 200, usage
+    return {"result": no_error_msg}, 200, usage
+
+
 @app.route("/", methods=["GET"])
 def home():
     return jsonify({"message": "Kod Analiz API çalışıyor!"})
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    gauges = [("kod_analiz_cache_entries", "Bellek önbelleğindeki kayıtlar (bu worker)",
+               analysis_cache.stats()["entries"])]
+    for field, help_text in (("active", "Arka uçta çalışan istekler (bu worker)"),
+                             ("waiting", "Arka uç kuyruğunda bekleyen istekler (bu worker)")):
+        gauges.append((f"kod_analiz_backend_{field}", help_text,
+                       {("backend", name): limiter.stats()[field] for name, limiter in limiters.items()}))
+    # Java arka uçları bu worker'da hiç kullanılmadıysa (modül yüklenmemiş) gösterge yok
+    java_backends = sys.modules.get("java_backends")
+    java_stats = java_backends.router.stats() if java_backends else {}
+    for field, help_text in (("latency", "Java arka ucunun EWMA gecikmesi, saniye (bu worker)"),
+                             ("error_rate", "Java arka ucunun EWMA hata oranı (bu worker)"),
+                             ("breaker_open", "Java arka ucunun devre kesicisi açık mı (bu worker)")):
+        gauges.append((f"kod_analiz_java_backend_{field}", help_text,
+                       {("backend", name): stats[field] for name, stats in java_stats.items()}))
+    return Response(render_metrics(gauges), mimetype="text/plain; version=0.0.4")
+
+
 @app.route("/analyze", methods=["POST"])
 def analyze_code():
     data = request.get_json()
 
-    print("GELEN JSON:", data)  # Debug: gelen veriyi terminalde gösterir
-
     if not data or "code" not in data:
         return jsonify({"error": "Kod gönderilmedi"}), 400
 
     code = data["code"]
     lang = data.get("lang", "en").lower()
-
-    # ----------------- Java kodu kontrolü (Judge0 ile güvenli çalıştırma) -----------------
     prog_lang = data.get("programming_language", "Python").lower()  # Frontend’den gelen gerçek programlama dili
+    # Örneklenmiş istek logu için (kodun kendisi loglanmaz)
+    try:
+        # level (quick/standard/deep) ve deadline_ms: editör 50 ms'lik hızlı kontrol isteyebilir
+        budget = parse_budget(data)
+    except BudgetError as e:
+        return jsonify({"error": str(e)}), 400
+    g.log_fields = {"programming_language": prog_lang, "lang": lang, "code_bytes": len(code.encode("utf-8")),
+                    "deep": bool(data.get("deep")), "session": bool(_session_id(data)),
+                    "profile": bool(data.get("profile")), "level": budget.level if budget else None,
+                    "deadline_ms": data.get("deadline_ms")}
+
+    body, status, usage = run_analysis(code, prog_lang, lang, include_all=bool(data.get("include_all")),
+                                       session_id=_session_id(data), deep=bool(data.get("deep")),
+                                       profile=bool(data.get("profile")), budget=budget)
+    if budget is not None and budget.partial:
+        g.log_fields["skipped_stages"] = budget.skipped
+    response = jsonify(body)
+    if usage is not None:
+        # gövdenin biçimi önbellek durumuna bağlı olmasın; kaynak kullanımı yalnızca başlıkta döner
+        response.headers["X-Run-Usage"] = json.dumps(usage, separators=(",", ":"))
+    return response, status
+
+
+# ----------------- Aşama aşama analiz (Server-Sent Events) -----------------
+def _sse(stage, started, stage_started, **payload):
+    now = time.monotonic()
+    payload = {
+        "stage": stage,
+        "elapsed_ms": round((now - started) * 1000, 1),
+        "duration_ms": round((now - stage_started) * 1000, 1),
+        **payload
+    }
+    return f"event: {stage}\ndata: {json.dumps(payload)}\n\n"
+
+
+def _stream_python(code, lang, session_id=None, deep=False, profile=False):
+    """
+    Derleme, hızlı kontrol, çalıştırma ve (deep ise) pylint sonuçlarını tamamlandıkça SSE olayı olarak üretir.
+    Çalıştırma ve pylint paralel yürür; olaylar hangisi önce biterse o sırayla gelir.
+    runtime olayında kaynak kullanımı (usage), profile True ise profil de bulunur.
+    """
+    started = time.monotonic()
+    cache_key = make_key(code, "python", include_all=True, deep=deep)
+    cached = None if profile else analysis_cache.get(cache_key)
+    if cached is not None:
+        errors = translate_findings(cached["findings"], lang)
+        yield _sse("cache", started, started, errors=errors)
+        yield _sse("done", started, started, error_count=len(errors))
+        return
+
+    # ----------------- Sözdizimi kontrolü -----------------
+    stage_started = time.monotonic()
+    try:
+        with stage_timer("compile"):
+            compile(code, "<string>", "exec")
+    except Exception as e:
+        findings = [_syntax_finding(e)]
+        analysis_cache.put(cache_key, {"findings": findings, "cacheable": True})
+        yield _sse("compile", started, stage_started, errors=translate_findings(findings, lang))
+        yield _sse("done", started, started, error_count=1)
+        return
+    yield _sse("compile", started, stage_started, errors=[])
+
+    # ----------------- Hızlı statik kontrol -----------------
+    stage_started = time.monotonic()
+    fast_findings = _fast_findings(code)
+    yield _sse("fast", started, stage_started, errors=translate_findings(fast_findings, lang))
+    fast_seen = {(f["error_type"], f["line"]) for f in fast_findings}
+
+    # ----------------- Runtime ve pylint paralel -----------------
+    events = queue.Queue()
+
+    def run_stage():
+        try:
+            events.put(("runtime", run_code_safely(code, timeout_sec=3, profile=profile)))
+        except BackendBusy as e:
+            events.put(("runtime_error", e))
 
-    if prog_lang == "java":
+    def lint_stage():
         try:
-            # Judge0'a gönder (senkron bekleyeceğiz)
-            judge0_resp = run_code_on_judge0(code, language_substr="java", wait=True, cpu_time_limit=2.0)
-
-            # Eğer hata iletisi geldiyse doğrudan döndür
-            if isinstance(judge0_resp, dict) and judge0_resp.get("error"):
-                return jsonify({"error": judge0_resp["error"]}), 500
-
-            # Judge0'dan gelen ham cevabı frontend'e gönderiyoruz.
-            # Örnek önemli alanlar: compile_output, stdout, stderr, status
-            return jsonify({"java_result": judge0_resp})
-        except requests.exceptions.RequestException as re:
-            return jsonify({"error": "Judge0 ile iletişim hatası: " + str(re)}), 502
+            with limit("pylint"), stage_timer("pylint"):
+                items = lint_incremental(session_id, code, lint_code) if session_id else iter_lint_code(code)
+                for item in items:
+                    events.put(("pylint", item))
+            events.put(("pylint_done", None))
         except Exception as e:
-            return jsonify({"error": "Java analizinde iç hata: " + str(e)}), 500
+            events.put(("pylint_error", e))
+
+    stage_started = time.monotonic()
+    _submit_stage(run_stage)
+    pending = {"runtime"}
+    if deep:
+        _submit_stage(lint_stage)
+        pending.add("pylint")
+
+    runtime_findings, lint_findings = [], []
+    cacheable = True
+    while pending:
+        kind, value = events.get()
+        if kind == "runtime":
+            pending.discard("runtime")
+            if "error" in value:
+                finding = _runtime_finding(value)
+                runtime_findings.append(finding)
+                cacheable = finding["error_type"] != "TimeoutError"
+            # hızlı kontrolün zaten gösterdiği hata ikinci kez gösterilmez
+            shown = [f for f in runtime_findings if (f["error_type"], f["line"]) not in fast_seen]
+            run_info = {key: value[key] for key in ("usage", "profile", "truncated") if key in value}
+            yield _sse("runtime", started, stage_started, errors=translate_findings(shown, lang), **run_info)
+        elif kind == "pylint":
+            finding = _lint_finding(value)
+            lint_findings.append(finding)
+            yield _sse("pylint", started, stage_started, errors=translate_findings([finding], lang))
+        elif kind == "pylint_done":
+            pending.discard("pylint")
+        else:
+            pending.discard("runtime" if kind == "runtime_error" else "pylint")
+            cacheable = False
+            payload = {"error": str(value)}
+            if isinstance(value, BackendBusy):
+                payload.update(status=429, backend=value.backend, retry_after=value.retry_after)
+            yield _sse("error", started, stage_started, **payload)
+
+    # analyze_python(include_all=True) ile aynı sıra ve tekilleştirme (önbellek anahtarı ortak)
+    runtime_seen = {(f["error_type"], f["line"]) for f in runtime_findings}
+    findings = (runtime_findings
+                + [f for f in fast_findings if (f["error_type"], f["line"]) not in runtime_seen]
+                + lint_findings)
+    if cacheable:
+        analysis_cache.put(cache_key, {"findings": findings, "cacheable": True})
+    count_findings(findings)
+
+    done = {"error_count": len(findings)}
+    if not findings:
+        done["result"] = ERROR_TRANSLATIONS.get(lang, ERROR_TRANSLATIONS["en"]).get("NoError", "No errors found in code.")
+    yield _sse("done", started, started, **done)
+
+
+@app.route("/analyze/stream", methods=["POST"])
+def analyze_stream():
+    """
+    /analyze ile aynı gövdeyi alır; sonuçları aşama aşama text/event-stream olarak döndürür.
+    Olaylar: compile, fast, runtime, pylint (yalnızca "deep": true ise; bulgu başına bir olay), done
+    (Java için tek bir "java" olayı). Her olayda stage, elapsed_ms ve duration_ms bulunur.
+    """
+    data = request.get_json()
+    if not data or "code" not in data:
+        return jsonify({"error": "Kod gönderilmedi"}), 400
 
-    # ----------------- Python kodu kontrolü -----------------
-    syntax_errors = []
-    try:
-        compile(code, "<string>", "exec")
-    except Exception as e:
-        error_type = type(e).__name__
-        line_no = getattr(e, "lineno", "?")
-        msg = str(e)
-
-        error_info = ERROR_TRANSLATIONS.get(lang, ERROR_TRANSLATIONS["en"]).get(error_type, {})
-        explanation = error_info.get("explanation", "No explanation available.")
-        solution = error_info.get("solution", "No solution available.")
-
-        syntax_errors.append({
-            "error_type": error_type,
-            "line": line_no,
-            "original_message": msg,
-            "explanation": explanation,
-            "solution": solution
-        })
+    code = data["code"]
+    lang = data.get("lang", "en").lower()
+    prog_lang = data.get("programming_language", "Python").lower()
 
-    if syntax_errors:
-        return jsonify(syntax_errors)
+    if prog_lang == "java":
+        def generate():
+            started = time.monotonic()
+            body, status, _ = run_analysis(code, prog_lang, lang)
+            yield _sse("java", started, started, status=status, result=body)
+            yield _sse("done", started, started)
+    else:
+        generate = lambda: _stream_python(code, lang, session_id=_session_id(data), deep=bool(data.get("deep")),
+                                          profile=bool(data.get("profile")))
 
-    # ----------------- Runtime (çalışma zamanı) kontrolü -----------------
-    runtime_result = run_code_safely(code, timeout_sec=3)
-    if "error" in runtime_result:
-        err_msg = runtime_result["error"]
-        error_type = runtime_result.get("error_type", "RuntimeError")
+    return Response(generate(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
-        error_info = ERROR_TRANSLATIONS.get(lang, ERROR_TRANSLATIONS["en"]).get(error_type, {})
-        explanation = error_info.get("explanation", "No explanation available.")
-        solution = error_info.get("solution", "No solution available.")
 
-        return jsonify([{
-            "error_type": error_type,
-            "line": runtime_result.get("line", "?"),
-            "original_message": err_msg,
-            "explanation": explanation,
-            "solution": solution
-        }])
+# ----------------- Toplu analiz (NDJSON akışı) -----------------
+def _clamp(value, default, low, high):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return default
+    return max(low, min(high, value))
+
+
+@app.route("/analyze/batch", methods=["POST"])
+def analyze_batch():
+    """
+    Gövde: {"items": [{id, code, programming_language, lang}, ...], "max_concurrency": n, "deadline_sec": s}
+    (veya doğrudan öğe dizisi). Her sonuç biter bitmez bir JSON satırı olarak akıtılır:
+    {"id": ..., "status": 200, "result": ...}
+    """
+    data = request.get_json()
+    items = data.get("items") if isinstance(data, dict) else data
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "Analiz edilecek öğe gönderilmedi"}), 400
+    if len(items) > BATCH_MAX_ITEMS:
+        return jsonify({"error": f"En fazla {BATCH_MAX_ITEMS} öğe gönderilebilir"}), 413
+
+    options = data if isinstance(data, dict) else {}
+    concurrency = int(_clamp(options.get("max_concurrency"), BATCH_MAX_CONCURRENCY, 1, BATCH_MAX_CONCURRENCY))
+    deadline = time.monotonic() + _clamp(options.get("deadline_sec"), BATCH_MAX_DEADLINE, 0, BATCH_MAX_DEADLINE)
+
+    def run_item(item):
+        return run_analysis(item["code"],
+                            str(item.get("programming_language", "Python")).lower(),
+                            str(item.get("lang", "en")).lower(),
+                            include_all=bool(item.get("include_all")),
+                            deep=bool(item.get("deep")))
+
+    def generate():
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        futures = {}
+        try:
+            for index, item in enumerate(items):
+                item_id = item.get("id", index) if isinstance(item, dict) else index
+                if not isinstance(item, dict) or not isinstance(item.get("code"), str):
+                    yield json.dumps({"id": item_id, "status": 400, "result": {"error": "Kod gönderilmedi"}}) + "\n"
+                    continue
+                futures[executor.submit(contextvars.copy_context().run, run_item, item)] = item_id
 
-        # ----------------- Pylint ile çoklu hata kontrolü -----------------
-    errors = []
-    temp_filename = None
+            try:
+                for future in as_completed(futures, timeout=max(0.0, deadline - time.monotonic())):
+                    usage = None
+                    try:
+                        body, status, usage = future.result()
+                    except BackendBusy as e:
+                        body, status = {"error": str(e), "backend": e.backend, "retry_after": e.retry_after}, 429
+                    except Exception as e:
+                        body, status = {"error": str(e)}, 500
+                    line = {"id": futures.pop(future), "status": status, "result": body}
+                    if usage is not None:
+                        line["usage"] = usage
+                    yield json.dumps(line) + "\n"
+            except FuturesTimeoutError:
+                for future, item_id in futures.items():
+                    future.cancel()
+                    yield json.dumps({"id": item_id, "status": 504,
+                                      "result": {"error": "Toplu analiz süresi doldu."}}) + "\n"
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return Response(generate(), mimetype="application/x-ndjson")
+
+
+# ----------------- Çok dosyalı proje analizi -----------------
+def _flag(value, default):
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return value.strip().lower() not in ("0", "false", "no", "off", "")
+    return bool(value)
+
+
+@app.route("/analyze/project", methods=["POST"])
+def analyze_project():
+    """
+    Gövde: {"files": {"yol": "içerik"}, "programming_language": ..., "lang": ..., "deep": true}
+    veya zip (multipart "file" alanı ya da application/zip gövde; diğer alanlar form/sorgu parametresi).
+    Cevap: {"programming_language", "files": {yol: [bulgu]}, ...}; bkz. project.py.
+    Python'da pylint varsayılan olarak açıktır ("deep": false ile yalnızca hızlı kontrol).
+    """
+    upload = request.files.get("file")
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".py", mode="w", encoding="utf-8") as temp_file:
-            temp_file.write(code)
-            temp_filename = temp_file.name
-
-        result = subprocess.run(
-            ["pylint", "--output-format=json", temp_filename],
-            capture_output=True, text=True
-        )
-
-        pylint_output = json.loads(result.stdout) if result.stdout else []
-
-        for item in pylint_output:
-            error_type = item.get("type", "error")
-            line_no = item.get("line", "?")
-            msg = item.get("message", "")
-            error_info = ERROR_TRANSLATIONS.get(lang, ERROR_TRANSLATIONS["en"]).get(error_type, {})
-            explanation = error_info.get("explanation", msg)
-            solution = error_info.get("solution", "")
+        if upload is not None or request.mimetype in ("application/zip", "application/x-zip-compressed"):
+            options = request.form if upload is not None else request.args
+            blob = upload.read(PROJECT_MAX_BYTES + 1) if upload is not None else request.get_data()
+            if len(blob) > PROJECT_MAX_BYTES:
+                return jsonify({"error": f"Proje en fazla {PROJECT_MAX_BYTES // 1024} KB olabilir."}), 413
+            files = load_zip(blob)
+        else:
+            options = request.get_json(silent=True) or {}
+            files = load_json_files(options.get("files"))
+        prog_lang = str(options.get("programming_language") or detect_language(files)).lower()
+    except ProjectError as e:
+        return jsonify({"error": str(e)}), 400
+
+    lang = str(options.get("lang", "en")).lower()
+    deep = _flag(options.get("deep"), True)
+    g.log_fields = {"programming_language": prog_lang, "lang": lang, "file_count": len(files),
+                    "code_bytes": sum(len(c.encode("utf-8")) for c in files.values()), "deep": deep}
+
+    source_ext = ".java" if prog_lang == "java" else ".py"
+    files = {path: code for path, code in files.items() if path.endswith(source_ext)}
+    if not files:
+        return jsonify({"error": f"Projede {source_ext} dosyası yok."}), 400
+
+    cache_key = make_key(json.dumps(files, sort_keys=True), prog_lang, project=True, deep=deep)
+    result = analysis_cache.get(cache_key)
+    if result is None:
+        if prog_lang == "java":
+            from java_runner import analyze_java_project
+            result = coalesce(cache_key, lambda: analyze_java_project(files))
+            cacheable = "compilation_errors" not in result
+        else:
+            result = coalesce(cache_key, lambda: analyze_python_project(files, deep=deep))
+            cacheable = True
+        if cacheable:
+            analysis_cache.put(cache_key, result)
+
+    for findings in result["files"].values():
+        count_findings(findings)
+    body = dict(result, programming_language=prog_lang)
+    if prog_lang != "java":
+        # Java bulguları java_runner'da olduğu gibi döner; Python bulguları arayüz diline çevrilir
+        body["files"] = {path: translate_findings(findings, lang) for path, findings in result["files"].items()}
+    return jsonify(body)
+
+
+# ----------------- Test durumlarıyla değerlendirme -----------------
+@app.route("/judge", methods=["POST"])
+def judge_submission():
+    """
+    Gövde: {"code", "programming_language", "lang",
+            "tests": [{"id", "stdin", "expected_output", "time_limit", "memory_limit_mb"}],
+            "time_limit", "memory_limit_mb",   # durumda verilmeyenler için
+            "stop_on_failure": false, "backend": "local" | "judge0"}
+    Cevap: {"verdict", "passed", "total", "cases": [{id, verdict, usage, ...}], ...}; bkz. judge.py.
+    """
+    data = request.get_json(silent=True) or {}
+    code = data.get("code")
+    if not isinstance(code, str) or not code:
+        return jsonify({"error": "Kod gönderilmedi"}), 400
+    try:
+        cases = parse_cases(data.get("tests"), data.get("time_limit"), data.get("memory_limit_mb"))
+    except JudgeError as e:
+        return jsonify({"error": str(e)}), 400
+
+    prog_lang = str(data.get("programming_language", "Python")).lower()
+    lang = str(data.get("lang", "en")).lower()
+    stop_on_failure = _flag(data.get("stop_on_failure"), False)
+    g.log_fields = {"programming_language": prog_lang, "lang": lang, "code_bytes": len(code.encode("utf-8")),
+                    "case_count": len(cases), "stop_on_failure": stop_on_failure}
+
+    backend = str(data.get("backend", "local")).lower()
+    # sonuç önbelleğe alınmaz (süreler yüke bağlı) ama aynı anda gelen özdeş istekler birleştirilir
+    key = make_key(code, prog_lang, judge=cases, stop_on_failure=stop_on_failure, backend=backend)
+    try:
+        result = coalesce(key, lambda: judge_code(code, prog_lang, cases, stop_on_failure=stop_on_failure,
+                                                  backend=backend))
+    except _judge0_errors() as re:
+        return jsonify({"error": "Judge0 ile iletişim hatası: " + str(re)}), 502
+    if result.get("error"):
+        return jsonify({"error": result["error"]}), 500
+
+    body = dict(result, programming_language=prog_lang)
+    if result.get("compile_error") and prog_lang != "java":
+        body["compile_error"] = translate_findings(result["compile_error"], lang)
+    return jsonify(body)
+
+
+# ----------------- Asenkron Java işleri (Judge0 wait=false) -----------------
+@app.route("/analyze/jobs", methods=["POST"])
+def create_analysis_job():
+    data = request.get_json()
+    if not data or "code" not in data:
+        return jsonify({"error": "Kod gönderilmedi"}), 400
 
-            errors.append({
-                "error_type": error_type,
-                "line": line_no,
-                "original_message": msg,
-                "explanation": explanation,
-                "solution": solution
-            })
+    code = data["code"]
+    prog_lang = data.get("programming_language", "Java").lower()
+    if prog_lang != "java":
+        return jsonify({"error": "Asenkron işler yalnızca Java için destekleniyor."}), 400
 
-        if errors:
-            return jsonify(errors)
-        else:
-            no_error_msg = ERROR_TRANSLATIONS.get(lang, ERROR_TRANSLATIONS["en"]).get("NoError", "No errors found in code.")
-            return jsonify({"result": no_error_msg})
+    cache_key = _java_cache_key(code)
+    cached = analysis_cache.get(cache_key)
+    if cached is not None:
+        # Sonuç zaten biliniyor; iş oluşturmaya gerek yok
+        return jsonify({"job_id": None, "status": "done", **cached})
 
-    except Exception as e:
-        return jsonify({"error": str(e)})
-    finally:
-        if temp_filename and os.path.exists(temp_filename):
-            os.remove(temp_filename)
+    from judge0_jobs import job_store
+    try:
+        with limit("judge0"):
+            job = job_store.submit(code, language_substr="java", stdin=data.get("stdin", ""),
+                                   cpu_time_limit=2.0, meta=cache_key)
+    except _judge0_errors() as re:
+        return jsonify({"error": "Judge0 ile iletişim hatası: " + str(re)}), 502
+    if job.get("error"):
+        return jsonify({"error": job["error"]}), 500
+    return jsonify(job), 202
+
+
+@app.route("/analyze/jobs/<job_id>", methods=["GET"])
+def get_analysis_job(job_id):
+    from java_backends import normalize_judge0, is_cacheable as java_cacheable
+    from judge0_jobs import job_store, is_valid_job_id
+    if not is_valid_job_id(job_id):
+        return jsonify({"error": "Geçersiz iş kimliği."}), 400
+    try:
+        wait = float(request.args.get("wait", 0))
+    except ValueError:
+        wait = 0.0
+
+    job = job_store.get(job_id, wait=wait)
+    if job is None:
+        return jsonify({"error": "İş bulunamadı."}), 404
+    result = job.to_dict()
+    if result["status"] == "done":
+        # /analyze ile aynı normalize şema
+        normalized = normalize_judge0(job.result)
+        result = {"job_id": result["job_id"], "status": "done", **normalized}
+        if job.meta:
+            if java_cacheable(normalized):
+                analysis_cache.put(job.meta, normalized)
+            job.meta = None  # bir kez yazmak yeterli
+    return jsonify(result)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,272 @@
+# astroid_cache.py
+"""
+Öğrencilerin sık import ettiği standart kütüphane modüllerinin astroid AST'leri için
+diskte kalıcı, önceden oluşturulmuş önbellek.
+
+Pylint her yeni süreçte `math`, `random`, `collections`... modüllerini astroid ile
+sıfırdan kurar (~2 sn). Bu modül o ağaçları bir kez kurup pickle ile
+ASTROID_CACHE_DIR altına yazar (Docker imajında `python -c "import astroid_cache"`);
+sonraki süreçler dosyayı yalnızca okur. Dosya adı Python / astroid / pylint
+sürümlerini içerir, sürüm değişince yeniden oluşturulur.
+
+install() önbelleği astroid MANAGER'ına yükler (dosya yoksa ya da okunamıyorsa
+modülleri kurar ve dosyayı yazmayı dener); süreçte bir kez çalışır, sonraki çağrılar
+bir şey yapmaz. lint_pool bu modülü forkserver'a ön yükleme olarak verir: pylint ve
+önbellek forkserver'da bir kez yüklenir, lint worker'ları oradan fork edilip sayfaları
+copy-on-write paylaşır.
+
+Yan etkiler (bilerek):
+  * Modül içe aktarılınca install() çağrılır. forkserver ön yüklemesi modülleri
+    yalnızca içe aktarabildiği için başka bir yolu yoktur; ASTROID_CACHE=0 kapatır.
+    Bu yüzden modül web süreçlerinde değil, yalnızca lint worker'larında /
+    forkserver'da ve imaj kurulumunda içe aktarılır.
+  * save / load sürerken süreç genelindeki özyineleme sınırı _RECURSION_LIMIT'e
+    yükseltilir ve sonra eski değerine döndürülür; bu, diğer thread'lerin de
+    görebileceği bir değişikliktir (yukarıdaki süreçlerde başka thread çalışmaz).
+
+Ağaçlar doğrudan pickle edilemez; astroid'in kapanış (closure) olarak tuttuğu
+çıkarım ipuçları yeniden kurulabilir biçimde (_Pickler) yazılır. Bu, astroid'in iç
+fonksiyon adlarına dayanır (requirements.txt'te sabitlenen sürüm: astroid 4.3.4);
+tanınmayan bir kapanışta dosya yazılmaz, ağaçlar yalnızca süreç içinde kurulur. Canlı nesneden
+kurulan ve pickle edilemeyen modüller (builtins, sys, ...) dosyaya girmez, her
+süreçte canlı kurulur; diğer ağaçların onlara referansları yükleme sırasında
+canlı ağaçtaki düğüme bağlanır.
+"""
+import importlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+import time
+import types
+
+import astroid
+import pylint.lint  # forkserver'a pylint'i de ön yükler
+from astroid import MANAGER, nodes
+from astroid.brain import brain_builtin_inference
+
+ASTROID_CACHE = os.environ.get("ASTROID_CACHE", "1") != "0"
+ASTROID_CACHE_DIR = os.environ.get("ASTROID_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "build", "astroid")
+ASTROID_CACHE_MODULES = tuple(filter(None, os.environ.get("ASTROID_CACHE_MODULES", ",".join((
+    "math", "random", "collections", "itertools", "functools", "string", "re", "datetime", "time", "json",
+    "statistics", "heapq", "bisect", "fractions", "decimal", "operator", "copy", "typing", "dataclasses",
+    "enum", "array", "abc", "os", "sys",
+))).split(",")))
+
+# astroid ağaçları derin; pickle / unpickle bu kadar özyineleme ister (süreç geneli, geçici)
+_RECURSION_LIMIT = 20000
+
+# astroid.inference_tip hem fonksiyon hem modül adı; modül importlib ile alınır
+_inference_tip = importlib.import_module("astroid.inference_tip")
+
+installed = None  # bu süreçte {"source": "disk"|"built", "modules": n, "seconds": s}
+
+
+def cache_path():
+    version = f"py{sys.version_info[0]}{sys.version_info[1]}-astroid{astroid.__version__}-pylint{pylint.__version__}"
+    return os.path.join(ASTROID_CACHE_DIR, f"stdlib-{version}.pickle")
+
+
+# ----------------- Pickle edilemeyen astroid nesneleri -----------------
+def _cell(func, name):
+    return func.__closure__[func.__code__.co_freevars.index(name)].cell_contents
+
+
+class _CaptureTransform:
+    def register_transform(self, node_class, transform, predicate=None):
+        self.transform = transform
+
+
+def _builtin_transform_wrapper(transform):
+    # register_builtin_transform'un iç fonksiyonu, astroid'in kendi koduyla yeniden kurulur
+    capture = _CaptureTransform()
+    brain_builtin_inference.register_builtin_transform(capture, transform, None)
+    return capture.transform.__defaults__[0]
+
+
+class _FixedInference:
+    """brain'lerdeki `lambda node, context: iter([value])` ipuçlarının karşılığı."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, node, context=None):
+        return iter([self.value])
+
+
+def _live_object(modname, attrs):
+    obj = importlib.import_module(modname)
+    for attr in attrs:
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _locate(node):
+    """Düğümün modül içindeki isim yolu: ("modül", ["Sınıf", "öznitelik"]); bulunamazsa None."""
+    attrs, child, parent = [], node, node.parent
+    while parent is not None:
+        names = [name for name, values in getattr(parent, "locals", {}).items() if child in values]
+        if not names:
+            return None
+        attrs.append(names[0])
+        if isinstance(parent, nodes.Module):
+            return parent.name, attrs[::-1]
+        child, parent = parent, parent.parent
+    return None
+
+
+def _live_objects(module):
+    """
+    Modülün canlı nesneden kurulan düğümlerindeki (EmptyNode) pickle edilemeyen nesneler:
+    {id: isim yolu}. Biri isim yoluyla aynı türde geri alınamıyorsa None (modül dosyaya girmez).
+    """
+    found = {}
+    for node in module.nodes_of_class(nodes.EmptyNode):
+        try:
+            pickle.dumps(node.object)
+            continue
+        except Exception:
+            pass
+        location = _locate(node)
+        try:
+            if location is None or type(_live_object(*location)) is not type(node.object):
+                return None
+        except Exception:
+            return None
+        found[id(node.object)] = location
+    return found
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file, saved, live_objects):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.saved = saved
+        self.live_objects = live_objects
+
+    def persistent_id(self, obj):
+        # dosyada olmayan, önbellekteki (canlı kurulan) bir modülün düğümü: isim yoluyla bağlanır
+        if not isinstance(obj, nodes.NodeNG):
+            return None
+        root = obj.root()
+        name = getattr(root, "name", None)
+        if name in self.saved or MANAGER.astroid_cache.get(name) is not root:
+            return None
+        if obj is root:
+            return name, ()
+        location = _locate(obj)
+        if location is None:
+            raise pickle.PicklingError(f"{name} modülündeki düğüm bulunamadı: {obj!r}")
+        return name, tuple(location[1])
+
+    def reducer_override(self, obj):
+        if id(obj) in self.live_objects:
+            return _live_object, self.live_objects[id(obj)]
+        if not isinstance(obj, types.FunctionType) or not obj.__closure__:
+            return NotImplemented
+        qualname = obj.__qualname__
+        if qualname == "_inference_tip_cached.<locals>.inner":
+            return _inference_tip._inference_tip_cached, (_cell(obj, "func"),)
+        if qualname == "register_builtin_transform.<locals>._transform_wrapper":
+            return _builtin_transform_wrapper, (_cell(obj, "transform"),)
+        if obj.__name__ == "<lambda>" and obj.__code__.co_names == ("iter",) and len(obj.__closure__) == 1:
+            return _FixedInference, (obj.__closure__[0].cell_contents,)
+        return NotImplemented  # bilinmeyen kapanış: PicklingError, önbellek yazılmaz
+
+
+class _Unpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        modname, attrs = pid
+        node = MANAGER.ast_from_module_name(modname)
+        for attr in attrs:
+            node = node.locals[attr][0]
+        return node
+
+
+# ----------------- Kurma / yükleme -----------------
+def build(modules=ASTROID_CACHE_MODULES):
+    """Modüllerin astroid ağaçlarını bu süreçte kurar (MANAGER önbelleğine girer)."""
+    for modname in modules:
+        try:
+            MANAGER.ast_from_module_name(modname)
+        except Exception:
+            pass  # bu Python'da olmayan modül
+
+
+def save(path=None, modules=ASTROID_CACHE_MODULES):
+    """Kurulu ağaçları dosyaya yazar (geçici dosya + atomik yer değiştirme); yazılan modül sayısı."""
+    path = path or cache_path()
+    saved, live_objects = {}, {}
+    for modname, module in MANAGER.astroid_cache.items():
+        if modname == "builtins" or not isinstance(module, nodes.Module):
+            continue
+        objects = _live_objects(module)
+        if objects is not None:
+            saved[modname] = module
+            live_objects.update(objects)
+
+    buffer = io.BytesIO()
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, _RECURSION_LIMIT))
+    try:
+        _Pickler(buffer, set(saved), live_objects).dump({"modules": list(modules), "cache": saved})
+    finally:
+        sys.setrecursionlimit(limit)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buffer.getvalue())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return len(saved)
+
+
+def load(path=None, modules=ASTROID_CACHE_MODULES):
+    """Dosyadaki ağaçları MANAGER önbelleğine ekler; yüklenen modül sayısı (dosya uygun değilse None)."""
+    path = path or cache_path()
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, _RECURSION_LIMIT))
+    try:
+        with open(path, "rb") as f:
+            payload = _Unpickler(f).load()
+    except FileNotFoundError:
+        return None
+    finally:
+        sys.setrecursionlimit(limit)
+    if payload.get("modules") != list(modules):
+        return None  # modül listesi değişmiş: yeniden kurulur
+    for modname, module in payload["cache"].items():
+        MANAGER.astroid_cache.setdefault(modname, module)
+    return len(payload["cache"])
+
+
+def install():
+    """Önbelleği bu sürece yükler; dosya yoksa ya da bozuksa kurar ve yazmayı dener."""
+    global installed
+    if installed is not None or not ASTROID_CACHE:
+        return installed
+    started = time.perf_counter()
+    try:
+        count = load()
+    except Exception:
+        count = None  # bozuk / uyumsuz dosya: yeniden kurulur
+    source = "disk"
+    if count is None:
+        build()
+        source = "built"
+        try:
+            count = save()
+        except Exception:
+            count = 0  # yazılamadı (salt okunur dizin, bilinmeyen astroid nesnesi): yalnızca bu süreçte kalır
+    installed = {"source": source, "modules": count, "seconds": round(time.perf_counter() - started, 3)}
+    return installed
+
+
+# forkserver ön yüklemesi için içe aktarma yan etkisi (bkz. modül açıklaması)
+install()
@@ -0,0 +1,9 @@
+public class Main {
+    public static void main(String[] args) {
+        int toplam = 0
+        for (int i = 0; i < 10; i++) {
+            toplam += i;
+        }
+        System.out.println("Toplam: " + toplam);
+    }
+}
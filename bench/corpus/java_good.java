@@ -0,0 +1,15 @@
+public class Main {
+    static int faktoriyel(int n) {
+        int sonuc = 1;
+        for (int i = 2; i <= n; i++) {
+            sonuc *= i;
+        }
+        return sonuc;
+    }
+
+    public static void main(String[] args) {
+        for (int i = 0; i < 10; i++) {
+            System.out.println(i + "! = " + faktoriyel(i));
+        }
+    }
+}
@@ -0,0 +1,22 @@
+def fibonacci(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def is_prime(n):
+    if n < 2:
+        return False
+    i = 2
+    while i * i <= n:
+        if n % i == 0:
+            return False
+        i += 1
+    return True
+
+
+numbers = [fibonacci(i) for i in range(20)]
+primes = [n for n in numbers if is_prime(n)]
+print("Fibonacci:", numbers)
+print("Asal olanlar:", primes)
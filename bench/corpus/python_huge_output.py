@@ -0,0 +1,2 @@
+for i in range(200000):
+    print("satir", i, "x" * 40)
@@ -0,0 +1,3 @@
+sayac = 0
+while sayac < 10:
+    toplam = sayac * 2
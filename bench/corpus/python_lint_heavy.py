@@ -0,0 +1,366 @@
+import os, sys
+import math
+from collections import *
+
+
+def Fonksiyon0(list, x,y):
+    sonuc=0
+    kullanilmayan_0 = 0
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon1(list, x,y):
+    sonuc=0
+    kullanilmayan_1 = 1
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon2(list, x,y):
+    sonuc=0
+    kullanilmayan_2 = 2
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon3(list, x,y):
+    sonuc=0
+    kullanilmayan_3 = 3
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon4(list, x,y):
+    sonuc=0
+    kullanilmayan_4 = 4
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon5(list, x,y):
+    sonuc=0
+    kullanilmayan_5 = 5
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon6(list, x,y):
+    sonuc=0
+    kullanilmayan_6 = 6
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon7(list, x,y):
+    sonuc=0
+    kullanilmayan_7 = 7
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon8(list, x,y):
+    sonuc=0
+    kullanilmayan_8 = 8
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon9(list, x,y):
+    sonuc=0
+    kullanilmayan_9 = 9
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon10(list, x,y):
+    sonuc=0
+    kullanilmayan_10 = 10
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon11(list, x,y):
+    sonuc=0
+    kullanilmayan_11 = 11
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon12(list, x,y):
+    sonuc=0
+    kullanilmayan_12 = 12
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon13(list, x,y):
+    sonuc=0
+    kullanilmayan_13 = 13
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon14(list, x,y):
+    sonuc=0
+    kullanilmayan_14 = 14
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon15(list, x,y):
+    sonuc=0
+    kullanilmayan_15 = 15
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon16(list, x,y):
+    sonuc=0
+    kullanilmayan_16 = 16
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon17(list, x,y):
+    sonuc=0
+    kullanilmayan_17 = 17
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon18(list, x,y):
+    sonuc=0
+    kullanilmayan_18 = 18
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon19(list, x,y):
+    sonuc=0
+    kullanilmayan_19 = 19
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon20(list, x,y):
+    sonuc=0
+    kullanilmayan_20 = 20
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon21(list, x,y):
+    sonuc=0
+    kullanilmayan_21 = 21
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon22(list, x,y):
+    sonuc=0
+    kullanilmayan_22 = 22
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon23(list, x,y):
+    sonuc=0
+    kullanilmayan_23 = 23
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon24(list, x,y):
+    sonuc=0
+    kullanilmayan_24 = 24
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon25(list, x,y):
+    sonuc=0
+    kullanilmayan_25 = 25
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon26(list, x,y):
+    sonuc=0
+    kullanilmayan_26 = 26
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon27(list, x,y):
+    sonuc=0
+    kullanilmayan_27 = 27
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon28(list, x,y):
+    sonuc=0
+    kullanilmayan_28 = 28
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon29(list, x,y):
+    sonuc=0
+    kullanilmayan_29 = 29
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon30(list, x,y):
+    sonuc=0
+    kullanilmayan_30 = 30
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon31(list, x,y):
+    sonuc=0
+    kullanilmayan_31 = 31
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon32(list, x,y):
+    sonuc=0
+    kullanilmayan_32 = 32
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon33(list, x,y):
+    sonuc=0
+    kullanilmayan_33 = 33
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon34(list, x,y):
+    sonuc=0
+    kullanilmayan_34 = 34
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon35(list, x,y):
+    sonuc=0
+    kullanilmayan_35 = 35
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon36(list, x,y):
+    sonuc=0
+    kullanilmayan_36 = 36
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon37(list, x,y):
+    sonuc=0
+    kullanilmayan_37 = 37
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon38(list, x,y):
+    sonuc=0
+    kullanilmayan_38 = 38
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+def Fonksiyon39(list, x,y):
+    sonuc=0
+    kullanilmayan_39 = 39
+    if x==None:
+        return
+    for i in range(len(list)):
+        sonuc+=list[i]*x
+    return sonuc
+
+print(Fonksiyon0([1, 2, 3], 2, 3))
@@ -0,0 +1,9 @@
+ogrenciler = {"ali": 85, "ayse": 92}
+
+
+def not_getir(isim):
+    return ogrenciler[isim]
+
+
+print(not_getir("ali"))
+print(not_getir("mehmet"))
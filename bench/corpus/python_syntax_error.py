@@ -0,0 +1,8 @@
+def ortalama(notlar):
+    toplam = 0
+    for n in notlar
+        toplam += n
+    return toplam / len(notlar)
+
+
+print(ortalama([70, 85, 90]))
@@ -0,0 +1,153 @@
+# bench/fake_judge0.py
+"""
+Benchmark için yerel Judge0 taklidi (ağ erişimi gerektirmez).
+
+Desteklenen uçlar:
+  GET  /languages
+  POST /submissions?wait=true|false
+  POST /submissions/batch
+  GET  /submissions/<token>
+  GET  /submissions/batch?tokens=a,b,c
+
+Gerçekten derleme yapmaz: kaynakta sonu ';', '{', '}' veya ',' ile bitmeyen bir satır
+(yorumlar hariç) varsa "Compilation Error" (6), yoksa "Accepted" (3) döner. Gecikmeler ayarlanabilir:
+
+    python bench/fake_judge0.py --port 2358 --latency 0.8 --languages-latency 0.05
+"""
+import argparse
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Judge0 CE'deki sırayla: Python 2, Python 3'ten önce listelenir
+LANGUAGES = [
+    {"id": 62, "name": "Java (OpenJDK 13.0.1)"},
+    {"id": 63, "name": "JavaScript (Node.js 12.14.0)"},
+    {"id": 70, "name": "Python (2.7.17)"},
+    {"id": 71, "name": "Python (3.8.1)"},
+]
+
+
+def _verdict(source):
+    for number, line in enumerate(source.splitlines(), 1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith(("//", "/*", "*", "@")):
+            continue
+        if stripped[-1] not in ";{},":
+            return {"status": {"id": 6, "description": "Compilation Error"},
+                    "compile_output": f"Main.java:{number}: error: ';' expected\n{line}\n",
+                    "stdout": None, "stderr": None}
+    return {"status": {"id": 3, "description": "Accepted"}, "compile_output": None,
+            "stdout": "", "stderr": None}
+
+
+class FakeJudge0:
+    def __init__(self, latency=0.5, languages_latency=0.02, poll_latency=0.01):
+        self.latency = latency  # gönderimin "çalışma" süresi
+        self.languages_latency = languages_latency
+        self.poll_latency = poll_latency
+        self.submissions = {}  # token -> (hazır olma zamanı, sonuç)
+        self.counts = {"languages": 0, "submissions": 0, "polls": 0}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def create(self, source):
+        token = f"fake-{next(self._ids):08d}"
+        result = dict(_verdict(source), token=token, time="0.05", memory=1024)
+        with self._lock:
+            self.submissions[token] = (time.monotonic() + self.latency, result)
+            self.counts["submissions"] += 1
+        return token, result
+
+    def lookup(self, token):
+        with self._lock:
+            entry = self.submissions.get(token)
+        if entry is None:
+            return None
+        ready_at, result = entry
+        if time.monotonic() < ready_at:
+            return {"token": token, "status": {"id": 2, "description": "Processing"}}
+        return result
+
+
+def _handler(judge):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, obj, code=200):
+            body = json.dumps(obj).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == "/languages":
+                judge.counts["languages"] += 1
+                time.sleep(judge.languages_latency)
+                return self._send(LANGUAGES)
+            if url.path == "/submissions/batch":
+                judge.counts["polls"] += 1
+                time.sleep(judge.poll_latency)
+                tokens = parse_qs(url.query).get("tokens", [""])[0].split(",")
+                return self._send({"submissions": [judge.lookup(t) for t in tokens if t]})
+            if url.path.startswith("/submissions/"):
+                judge.counts["polls"] += 1
+                time.sleep(judge.poll_latency)
+                result = judge.lookup(url.path.rsplit("/", 1)[1])
+                return self._send(result or {"error": "not found"}, 200 if result else 404)
+            self._send({"error": "not found"}, 404)
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            if url.path not in ("/submissions", "/submissions/batch"):
+                return self._send({"error": "not found"}, 404)
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            if url.path == "/submissions/batch":
+                tokens = [judge.create(item.get("source_code", ""))[0] for item in payload.get("submissions", [])]
+                return self._send([{"token": token} for token in tokens], 201)
+            token, result = judge.create(payload.get("source_code", ""))
+            if parse_qs(url.query).get("wait", ["false"])[0] == "true":
+                time.sleep(judge.latency)
+                return self._send(result, 201)
+            self._send({"token": token}, 201)
+
+    return Handler
+
+
+def start(port=0, **settings):
+    """Arka plan thread'inde başlatır; (sunucu, FakeJudge0) döndürür. port=0 boş bir port seçer."""
+    judge = FakeJudge0(**settings)
+    server = ThreadingHTTPServer(("127.0.0.1", port), _handler(judge))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-judge0", daemon=True).start()
+    return server, judge
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel Judge0 taklidi")
+    parser.add_argument("--port", type=int, default=2358)
+    parser.add_argument("--latency", type=float, default=0.5, help="gönderim başına çalışma süresi (sn)")
+    parser.add_argument("--languages-latency", type=float, default=0.02)
+    parser.add_argument("--poll-latency", type=float, default=0.01)
+    args = parser.parse_args()
+    server, _ = start(args.port, latency=args.latency, languages_latency=args.languages_latency,
+                      poll_latency=args.poll_latency)
+    print(f"fake Judge0: http://127.0.0.1:{server.server_address[1]}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+# bench/run.py
+"""
+Yük ve gecikme benchmark'ı.
+
+Sunucuyu (app.py veya analyze.py) yerel bir fake Judge0 ile ayrı süreçte başlatır,
+bench/corpus altındaki her gönderimi her senaryo için eşzamanlı olarak yollar ve
+uç/senaryo ile aşama (Server-Timing, SSE olayları) başına p50/p95/p99 gecikme ve
+verimi JSON olarak raporlar. Ağ erişimi gerekmez.
+
+    python bench/run.py --requests 30 --concurrency 4 --output sonuc.json
+    python bench/run.py --target analyze --cases python_clean,java_good
+    python bench/run.py --compare onceki.json          # p50/p95 farklarını da yazar
+
+Varsayılan olarak her isteğin koduna benzersiz bir yorum eklenir, böylece sonuç
+önbelleği ölçümü bozmaz (--warm ile kapatılır).
+"""
+import argparse
+import glob
+import importlib.util
+import json
+import math
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+import fake_judge0
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+CORPUS_DIR = os.path.join(BENCH_DIR, "corpus")
+
+# senaryo -> (yol, ek gövde alanları, hangi diller)
+SCENARIOS = {
+    "app": {
+        "analyze": ("/analyze", {}, ("python", "java")),
+        "analyze_deep": ("/analyze", {"deep": True, "include_all": True}, ("python",)),
+        "stream": ("/analyze/stream", {}, ("python",)),
+    },
+    "analyze": {
+        "analyze": ("/analyze", {}, ("python", "java")),
+    },
+}
+
+
+# ----------------- corpus -----------------
+def load_corpus(selected=None):
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "*"))):
+        name, ext = os.path.splitext(os.path.basename(path))
+        language = {".py": "python", ".java": "java"}.get(ext)
+        if language is None or (selected and name not in selected):
+            continue
+        with open(path, encoding="utf-8") as f:
+            corpus.append({"name": name, "language": language, "code": f.read()})
+    return corpus
+
+
+def _salted(code, language):
+    marker = "//" if language == "java" else "#"
+    return f"{code}\n{marker} bench-{uuid.uuid4().hex}\n"
+
+
+# ----------------- sunucu -----------------
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _has_gunicorn():
+    return importlib.util.find_spec("gunicorn") is not None
+
+
+def start_server(target, server, workers, env):
+    port = _free_port()
+    if server == "gunicorn":
+        cmd = [sys.executable, "-m", "gunicorn", f"{target}:app", "--bind", f"127.0.0.1:{port}",
+               "--workers", str(workers), "--timeout", "120"]
+    else:
+        cmd = [sys.executable, "-c",
+               "import sys; sys.path.insert(0, '.'); from werkzeug.serving import run_simple; "
+               f"import {target} as m; run_simple('127.0.0.1', {port}, m.app, threaded=True)"]
+    proc = subprocess.Popen(cmd, cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"sunucu başlatılamadı: {' '.join(cmd)}")
+        try:
+            requests.get(url + "/", timeout=1)
+            return proc, url
+        except requests.exceptions.RequestException:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("sunucu 60 saniyede hazır olmadı")
+
+
+# ----------------- ölçüm -----------------
+def _server_timing(header):
+    stages = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if params.startswith("dur="):
+            try:
+                stages[name] = float(params[4:])
+            except ValueError:
+                pass
+    return stages
+
+
+def _sse_stages(text):
+    stages = {}
+    for line in text.splitlines():
+        if line.startswith("data: "):
+            try:
+                event = json.loads(line[6:])
+            except ValueError:
+                continue
+            if event.get("stage") and event.get("stage") != "done":
+                stages[event["stage"]] = max(stages.get(event["stage"], 0.0), event.get("duration_ms", 0.0))
+    return stages
+
+
+def one_request(session, url, path, body):
+    started = time.perf_counter()
+    try:
+        r = session.post(url + path, json=body, timeout=130)
+        text = r.text
+        status = r.status_code
+        header = r.headers.get("Server-Timing")
+    except requests.exceptions.RequestException as e:
+        return {"ms": (time.perf_counter() - started) * 1000, "status": type(e).__name__, "stages": {}}
+    elapsed = (time.perf_counter() - started) * 1000
+    stages = _sse_stages(text) if path.endswith("/stream") else _server_timing(header)
+    stages.pop("total", None)
+    return {"ms": elapsed, "status": status, "stages": stages}
+
+
+def percentile(values, p):
+    # en yakın sıra yöntemi
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)], 2)
+
+
+def summarize(samples, wall):
+    latencies = [s["ms"] for s in samples]
+    statuses = {}
+    for s in samples:
+        statuses[str(s["status"])] = statuses.get(str(s["status"]), 0) + 1
+    stage_values = {}
+    for s in samples:
+        for stage, ms in s["stages"].items():
+            stage_values.setdefault(stage, []).append(ms)
+    return {
+        "count": len(samples),
+        "statuses": statuses,
+        "throughput_rps": round(len(samples) / wall, 2) if wall > 0 else None,
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else None,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "stages": {stage: {"count": len(v), "p50_ms": percentile(v, 50), "p95_ms": percentile(v, 95),
+                           "p99_ms": percentile(v, 99)}
+                   for stage, v in sorted(stage_values.items())},
+    }
+
+
+def run_case(url, path, extra, item, n, concurrency, warm, warmup):
+    def body():
+        code = item["code"] if warm else _salted(item["code"], item["language"])
+        return dict(extra, code=code, programming_language=item["language"], lang="en")
+
+    session = requests.Session()
+    for _ in range(warmup):
+        one_request(session, url, path, body())
+
+    def task(_):
+        # her thread kendi bağlantısını kullansın
+        with requests.Session() as s:
+            return one_request(s, url, path, body())
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(task, range(n)))
+    return samples, time.perf_counter() - started
+
+
+def compare(current, baseline):
+    rows = {}
+    for key, result in current["results"].items():
+        old = baseline.get("results", {}).get(key)
+        if not old:
+            continue
+        rows[key] = {}
+        for field in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps"):
+            a, b = old.get(field), result.get(field)
+            if a and b is not None:
+                rows[key][field] = {"before": a, "after": b, "change_pct": round((b - a) / a * 100, 1)}
+    return rows
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kod analiz API yük/gecikme benchmark'ı")
+    parser.add_argument("--target", choices=sorted(SCENARIOS), default="app", help="app.py veya analyze.py")
+    parser.add_argument("--url", help="zaten çalışan sunucu (verilirse sunucu başlatılmaz)")
+    parser.add_argument("--server", choices=("gunicorn", "werkzeug"),
+                        default="gunicorn" if _has_gunicorn() else "werkzeug")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--requests", type=int, default=20, help="senaryo × gönderim başına istek")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--cases", help="virgülle ayrılmış corpus adları (varsayılan: hepsi)")
+    parser.add_argument("--scenarios", help="virgülle ayrılmış senaryolar (varsayılan: hepsi)")
+    parser.add_argument("--judge0-latency", type=float, default=0.5)
+    parser.add_argument("--warm", action="store_true", help="kodu tuzlama; önbellek isabetlerini de ölç")
+    parser.add_argument("--output", help="JSON sonuç dosyası (varsayılan: stdout)")
+    parser.add_argument("--compare", help="önceki bir çalışmanın JSON çıktısı")
+    args = parser.parse_args()
+
+    corpus = load_corpus(set(args.cases.split(",")) if args.cases else None)
+    scenarios = {name: spec for name, spec in SCENARIOS[args.target].items()
+                 if not args.scenarios or name in args.scenarios.split(",")}
+
+    judge_server, judge = fake_judge0.start(latency=args.judge0_latency)
+    proc = None
+    try:
+        if args.url:
+            url = args.url
+        else:
+            env = dict(os.environ,
+                       JUDGE0_BASE=f"http://127.0.0.1:{judge_server.server_address[1]}",
+                       METRICS_DIR=tempfile.mkdtemp(prefix="bench-metrics-"),
+                       LOG_SAMPLE_RATE="0")
+            env.pop("ANALYSIS_CACHE_DIR", None)
+            proc, url = start_server(args.target, args.server, args.workers, env)
+
+        results = {}
+        overall = {}
+        for scenario, (path, extra, languages) in scenarios.items():
+            for item in corpus:
+                if item["language"] not in languages:
+                    continue
+                samples, wall = run_case(url, path, extra, item, args.requests, args.concurrency,
+                                         args.warm, args.warmup)
+                key = f"{scenario}/{item['name']}"
+                results[key] = summarize(samples, wall)
+                print(f"{key:40s} p50={results[key]['p50_ms']}ms p95={results[key]['p95_ms']}ms "
+                      f"p99={results[key]['p99_ms']}ms {results[key]['throughput_rps']} rps", file=sys.stderr)
+                overall.setdefault(scenario, ([], 0.0))
+                overall[scenario] = (overall[scenario][0] + samples, overall[scenario][1] + wall)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        judge_server.shutdown()
+
+    report = {
+        "meta": {
+            "git_revision": _git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "settings": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+            "fake_judge0_counts": judge.counts,
+        },
+        "results": results,
+        "endpoints": {scenario: summarize(samples, wall) for scenario, (samples, wall) in overall.items()},
+    }
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            report["comparison"] = compare(report, json.load(f))
+        for key, fields in report["comparison"].items():
+            changes = " ".join(f"{field}={v['change_pct']:+.1f}%" for field, v in fields.items())
+            print(f"{key:40s} {changes}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# budget.py
+"""
+İstemcinin süre bütçesine (deadline_ms) ve seviyesine (level) göre Python analiz planı.
+
+Seviye hangi aşamaların istendiğini belirler (sözdizimi kontrolü her zaman yapılır):
+    quick     hızlı AST denetimi (editörde yazarken)
+    standard  + kodun çalıştırılması (varsayılan)
+    deep      + pylint
+
+deadline_ms verilirse istenen aşamalar öncelik sırasıyla, bu worker'da gözlenen
+süreleri (metrics.stage_quantile; yeterli gözlem yoksa STAGE_PRIORS) kalan bütçeye
+sığdığı sürece plana alınır. Sığmayan aşama hiç başlatılmaz; plana alınıp bütçeyi
+aşan çalıştırma ve pylint kalan sürenin sonunda kesilir. Atlanan / kesilen aşamalar
+skipped'e yazılır, sonuç kısmi (partial) sayılır ve önbelleğe alınmaz.
+
+Kullanım:
+    budget = parse_budget(data)          # istekte level / deadline_ms yoksa None
+    budget.plan()                        # analiz başlarken
+    if budget.wants("python_run"): ...
+    timeout = budget.limit(3, reserve=("fast",))
+"""
+import os
+import time
+
+from metrics import stage_quantile
+
+BUDGET_QUANTILE = float(os.environ.get("BUDGET_QUANTILE", 0.5))
+BUDGET_MIN_SAMPLES = int(os.environ.get("BUDGET_MIN_SAMPLES", 20))  # bundan az gözlemde STAGE_PRIORS
+BUDGET_MAX_DEADLINE_MS = int(os.environ.get("BUDGET_MAX_DEADLINE_MS", 60000))
+
+# seviye -> istenen aşamalar (öncelik sırasıyla)
+LEVELS = {
+    "quick": ("fast",),
+    "standard": ("fast", "python_run"),
+    "deep": ("fast", "python_run", "pylint"),
+}
+# gözlem yokken kullanılan süre tahminleri (saniye): sıcak yoldaki ölçümler (zygote'tan
+# çalıştırma, ısınmış lint havuzu; küçük bir gönderimde p90). Fazla temkinli tahmin, ilk
+# BUDGET_MIN_SAMPLES istekte sığacak aşamaları da atlatır.
+STAGE_PRIORS = {"fast": 0.001, "python_run": 0.025, "pylint": 0.1}
+# çalıştırmayla paralel yürüyen aşamalar: yalnızca kendi süreleri bütçeye sığmalı
+PARALLEL_STAGES = ("pylint",)
+
+
+class BudgetError(ValueError):
+    pass
+
+
+def estimate(stage):
+    """Aşamanın beklenen süresi (saniye)."""
+    observed = stage_quantile(stage, BUDGET_QUANTILE, BUDGET_MIN_SAMPLES)
+    return STAGE_PRIORS.get(stage, 0.0) if observed is None else observed
+
+
+class Budget:
+    def __init__(self, level="standard", deadline_ms=None):
+        self.level = level
+        self.deadline = None if deadline_ms is None else time.monotonic() + deadline_ms / 1000
+        self.planned = set(LEVELS[level])
+        self.skipped = []
+
+    def remaining(self, reserve=()):
+        """Kalan süre (saniye; bütçe yoksa None). reserve: sonra çalışacak planlı aşamaların payı."""
+        if self.deadline is None:
+            return None
+        reserved = sum(estimate(stage) for stage in reserve if stage in self.planned)
+        return max(0.0, self.deadline - time.monotonic() - reserved)
+
+    def limit(self, cap, reserve=()):
+        """Aşamanın süre sınırı: cap ile kalan bütçenin küçüğü."""
+        remaining = self.remaining(reserve)
+        return cap if remaining is None else min(cap, remaining)
+
+    def plan(self):
+        """Bütçeye sığmayan aşamaları plandan çıkarır."""
+        if self.deadline is None:
+            return
+        reserved = 0.0
+        for stage in LEVELS[self.level]:
+            cost = estimate(stage)
+            if stage in PARALLEL_STAGES:
+                fits = cost <= self.remaining()
+            else:
+                fits = reserved + cost <= self.remaining()
+                reserved += cost if fits else 0.0
+            if not fits:
+                self.skip(stage)
+
+    def wants(self, stage):
+        return stage in self.planned
+
+    def skip(self, stage):
+        self.planned.discard(stage)
+        if stage not in self.skipped:
+            self.skipped.append(stage)
+
+    @property
+    def partial(self):
+        return bool(self.skipped)
+
+
+def parse_budget(data):
+    """İstekteki level / deadline_ms; ikisi de yoksa None (eski davranış). Geçersizse BudgetError."""
+    level, deadline_ms = data.get("level"), data.get("deadline_ms")
+    if level is None and deadline_ms is None:
+        return None
+    if level is None:
+        level = "deep" if data.get("deep") else "standard"
+    level = str(level).lower()
+    if level not in LEVELS:
+        raise BudgetError(f"level şunlardan biri olmalı: {', '.join(LEVELS)}")
+    if deadline_ms is not None:
+        if isinstance(deadline_ms, bool) or not isinstance(deadline_ms, (int, float)) or deadline_ms <= 0:
+            raise BudgetError("deadline_ms pozitif bir sayı olmalı.")
+        deadline_ms = min(deadline_ms, BUDGET_MAX_DEADLINE_MS)
+    return Budget(level, deadline_ms)
@@ -0,0 +1,116 @@
+# capture.py
+"""
+Çocuk süreç çıktısının sınırlı bellekle okunması.
+
+Pipe'lar parça parça okunur. Her akış için baştan en fazla `head_bytes`, sondan en
+fazla `tail_bytes` bayt (kayan tampon) tutulur; aradaki çıktı sayılır ama saklanmaz.
+Böylece `while True: print(x)` gibi bir gönderim gunicorn worker'ının belleğini
+şişirmez, sondaki traceback ise (line / error_type ayrıştırması için) korunur.
+Okunan toplam bayt `output_limit`'i geçerse drain "limit" döndürür; çağıran taraf
+çocuğu öldürür ve OutputLimitExceeded fırlatır.
+
+Judge0 cevaplarındaki metin alanları da aynı baş/son kuralıyla kısaltılır (clip_text).
+"""
+import os
+import selectors
+import subprocess
+import time
+
+CAPTURE_HEAD_BYTES = int(os.environ.get("CAPTURE_HEAD_KB", 64)) * 1024
+CAPTURE_TAIL_BYTES = int(os.environ.get("CAPTURE_TAIL_KB", 32)) * 1024
+# Tek çalıştırmada okunacak toplam çıktı (stdout + stderr); aşılırsa çocuk öldürülür
+CAPTURE_OUTPUT_LIMIT = int(os.environ.get("CAPTURE_OUTPUT_LIMIT_MB", 8)) * 1024 * 1024
+
+_READ_SIZE = 65536
+
+
+class OutputLimitExceeded(subprocess.SubprocessError):
+    """Çıktı sınırı aşıldı, çocuk öldürüldü. TimeoutExpired ile aynı alanları taşır."""
+
+    def __init__(self, cmd, limit, output=None, stderr=None):
+        self.cmd = cmd
+        self.limit = limit
+        self.output = output
+        self.stderr = stderr
+
+    def __str__(self):
+        return f"Command '{self.cmd}' exceeded the output limit of {self.limit} bytes"
+
+    @property
+    def stdout(self):
+        return self.output
+
+
+class OutputBuffer:
+    """Bir akışın ilk head_bytes ve son tail_bytes baytını tutar."""
+
+    def __init__(self, head_bytes=CAPTURE_HEAD_BYTES, tail_bytes=CAPTURE_TAIL_BYTES):
+        self.head_bytes = head_bytes
+        self.tail_bytes = tail_bytes
+        self.head = bytearray()
+        self.tail = bytearray()
+        self.total = 0
+
+    def feed(self, data):
+        self.total += len(data)
+        room = self.head_bytes - len(self.head)
+        if room > 0:
+            self.head += data[:room]
+            data = data[room:]
+        if data and self.tail_bytes:
+            self.tail += data
+            if len(self.tail) > self.tail_bytes:
+                # bytearray'in başından silmek kopyalama yapmaz (halka tampon gibi davranır)
+                del self.tail[:len(self.tail) - self.tail_bytes]
+
+    @property
+    def truncated(self):
+        return self.total > len(self.head) + len(self.tail)
+
+    def data(self):
+        return bytes(self.head + self.tail)
+
+    def text(self):
+        head = self.head.decode("utf-8", errors="replace")
+        if not self.truncated:
+            return head + self.tail.decode("utf-8", errors="replace")
+        omitted = self.total - len(self.head) - len(self.tail)
+        return f"{head}\n...[{omitted} bytes omitted]...\n{self.tail.decode('utf-8', errors='replace')}"
+
+
+def drain(buffers, deadline, output_limit=None):
+    """
+    buffers: {fd: OutputBuffer}. fd'ler kapanana, deadline dolana ya da okunan toplam
+    bayt output_limit'i geçene kadar okur; "eof", "timeout" veya "limit" döndürür.
+    """
+    sel = selectors.DefaultSelector()
+    try:
+        for fd in buffers:
+            sel.register(fd, selectors.EVENT_READ)
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return "timeout"
+            for key, _ in sel.select(remaining):
+                data = os.read(key.fd, _READ_SIZE)
+                if data:
+                    buffers[key.fd].feed(data)
+                else:
+                    sel.unregister(key.fd)
+            if output_limit is not None and sum(b.total for b in buffers.values()) > output_limit:
+                return "limit"
+        return "eof"
+    finally:
+        sel.close()
+
+
+def clip_text(text, head_bytes=CAPTURE_HEAD_BYTES, tail_bytes=CAPTURE_TAIL_BYTES):
+    """Hazır bir metni aynı baş/son kuralıyla kısaltır; (metin, kısaltıldı mı) döndürür."""
+    if text is None or len(text) * 4 <= head_bytes + tail_bytes:
+        # UTF-8'de karakter başına en fazla 4 bayt; kısa metinler kodlanmadan döner
+        return text, False
+    buffer = OutputBuffer(head_bytes, tail_bytes)
+    buffer.feed(text.encode("utf-8"))
+    if not buffer.truncated:
+        return text, False
+    return buffer.text(), True
@@ -0,0 +1,393 @@
+# fast_checker.py
+"""
+Yeni başlayanların en sık yaptığı hatalar için pylint'ten önce çalışan hızlı denetleyici.
+
+Kod tek bir kez `ast` ile dolaşılır ve basit bir sembol tablosu (modül / fonksiyon /
+sınıf / comprehension kapsamları) kurulur. Akıştan bağımsızdır: bir isim kapsamında
+herhangi bir yerde bağlanıyorsa tanımlı sayılır. Bu yüzden pylint'in yakaladığı her
+şeyi yakalamaz, ama yanlış alarm üretmemeye çalışır ve mikro saniyeler sürer.
+
+Bulgular ERROR_TRANSLATIONS anahtarlarıyla döner:
+  NameError        tanımsız isim
+  TypeError        aynı dosyada tanımlı fonksiyona yanlış sayıda / isimde argüman
+  UnusedVariable   fonksiyon içinde atanıp hiç kullanılmayan değişken
+  UnreachableCode  return / raise / break / continue sonrasındaki kod
+  ShadowedBuiltin  yerleşik bir ismin (list, sum, input ...) üzerine yazılması
+"""
+import ast
+import builtins
+
+BUILTIN_NAMES = frozenset(dir(builtins)) | {"__file__", "__builtins__"}
+# Gölgelenmesi uyarılacak isimler: dunder'lar hariç tüm yerleşikler
+SHADOWABLE_BUILTINS = frozenset(n for n in dir(builtins) if not n.startswith("__"))
+
+_TERMINATORS = (ast.Return, ast.Raise, ast.Break, ast.Continue)
+_DYNAMIC_SCOPE_CALLS = {"locals", "vars", "eval", "exec"}
+
+
+class _Scope:
+    def __init__(self, kind, parent=None):
+        self.kind = kind  # "module", "function", "class", "comprehension"
+        self.parent = parent
+        self.bindings = {}  # isim -> ilk bağlandığı satır
+        self.binding_counts = {}
+        self.assignments = {}  # kullanılmayan değişken kontrolü için: isim -> satır
+        self.globals = set()
+        self.nonlocals = set()
+        self.used = set()
+        self.star_import = False
+        self.shadow_reported = set()  # ShadowedBuiltin kapsam başına isim başına bir kez
+        self.dynamic = False  # locals()/eval() vb. varsa kullanılmayan değişken raporlanmaz
+
+    def bind(self, name, line):
+        self.bindings.setdefault(name, line)
+        self.binding_counts[name] = self.binding_counts.get(name, 0) + 1
+
+    def module(self):
+        scope = self
+        while scope.parent is not None:
+            scope = scope.parent
+        return scope
+
+
+class _Checker(ast.NodeVisitor):
+    def __init__(self):
+        self.module_scope = _Scope("module")
+        self.scope = self.module_scope
+        self.loads = []  # (kapsam, isim, satır)
+        self.calls = []  # (kapsam, Call düğümü)
+        self.functions = {}  # modül düzeyi fonksiyon adı -> düğüm
+        self.function_scopes = []  # kullanılmayan değişkenler isimler çözümlendikten sonra raporlanır
+        self.findings = []
+
+    # ----------------- yardımcılar -----------------
+    def _add(self, error_type, line, message):
+        self.findings.append({"error_type": error_type, "line": line, "original_message": message})
+
+    def _bind(self, name, node, scope=None, assignment=False):
+        scope = scope or self.scope
+        if name in scope.globals:
+            scope = scope.module()
+        scope.bind(name, node.lineno)
+        if assignment and scope.kind == "function" and not name.startswith("_") and name not in scope.nonlocals:
+            scope.assignments.setdefault(name, node.lineno)
+        if name in SHADOWABLE_BUILTINS and scope.kind != "class" and name not in scope.shadow_reported:
+            scope.shadow_reported.add(name)
+            self._add("ShadowedBuiltin", node.lineno, f"Redefining built-in '{name}'")
+
+    def _visit_in(self, scope, nodes):
+        previous, self.scope = self.scope, scope
+        try:
+            for node in nodes:
+                self.visit(node)
+        finally:
+            self.scope = previous
+
+    def _check_unreachable(self, body):
+        for index, stmt in enumerate(body[:-1]):
+            if isinstance(stmt, _TERMINATORS):
+                self._add("UnreachableCode", body[index + 1].lineno, "Unreachable code")
+                break
+
+    def generic_visit(self, node):
+        for field in ("body", "orelse", "finalbody"):
+            value = getattr(node, field, None)
+            if isinstance(value, list) and value and isinstance(value[0], ast.stmt):
+                self._check_unreachable(value)
+        super().generic_visit(node)
+
+    # ----------------- bağlamalar -----------------
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Store):
+            self._bind(node.id, node, assignment=True)
+        else:  # Load / Del
+            self.loads.append((self.scope, node.id, node.lineno))
+
+    def visit_AnnAssign(self, node):
+        # Değersiz açıklama (x: int) ismi bağlamaz; yalnızca açıklama değerlendirilir
+        self.visit(node.annotation)
+        if node.value is not None:
+            self.visit(node.value)
+            self.visit(node.target)
+        elif not isinstance(node.target, ast.Name):
+            self.visit(node.target)  # self.x: int -> self okunur
+
+    def visit_AugAssign(self, node):
+        # x += 1 hem okur hem yazar
+        if isinstance(node.target, ast.Name):
+            self.loads.append((self.scope, node.target.id, node.lineno))
+            self._bind(node.target.id, node.target)
+        else:
+            self.visit(node.target)
+        self.visit(node.value)
+
+    def _visit_loop_target(self, target):
+        # Döngü / with değişkenleri kullanılmasa da raporlanmaz (pylint de raporlamaz)
+        for sub in ast.walk(target):
+            if isinstance(sub, ast.Name) and isinstance(sub.ctx, ast.Store):
+                self._bind(sub.id, sub)
+            elif isinstance(sub, (ast.Attribute, ast.Subscript)):
+                self.visit(sub)
+                break
+
+    def visit_For(self, node):
+        self.visit(node.iter)
+        self._visit_loop_target(node.target)
+        self._check_unreachable(node.body)
+        self._check_unreachable(node.orelse)
+        for stmt in node.body + node.orelse:
+            self.visit(stmt)
+
+    visit_AsyncFor = visit_For
+
+    def visit_With(self, node):
+        for item in node.items:
+            self.visit(item.context_expr)
+            if item.optional_vars is not None:
+                self._visit_loop_target(item.optional_vars)
+        self._check_unreachable(node.body)
+        for stmt in node.body:
+            self.visit(stmt)
+
+    visit_AsyncWith = visit_With
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            self._bind(alias.asname or alias.name.split(".")[0], node)
+
+    def visit_ImportFrom(self, node):
+        for alias in node.names:
+            if alias.name == "*":
+                self.scope.star_import = True
+            else:
+                self._bind(alias.asname or alias.name, node)
+
+    def visit_Global(self, node):
+        self.scope.globals.update(node.names)
+        for name in node.names:
+            self.module_scope.bind(name, node.lineno)
+
+    def visit_Nonlocal(self, node):
+        self.scope.nonlocals.update(node.names)
+
+    def visit_ExceptHandler(self, node):
+        if node.type is not None:
+            self.visit(node.type)
+        if node.name:
+            self._bind(node.name, node, assignment=True)
+        self._check_unreachable(node.body)
+        for stmt in node.body:
+            self.visit(stmt)
+
+    def visit_MatchAs(self, node):
+        if node.name:
+            self._bind(node.name, node)
+        self.generic_visit(node)
+
+    def visit_MatchStar(self, node):
+        if node.name:
+            self._bind(node.name, node)
+
+    def visit_MatchMapping(self, node):
+        if node.rest:
+            self._bind(node.rest, node)
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        if isinstance(node.func, ast.Name):
+            self.calls.append((self.scope, node))
+            if node.func.id in _DYNAMIC_SCOPE_CALLS:
+                self.scope.dynamic = True
+        self.generic_visit(node)
+
+    # ----------------- kapsamlar -----------------
+    def _visit_arguments(self, args):
+        # Varsayılan değerler ve açıklamalar dış kapsamda değerlendirilir
+        for default in args.defaults + [d for d in args.kw_defaults if d is not None]:
+            self.visit(default)
+        for arg in args.posonlyargs + args.args + args.kwonlyargs + [args.vararg, args.kwarg]:
+            if arg is not None and arg.annotation is not None:
+                self.visit(arg.annotation)
+
+    def _bind_arguments(self, scope, args):
+        for arg in args.posonlyargs + args.args + args.kwonlyargs + [args.vararg, args.kwarg]:
+            if arg is not None:
+                self._bind(arg.arg, arg, scope=scope)
+
+    def visit_FunctionDef(self, node):
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        self._visit_arguments(node.args)
+        if node.returns is not None:
+            self.visit(node.returns)
+        self._bind(node.name, node)
+        if self.scope is self.module_scope and not node.decorator_list:
+            self.functions[node.name] = node
+
+        scope = _Scope("function", self.scope)
+        self._bind_arguments(scope, node.args)
+        self._check_unreachable(node.body)
+        self._visit_in(scope, node.body)
+        self.function_scopes.append(scope)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        self._visit_arguments(node.args)
+        scope = _Scope("function", self.scope)
+        self._bind_arguments(scope, node.args)
+        self._visit_in(scope, [node.body])
+
+    def visit_ClassDef(self, node):
+        for expr in node.decorator_list + node.bases + [k.value for k in node.keywords]:
+            self.visit(expr)
+        self._bind(node.name, node)
+        scope = _Scope("class", self.scope)
+        self._check_unreachable(node.body)
+        self._visit_in(scope, node.body)
+
+    def _visit_comprehension(self, node, elements):
+        # İlk iterable dış kapsamda, geri kalan her şey comprehension kapsamında değerlendirilir
+        self.visit(node.generators[0].iter)
+        scope = _Scope("comprehension", self.scope)
+        previous, self.scope = self.scope, scope
+        try:
+            for index, generator in enumerate(node.generators):
+                if index:
+                    self.visit(generator.iter)
+                self._visit_loop_target(generator.target)
+                for condition in generator.ifs:
+                    self.visit(condition)
+            for element in elements:
+                self.visit(element)
+        finally:
+            self.scope = previous
+
+    def visit_ListComp(self, node):
+        self._visit_comprehension(node, [node.elt])
+
+    visit_SetComp = visit_GeneratorExp = visit_ListComp
+
+    def visit_DictComp(self, node):
+        self._visit_comprehension(node, [node.key, node.value])
+
+    def visit_NamedExpr(self, node):
+        self.visit(node.value)
+        # := comprehension içinde kullanılsa da çevreleyen kapsamı bağlar
+        scope = self.scope
+        while scope.kind == "comprehension":
+            scope = scope.parent
+        self._bind(node.target.id, node.target, scope=scope, assignment=True)
+
+    # ----------------- çözümleme -----------------
+    def _lookup(self, scope, name):
+        if name in scope.globals:
+            scope = scope.module()
+        current = scope
+        while current is not None:
+            if current is scope or current.kind != "class":
+                if name in current.bindings and name not in current.nonlocals:
+                    return current
+            if current.star_import:
+                return current
+            current = current.parent
+        return None
+
+    def run(self, tree):
+        self._check_unreachable(tree.body)
+        for stmt in tree.body:
+            self.visit(stmt)
+
+        reported = set()
+        for scope, name, line in self.loads:
+            owner = self._lookup(scope, name)
+            if owner is not None:
+                owner.used.add(name)
+            elif name not in BUILTIN_NAMES and (name, line) not in reported:
+                reported.add((name, line))
+                self._add("NameError", line, f"name '{name}' is not defined")
+
+        for scope in self.function_scopes:
+            if scope.dynamic:
+                continue
+            for name, line in scope.assignments.items():
+                if name not in scope.used:
+                    self._add("UnusedVariable", line, f"Unused variable '{name}'")
+
+        for scope, call in self.calls:
+            name = call.func.id
+            func = self.functions.get(name)
+            if (func is not None and self._lookup(scope, name) is self.module_scope
+                    and self.module_scope.binding_counts.get(name) == 1):
+                message = _check_arguments(name, func.args, call)
+                if message:
+                    self._add("TypeError", call.lineno, message)
+
+        self.findings.sort(key=lambda f: f["line"])
+        return self.findings
+
+
+def _plural(count, word):
+    return f"{count} {word}" if count == 1 else f"{count} {word}s"
+
+
+def _quote_list(names):
+    quoted = [f"'{n}'" for n in names]
+    if len(quoted) == 1:
+        return quoted[0]
+    return ", ".join(quoted[:-1]) + " and " + quoted[-1]
+
+
+def _check_arguments(name, args, call):
+    """CPython'un TypeError mesajlarıyla aynı biçimde; sorun yoksa None."""
+    if any(isinstance(a, ast.Starred) for a in call.args) or any(k.arg is None for k in call.keywords):
+        return None  # *args / **kwargs ile açılan çağrılar statik olarak sayılamaz
+
+    positional = args.posonlyargs + args.args
+    names = [a.arg for a in positional]
+    keyword_names = [k.arg for k in call.keywords]
+    given = len(call.args)
+
+    if given > len(positional) and args.vararg is None:
+        required = len(positional) - len(args.defaults)
+        if required == len(positional):
+            takes = _plural(len(positional), "positional argument")
+        else:
+            takes = f"from {required} to {len(positional)} positional arguments"
+        verb = "was" if given == 1 else "were"
+        return f"{name}() takes {takes} but {given} {verb} given"
+
+    allowed = {a.arg for a in args.args + args.kwonlyargs}
+    for index, keyword in enumerate(keyword_names):
+        if keyword in names[:given] and keyword in allowed:
+            return f"{name}() got multiple values for argument '{keyword}'"
+        if keyword not in allowed and args.kwarg is None:
+            return f"{name}() got an unexpected keyword argument '{keyword}'"
+        if keyword in keyword_names[:index]:
+            return f"{name}() got multiple values for keyword argument '{keyword}'"
+
+    required = names[:len(positional) - len(args.defaults)]
+    missing = [n for i, n in enumerate(required) if i >= given and n not in keyword_names]
+    if missing:
+        return (f"{name}() missing {len(missing)} required positional "
+                f"argument{'s' if len(missing) > 1 else ''}: {_quote_list(missing)}")
+
+    missing = [a.arg for a, default in zip(args.kwonlyargs, args.kw_defaults)
+               if default is None and a.arg not in keyword_names]
+    if missing:
+        return (f"{name}() missing {len(missing)} required keyword-only "
+                f"argument{'s' if len(missing) > 1 else ''}: {_quote_list(missing)}")
+    return None
+
+
+def check(code, tree=None):
+    """
+    Kodu denetler; [{"error_type", "line", "original_message"}] döndürür.
+    Kodun derlenebildiği varsayılır (sözdizimi hatası önce compile() ile yakalanır).
+    """
+    try:
+        if tree is None:
+            tree = ast.parse(code)
+        return _Checker().run(tree)
+    except (SyntaxError, ValueError, RecursionError):
+        return []
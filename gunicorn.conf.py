@@ -0,0 +1,26 @@
+# gunicorn.conf.py
+"""
+Üretim ayarları: `gunicorn -c gunicorn.conf.py app:app` (bkz. Dockerfile).
+
+preload_app: uygulama (Flask, çeviri tabloları, analiz modülleri) master'da bir kez
+içe aktarılır, worker'lar copy-on-write fork edilir; her worker uygulamayı yeniden
+yüklemez. Java / Judge0 modülleri app.py'de ilk kullanımda yüklenir.
+
+Her worker fork edilir edilmez lint havuzunu ve (java kuruluysa) Java çalıştırma
+JVM'lerini arka planda başlatır; ilk istek pylint'in, astroid önbelleğinin
+(astroid_cache) ya da JVM'in açılmasını beklemez. JAVA_RUN_POOL_SIZE=0 JVM'leri kapatır.
+"""
+import os
+import threading
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 10000)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1") != "0"
+
+
+def post_fork(server, worker):
+    from lint_pool import prestart
+    threading.Thread(target=prestart, name="lint-prestart", daemon=True).start()
+    import java_daemon  # requests / Judge0 modüllerini yüklemez
+    threading.Thread(target=java_daemon.prestart, name="java-prestart", daemon=True).start()
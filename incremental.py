@@ -0,0 +1,191 @@
+# incremental.py
+"""
+Editör oturumları için artımlı pylint analizi.
+
+Öğrenci aynı dosyada yalnızca bir fonksiyonu değiştirip tekrar tekrar "Analiz Et"e
+bastığında tüm dosyayı yeniden lint etmek yerine:
+
+  * modül `ast` ile üst düzey tanımlara (def / async def / class) bölünür,
+    her tanımın kaynak metni hash'lenir;
+  * değişmeyen tanımların bulguları oturumdan (tanım başına göreli satırlarla) alınır;
+  * pylint'e yalnızca "iskelet" (üst düzey tanım olmayan kod), değişen tanımlar,
+    onlara bağımlı olanlar ve onların kullandığı tanımlar olduğu gibi verilir;
+    geri kalan tanımlar aynı satır aralığını kaplayan küçük taslaklarla (stub)
+    değiştirilir, böylece satır numaraları kaymaz;
+  * iskelet değiştiyse (import, global değişken vb.) tüm dosya yeniden lint edilir.
+
+Oturumlar süreç içi bellekte tutulur (gunicorn worker'ı başına); oturum başka
+bir worker'a düşerse o istek tam analizle sonuçlanır.
+"""
+import ast
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+SESSION_TTL = float(os.environ.get("SESSION_TTL", 1800))  # saniye
+SESSION_MAX = int(os.environ.get("SESSION_MAX", 500))
+
+
+class _Definition:
+    def __init__(self, node, lines):
+        starts = [d.lineno for d in node.decorator_list] + [node.lineno]
+        self.node = node
+        self.name = node.name
+        self.start = min(starts)
+        self.end = node.end_lineno
+        text = "".join(lines[self.start - 1:self.end])
+        self.hash = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        self.refs = _referenced_names(node)
+
+    def contains(self, line):
+        return isinstance(line, int) and self.start <= line <= self.end
+
+
+def _referenced_names(node):
+    names = set()
+    for sub in ast.walk(node):
+        if isinstance(sub, ast.Name) and isinstance(sub.ctx, ast.Load):
+            names.add(sub.id)
+    return names
+
+
+def _stub(defn):
+    """Tanımla aynı satır sayısını kaplayan, çağrılabilir ve çıkarımı belirsiz taslak."""
+    refs = ", ".join(sorted(defn.refs - {defn.name}))
+    span = defn.end - defn.start + 1
+    if isinstance(defn.node, ast.ClassDef):
+        if span < 3:
+            return None
+        stub = [
+            f"class {defn.name}:",
+            f"    def __init__(self, *args, **kwargs): self.refs = args[0]({refs})",
+            "    def __getattr__(self, item): return item",
+        ]
+    else:
+        prefix = "async def" if isinstance(defn.node, ast.AsyncFunctionDef) else "def"
+        stub = [f"{prefix} {defn.name}(*args, **kwargs): return args[0]({refs})"]
+    return "\n".join(stub + [""] * (span - len(stub))) + "\n"
+
+
+def _split(code):
+    lines = code.splitlines(keepends=True)
+    tree = ast.parse(code)
+    defs = [_Definition(node, lines) for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))]
+    skeleton_refs = set()
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            skeleton_refs |= _referenced_names(node)
+    skeleton = list(lines)
+    for defn in defs:
+        skeleton[defn.start - 1:defn.end] = [""] * (defn.end - defn.start + 1)
+    skeleton_hash = hashlib.sha1("".join(l for l in skeleton if l.strip()).encode("utf-8")).hexdigest()
+    return lines, defs, skeleton_hash, skeleton_refs
+
+
+def _closure(seed, defs, skeleton_refs):
+    """
+    Değişen tanımlar + onları (dolaylı) kullananlar + bunların ve iskeletin doğrudan kullandıkları.
+    İskeletin kullandığı tanımlar da açık verilir; aksi halde iskeletteki bulgular (ör. no-member)
+    taslağa göre hesaplanırdı.
+    """
+    by_name = {}
+    for defn in defs:
+        by_name.setdefault(defn.name, []).append(defn)
+
+    selected = set(seed)
+    frontier = list(seed)
+    while frontier:  # bağımlılar (geçişli)
+        names = {defn.name for defn in frontier}
+        frontier = [d for d in defs if d not in selected and d.refs & names]
+        selected.update(frontier)
+    used = set(skeleton_refs)
+    for defn in selected:  # kullanılan tanımlar (imza / sınıf yapısı doğru kalsın)
+        used |= defn.refs
+    for name in used:
+        selected.update(by_name.get(name, []))
+    return selected
+
+
+def _shift(finding, delta):
+    item = dict(finding)
+    for field in ("line", "endLine"):
+        if isinstance(item.get(field), int):
+            item[field] += delta
+    return item
+
+
+class SessionStore:
+    def __init__(self, ttl=SESSION_TTL, max_sessions=SESSION_MAX):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()  # session_id -> (zaman, iskelet hash'i, {tanım hash'i: bulgular})
+        self._lock = threading.Lock()
+
+    def get(self, session_id):
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None or time.time() - entry[0] > self.ttl:
+                self._sessions.pop(session_id, None)
+                return None
+            return entry
+
+    def put(self, session_id, skeleton_hash, def_findings):
+        with self._lock:
+            self._sessions[session_id] = (time.time(), skeleton_hash, def_findings)
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+
+sessions = SessionStore()
+
+
+def lint_incremental(session_id, code, lint):
+    """
+    lint(kod) -> pylint JSON dict listesi. Oturumdaki önceki revizyona göre yalnızca
+    gerekli bölgeleri lint eder; pylint çıktısıyla aynı şekilde (satırlar bu revizyona göre) döndürür.
+    """
+    lines, defs, skeleton_hash, skeleton_refs = _split(code)
+    previous = sessions.get(session_id)
+
+    if previous is None or previous[1] != skeleton_hash:
+        stubbed = set()
+        source = code
+    else:
+        cached = previous[2]
+        changed = [d for d in defs if d.hash not in cached]
+        keep = _closure(changed, defs, skeleton_refs)
+        stubbed = set()
+        parts = []
+        cursor = 1
+        for defn in defs:
+            stub = None if defn in keep else _stub(defn)
+            if stub is None:
+                continue
+            parts.append("".join(lines[cursor - 1:defn.start - 1]))
+            parts.append(stub)
+            cursor = defn.end + 1
+            stubbed.add(defn)
+        parts.append("".join(lines[cursor - 1:]))
+        source = "".join(parts)
+
+    fresh = lint(source)
+
+    findings = []
+    def_findings = {}
+    for defn in defs:
+        if defn in stubbed:
+            rel = previous[2][defn.hash]
+        else:
+            rel = [_shift(f, -defn.start) for f in fresh if defn.contains(f.get("line"))]
+        def_findings[defn.hash] = rel
+        findings.extend(_shift(f, defn.start) for f in rel)
+    # iskelete (hiçbir tanıma) düşen bulgular her zaman taze çalıştırmadan gelir
+    findings.extend(f for f in fresh if not any(d.contains(f.get("line")) for d in defs))
+    findings.sort(key=lambda f: (f.get("line") if isinstance(f.get("line"), int) else 0, f.get("column") or 0))
+
+    sessions.put(session_id, skeleton_hash, def_findings)
+    return findings
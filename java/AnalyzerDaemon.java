@@ -0,0 +1,687 @@
+// AnalyzerDaemon.java
+// Uzun ömürlü JVM yardımcı süreci: javac (javax.tools, bellekte) + Checkstyle + main çalıştırma.
+// Python tarafı (java_daemon.py) stdin/stdout üzerinden konuşur.
+//
+// Protokol (UTF-8):
+//   PING\n                              -> PONG\n
+//   ANALYZE <göreli yol> <bayt>\n<kaynak> -> satırlar..., END\n
+//   RUN <göreli yol> <kaynak bayt> <stdin bayt> <süre ms> <saklanan bayt> <çıktı sınırı bayt>\n<kaynak><stdin>
+//                                        -> satırlar..., END\n
+// Cevap satırları (alanlar TAB ile ayrılır, mesajlardaki \ \n \t kaçışlanır):
+//   COMPILE\tok|fail
+//   E\t<satır>\t<mesaj>                       derleme hatası
+//   CS\t<satır>\t<seviye>\t<kaynak>\t<mesaj>  checkstyle bulgusu
+//   CSRAW\t<mesaj>                            checkstyle çalıştırılamadı
+//   CSMISSING                                 checkstyle veya config yok
+//   T\t<aşama>\t<mikrosaniye>                 aşama süresi (javac, checkstyle, run)
+//   RUN\t<durum>\t<çıkış kodu>\t<cpu µs>\t<stdout bayt>\t<stderr bayt>
+//                                             durum: ok|exit|exception|timeout|output|nomain
+//   OUT\t<base64> / ERR\t<base64>             stdout / stderr'in ilk <saklanan bayt> kadarı
+//   RESTART                                   JVM bu cevaptan sonra kapanır (zaman aşımı, bellek
+//                                             taşması); Python tarafı yenisini başlatır
+//
+// RUN: her çalıştırma yeni bir ClassLoader'da (üstü platform loader'ı; daemon sınıfları
+// görünmez) ve kendi ThreadGroup'unda çalışır; System.in/out/err yönlendirilir. Kullanıcı
+// sınıfları izinsiz bir ProtectionDomain'de tanımlanır (yalnızca sistem özelliklerini
+// okuyabilir); SecurityManager yığındaki bu alan yüzünden dosya, ağ, süreç, yansıtma
+// (suppressAccessChecks), sınıf yükleyici ve fd erişimini reddeder. Kullanıcı kodunun
+// başlattığı thread'ler bu bağlamı devralır ve yalnızca kendi SubmissionGroup'unda
+// oluşturulabilir. System.exit çıkış kodu olarak raporlanır. Çalıştırmadan sonra grupta ya
+// da dışında yeni bir thread yaşıyorsa JVM yenilenir (RESTART).
+import com.puppycrawl.tools.checkstyle.Checker;
+import com.puppycrawl.tools.checkstyle.ConfigurationLoader;
+import com.puppycrawl.tools.checkstyle.PropertiesExpander;
+import com.puppycrawl.tools.checkstyle.api.AuditEvent;
+import com.puppycrawl.tools.checkstyle.api.AuditListener;
+import com.puppycrawl.tools.checkstyle.api.Configuration;
+
+import java.io.BufferedInputStream;
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.File;
+import java.io.FileDescriptor;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.lang.management.ManagementFactory;
+import java.lang.management.ThreadMXBean;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.lang.reflect.Modifier;
+import java.net.URI;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.security.CodeSource;
+import java.security.Permission;
+import java.security.Permissions;
+import java.security.Policy;
+import java.security.ProtectionDomain;
+import java.security.cert.Certificate;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Base64;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Locale;
+import java.util.Map;
+import java.util.PropertyPermission;
+import java.util.Set;
+import java.util.concurrent.atomic.AtomicLong;
+import javax.tools.Diagnostic;
+import javax.tools.DiagnosticCollector;
+import javax.tools.FileObject;
+import javax.tools.ForwardingJavaFileManager;
+import javax.tools.JavaCompiler;
+import javax.tools.JavaFileObject;
+import javax.tools.SimpleJavaFileObject;
+import javax.tools.StandardJavaFileManager;
+import javax.tools.ToolProvider;
+
+public final class AnalyzerDaemon {
+
+    private static final JavaCompiler COMPILER = ToolProvider.getSystemJavaCompiler();
+    // JDK sınıf indeksini sıcak tutmak için tüm isteklerde aynı file manager kullanılır
+    private static final StandardJavaFileManager STANDARD_FM =
+            COMPILER.getStandardFileManager(null, Locale.ROOT, StandardCharsets.UTF_8);
+    // RUN: aynı kaynak (ör. /judge'daki her test durumu) yeniden derlenmez
+    private static final int COMPILED_CACHE = 16;
+    private static final ThreadMXBean THREADS = ManagementFactory.getThreadMXBean();
+
+    private final PrintStream out;
+    private final Path workDir;
+    private final Checker checker;
+    private final List<AuditEvent> events = new ArrayList<>();
+    private final List<String> checkerExceptions = new ArrayList<>();
+    private final Map<String, Compiled> compiled = new LinkedHashMap<>(COMPILED_CACHE, 0.75f, true) {
+        @Override
+        protected boolean removeEldestEntry(Map.Entry<String, Compiled> eldest) {
+            return size() > COMPILED_CACHE;
+        }
+    };
+    private RunGuard guard;  // ilk RUN'da kurulur; yalnızca analiz yapan daemon'da hiç kurulmaz
+
+    private AnalyzerDaemon(PrintStream out, Path workDir, Checker checker) {
+        this.out = out;
+        this.workDir = workDir;
+        this.checker = checker;
+        if (checker != null) {
+            checker.addListener(new Collector());
+        }
+    }
+
+    public static void main(String[] args) throws Exception {
+        // Protokol için gerçek stdout; başka kodun yazdıkları stderr'e gider
+        PrintStream protocol = new PrintStream(new FileOutputStream(FileDescriptor.out), false, "UTF-8");
+        System.setOut(System.err);
+
+        Path workDir = Files.createTempDirectory("javad-");
+        Checker checker = null;
+        if (args.length > 0 && new File(args[0]).isFile()) {
+            try {
+                Configuration config = ConfigurationLoader.loadConfiguration(
+                        args[0], new PropertiesExpander(System.getProperties()));
+                checker = new Checker();
+                checker.setModuleClassLoader(Checker.class.getClassLoader());
+                checker.configure(config);
+            } catch (Exception e) {
+                System.err.println("Checkstyle yüklenemedi: " + e);
+                checker = null;
+            }
+        }
+
+        new AnalyzerDaemon(protocol, workDir, checker).serve(new BufferedInputStream(System.in));
+    }
+
+    private void serve(InputStream in) throws IOException {
+        String header;
+        while ((header = readLine(in)) != null) {
+            if (header.equals("PING")) {
+                out.print("PONG\n");
+            } else if (header.startsWith("ANALYZE ")) {
+                String[] parts = header.split(" ");
+                byte[] source = in.readNBytes(Integer.parseInt(parts[2]));
+                analyze(parts[1], new String(source, StandardCharsets.UTF_8));
+                out.print("END\n");
+            } else if (header.startsWith("RUN ")) {
+                String[] parts = header.split(" ");
+                byte[] source = in.readNBytes(Integer.parseInt(parts[2]));
+                byte[] stdin = in.readNBytes(Integer.parseInt(parts[3]));
+                boolean restart = run(parts[1], new String(source, StandardCharsets.UTF_8), stdin,
+                        Long.parseLong(parts[4]), Integer.parseInt(parts[5]), Long.parseLong(parts[6]));
+                out.print(restart ? "RESTART\nEND\n" : "END\n");
+                out.flush();
+                if (restart) {
+                    // durdurulamayan kullanıcı thread'leri / dolmuş heap: temiz bir JVM'le devam edilir
+                    Runtime.getRuntime().halt(0);
+                }
+            } else {
+                out.print("ERR\tunknown command\nEND\n");
+            }
+            out.flush();
+        }
+    }
+
+    private static Compiled compile(String relPath, String code) {
+        MemoryFileManager fm = new MemoryFileManager(STANDARD_FM);
+        DiagnosticCollector<JavaFileObject> diagnostics = new DiagnosticCollector<>();
+        long started = System.nanoTime();
+        boolean ok = COMPILER.getTask(null, fm, diagnostics, List.of("-Xlint:all", "-proc:none"),
+                null, List.of(new Source(relPath, code))).call();
+        Compiled result = new Compiled(ok, (System.nanoTime() - started) / 1000);
+        for (Diagnostic<? extends JavaFileObject> d : diagnostics.getDiagnostics()) {
+            if (d.getKind() == Diagnostic.Kind.ERROR) {
+                result.errors.add("E\t" + lineOf(d.getLineNumber()) + "\t"
+                        + escape("error: " + d.getMessage(Locale.ROOT)) + "\n");
+            }
+        }
+        if (ok) {
+            fm.classes.forEach((name, output) -> result.classes.put(name, output.bytes.toByteArray()));
+        }
+        return result;
+    }
+
+    private boolean printCompiled(Compiled c, boolean fresh) {
+        if (fresh) {
+            out.print("T\tjavac\t" + c.micros + "\n");
+        }
+        out.print("COMPILE\t" + (c.ok ? "ok" : "fail") + "\n");
+        if (!c.ok) {
+            c.errors.forEach(out::print);
+        }
+        return c.ok;
+    }
+
+    private void analyze(String relPath, String code) throws IOException {
+        if (!printCompiled(compile(relPath, code), true)) {
+            return;
+        }
+
+        if (checker == null) {
+            out.print("CSMISSING\n");
+            return;
+        }
+
+        // Checkstyle dosya ister: tekrar kullanılan çalışma dizinine yaz, sonra sil
+        Path file = workDir.resolve(relPath).normalize();
+        if (!file.startsWith(workDir)) {
+            out.print("CSRAW\tinvalid path\n");
+            return;
+        }
+        Files.createDirectories(file.getParent());
+        Files.writeString(file, code, StandardCharsets.UTF_8);
+        events.clear();
+        checkerExceptions.clear();
+        long started = System.nanoTime();
+        try {
+            checker.process(List.of(file.toFile()));
+        } catch (Exception e) {
+            checkerExceptions.add(String.valueOf(e));
+        } finally {
+            Files.deleteIfExists(file);
+        }
+        out.print("T\tcheckstyle\t" + (System.nanoTime() - started) / 1000 + "\n");
+
+        if (!checkerExceptions.isEmpty()) {
+            out.print("CSRAW\t" + escape(String.join("\n", checkerExceptions)) + "\n");
+            return;
+        }
+        for (AuditEvent e : events) {
+            out.print("CS\t" + lineOf(e.getLine()) + "\t" + e.getSeverityLevel().getName() + "\t"
+                    + escape(e.getSourceName()) + "\t" + escape(e.getMessage()) + "\n");
+        }
+    }
+
+    /** RUN: derlenmiş main'i yalıtılmış olarak çalıştırır; true dönerse JVM cevaptan sonra kapanır. */
+    private boolean run(String relPath, String code, byte[] stdin, long timeLimitMs, int keepBytes,
+                        long outputLimit) {
+        if (guard == null) {
+            guard = RunGuard.install();
+            if (guard == null) {
+                out.print("ERR\tsecurity manager unavailable\n");
+                return false;
+            }
+        }
+        String key = relPath + "\n" + code;
+        Compiled c = compiled.get(key);
+        boolean fresh = c == null;
+        if (fresh) {
+            c = compile(relPath, code);
+            compiled.put(key, c);
+        }
+        if (!printCompiled(c, fresh)) {
+            return false;
+        }
+
+        SubmissionLoader loader = new SubmissionLoader(c.classes);
+        Method main = findMain(loader, relPath, c.classes.keySet());
+        if (main == null) {
+            out.print("RUN\tnomain\t1\t0\t0\t0\nOUT\t\nERR\t\n");
+            return false;
+        }
+
+        Set<Thread> known = new HashSet<>(liveThreads());
+        AtomicLong written = new AtomicLong();
+        BoundedOutput stdout = new BoundedOutput(keepBytes, written, outputLimit);
+        BoundedOutput stderr = new BoundedOutput(keepBytes, written, outputLimit);
+        SubmissionGroup group = new SubmissionGroup();
+        RunGuard.active = group;
+        Thread thread = new Thread(group, () -> group.invoke(main), "main");
+        thread.setContextClassLoader(loader);
+
+        InputStream savedIn = System.in;
+        PrintStream savedOut = System.out;
+        PrintStream savedErr = System.err;
+        System.setIn(new ByteArrayInputStream(stdin));
+        System.setOut(new PrintStream(stdout, false, StandardCharsets.UTF_8));
+        System.setErr(new PrintStream(stderr, true, StandardCharsets.UTF_8));
+        long started = System.nanoTime();
+        long deadline = started + timeLimitMs * 1_000_000L;
+        boolean finished;
+        try {
+            thread.start();
+            finished = group.await(thread, deadline);
+        } finally {
+            System.out.flush();
+            stdout.armed = false;
+            stderr.armed = false;
+            System.setIn(savedIn);
+            System.setOut(savedOut);
+            System.setErr(savedErr);
+        }
+        long wallMicros = (System.nanoTime() - started) / 1000;
+
+        String status = "ok";
+        int exitCode = 0;
+        boolean restart = false;
+        if (!finished) {
+            // süre doldu (ya da main bitti ama başlattığı thread'ler sürüyor): JVM yenilenir
+            status = "timeout";
+            exitCode = -1;
+            restart = true;
+        } else if (stdout.exceeded || stderr.exceeded) {
+            status = "output";
+            exitCode = -1;
+        } else if (group.exitCode != null) {
+            exitCode = group.exitCode;
+            status = exitCode == 0 ? "ok" : "exit";
+        } else if (group.error != null) {
+            status = "exception";
+            exitCode = 1;
+            // JVM'in kendi biçimi: Exception in thread "main" ... (yansıtma çerçeveleri atılır)
+            PrintStream trace = new PrintStream(stderr, true, StandardCharsets.UTF_8);
+            trace.print("Exception in thread \"main\" ");
+            trimReflection(group.error);
+            group.error.printStackTrace(trace);
+            restart = group.error instanceof OutOfMemoryError;
+        }
+        if (group.activeCount() > 0) {
+            restart = true;  // System.exit sonrası hâlâ çalışan kullanıcı thread'leri
+        }
+        for (Thread t : liveThreads()) {
+            if (!known.contains(t)) {
+                // çalıştırmadan kalan her thread (daemon da olsa, grubun dışında da olsa) sonraki
+                // gönderimin stdin/stdout'una erişebilir
+                restart = true;
+            }
+        }
+        long cpuMicros = group.cpuNanos >= 0 && finished ? group.cpuNanos / 1000 : wallMicros;
+
+        out.print("T\trun\t" + wallMicros + "\n");
+        out.print("RUN\t" + status + "\t" + exitCode + "\t" + cpuMicros + "\t" + stdout.total + "\t"
+                + stderr.total + "\n");
+        out.print("OUT\t" + Base64.getEncoder().encodeToString(stdout.kept.toByteArray()) + "\n");
+        out.print("ERR\t" + Base64.getEncoder().encodeToString(stderr.kept.toByteArray()) + "\n");
+        return restart;
+    }
+
+    private static Method findMain(ClassLoader loader, String relPath, Iterable<String> classNames) {
+        // önce dosya adındaki (public) sınıf, sonra derlenen diğer sınıflar
+        List<String> candidates = new ArrayList<>();
+        candidates.add(relPath.replace('/', '.').replaceAll("\\.java$", ""));
+        classNames.forEach(candidates::add);
+        for (String name : candidates) {
+            try {
+                Method main = Class.forName(name, false, loader).getDeclaredMethod("main", String[].class);
+                if (Modifier.isStatic(main.getModifiers())) {
+                    main.setAccessible(true);
+                    return main;
+                }
+            } catch (ReflectiveOperationException | LinkageError e) {
+                // bu sınıfta main yok
+            }
+        }
+        return null;
+    }
+
+    private static List<Thread> liveThreads() {
+        ThreadGroup root = Thread.currentThread().getThreadGroup();
+        while (root.getParent() != null) {
+            root = root.getParent();
+        }
+        Thread[] threads = new Thread[root.activeCount() + 16];
+        int count = root.enumerate(threads, true);
+        return Arrays.asList(threads).subList(0, count);
+    }
+
+    private static void trimReflection(Throwable error) {
+        StackTraceElement[] frames = error.getStackTrace();
+        for (int i = 0; i < frames.length; i++) {
+            String className = frames[i].getClassName();
+            if (className.startsWith("jdk.internal.reflect.") || className.startsWith("java.lang.reflect.")) {
+                error.setStackTrace(Arrays.copyOf(frames, i));
+                return;
+            }
+        }
+    }
+
+    private static String lineOf(long line) {
+        return line > 0 ? Long.toString(line) : "?";
+    }
+
+    private static String escape(String s) {
+        if (s == null) {
+            return "";
+        }
+        return s.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "").replace("\t", "\\t");
+    }
+
+    private static String readLine(InputStream in) throws IOException {
+        ByteArrayOutputStream buf = new ByteArrayOutputStream();
+        int b;
+        while ((b = in.read()) != -1) {
+            if (b == '\n') {
+                return buf.toString(StandardCharsets.UTF_8);
+            }
+            buf.write(b);
+        }
+        return buf.size() > 0 ? buf.toString(StandardCharsets.UTF_8) : null;
+    }
+
+    private final class Collector implements AuditListener {
+        @Override public void auditStarted(AuditEvent event) { }
+        @Override public void auditFinished(AuditEvent event) { }
+        @Override public void fileStarted(AuditEvent event) { }
+        @Override public void fileFinished(AuditEvent event) { }
+
+        @Override
+        public void addError(AuditEvent event) {
+            events.add(event);
+        }
+
+        @Override
+        public void addException(AuditEvent event, Throwable throwable) {
+            checkerExceptions.add(String.valueOf(throwable));
+        }
+    }
+
+    /** Bellekteki kaynak dosya. */
+    static final class Source extends SimpleJavaFileObject {
+        private final String code;
+
+        Source(String relPath, String code) {
+            super(URI.create("string:///" + relPath), Kind.SOURCE);
+            this.code = code;
+        }
+
+        @Override
+        public CharSequence getCharContent(boolean ignoreEncodingErrors) {
+            return code;
+        }
+    }
+
+    /** Derlenen sınıfın bayt kodu diske değil belleğe yazılır. */
+    static final class ClassOutput extends SimpleJavaFileObject {
+        final ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+
+        ClassOutput(String className) {
+            super(URI.create("mem:///" + className.replace('.', '/') + ".class"), Kind.CLASS);
+        }
+
+        @Override
+        public OutputStream openOutputStream() {
+            return bytes;
+        }
+    }
+
+    static final class MemoryFileManager extends ForwardingJavaFileManager<StandardJavaFileManager> {
+        final Map<String, ClassOutput> classes = new HashMap<>();
+
+        MemoryFileManager(StandardJavaFileManager delegate) {
+            super(delegate);
+        }
+
+        @Override
+        public JavaFileObject getJavaFileForOutput(Location location, String className,
+                                                   JavaFileObject.Kind kind, FileObject sibling) {
+            ClassOutput output = new ClassOutput(className);
+            classes.put(className, output);
+            return output;
+        }
+
+        @Override
+        public void close() {
+            // Paylaşılan STANDARD_FM kapatılmamalı
+        }
+    }
+
+    /** Derleme sonucu (RUN önbelleğinde tutulur). */
+    static final class Compiled {
+        final boolean ok;
+        final long micros;
+        final List<String> errors = new ArrayList<>();
+        final Map<String, byte[]> classes = new HashMap<>();
+
+        Compiled(boolean ok, long micros) {
+            this.ok = ok;
+            this.micros = micros;
+        }
+    }
+
+    /** Her çalıştırmaya ayrı sınıf yükleyici: statik durum çalıştırmalar arasında taşınmaz. */
+    static final class SubmissionLoader extends ClassLoader {
+        // statik izinler: Policy sorulmaz, kullanıcı sınıfları yalnızca sistem özelliklerini okuyabilir
+        static final ProtectionDomain DOMAIN = new ProtectionDomain(
+                new CodeSource(null, (Certificate[]) null), submissionPermissions());
+
+        private final Map<String, byte[]> classes;
+
+        SubmissionLoader(Map<String, byte[]> classes) {
+            super("submission", ClassLoader.getPlatformClassLoader());
+            this.classes = classes;
+        }
+
+        @Override
+        protected Class<?> findClass(String name) throws ClassNotFoundException {
+            byte[] bytes = classes.get(name);
+            if (bytes == null) {
+                throw new ClassNotFoundException(name);
+            }
+            return defineClass(name, bytes, 0, bytes.length, DOMAIN);
+        }
+
+        private static Permissions submissionPermissions() {
+            Permissions permissions = new Permissions();
+            permissions.add(new PropertyPermission("*", "read"));
+            permissions.setReadOnly();
+            return permissions;
+        }
+    }
+
+    /** Kullanıcı kodunun thread'leri; RunGuard'ın thread kısıtlamaları bu grup (ve alt grupları) için geçerlidir. */
+    static final class SubmissionGroup extends ThreadGroup {
+        volatile Integer exitCode;
+        volatile Throwable error;
+        volatile long cpuNanos = -1;
+
+        SubmissionGroup() {
+            super("submission");
+        }
+
+        void invoke(Method main) {
+            try {
+                main.invoke(null, (Object) new String[0]);
+            } catch (InvocationTargetException e) {
+                if (!(e.getCause() instanceof ExitTrap)) {
+                    error = e.getCause();
+                }
+            } catch (ExitTrap e) {
+                // System.exit statik başlatıcıda
+            } catch (Throwable e) {
+                error = e instanceof ExceptionInInitializerError && e.getCause() instanceof ExitTrap ? null : e;
+            } finally {
+                cpuNanos = THREADS.isCurrentThreadCpuTimeSupported() ? THREADS.getCurrentThreadCpuTime() : -1;
+            }
+        }
+
+        /** main ve başlattığı thread'ler süre içinde biterse true. */
+        boolean await(Thread main, long deadline) {
+            try {
+                long remaining = deadline - System.nanoTime();
+                if (remaining > 0) {
+                    main.join(remaining / 1_000_000L, (int) (remaining % 1_000_000L));
+                }
+                while (activeCount() > 0 && System.nanoTime() < deadline && exitCode == null) {
+                    Thread.sleep(2);
+                }
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+            }
+            return exitCode != null || !main.isAlive() && activeCount() == 0;
+        }
+
+        @Override
+        public void uncaughtException(Thread t, Throwable e) {
+            if (!(e instanceof ExitTrap)) {
+                super.uncaughtException(t, e);  // yönlendirilmiş System.err'e yazar
+            }
+        }
+    }
+
+    /** System.exit'i kullanıcı thread'inde durdurur; çıkış kodu SubmissionGroup'a yazılır. */
+    static final class ExitTrap extends SecurityException {
+        ExitTrap(int status) {
+            super("System.exit(" + status + ")");
+        }
+    }
+
+    static final class RunGuard extends SecurityManager {
+        static RunGuard install() {
+            try {
+                // SubmissionLoader.DOMAIN dışındaki her alan (JDK, daemon) tüm izinlere sahiptir
+                Policy.setPolicy(new Policy() {
+                    @Override
+                    public boolean implies(ProtectionDomain domain, Permission permission) {
+                        return domain != SubmissionLoader.DOMAIN;
+                    }
+                });
+                RunGuard guard = new RunGuard();
+                System.setSecurityManager(guard);
+                return guard;
+            } catch (UnsupportedOperationException | SecurityException e) {
+                // JDK 24+: SecurityManager yok; RUN reddedilir (Python tarafı Judge0'a düşer)
+                System.err.println("SecurityManager kurulamadı: " + e);
+                return null;
+            }
+        }
+
+        // daemon çalıştırmaları sırayla yapar; son çalıştırmanın grubu (kalan thread'ler JVM'i yeniletir)
+        static volatile SubmissionGroup active;
+
+        private static SubmissionGroup submission() {
+            SubmissionGroup group = active;
+            // parentOf üst grupları alanla gezer; getParent ise checkAccess çağırıp buraya döner
+            return group != null && group.parentOf(Thread.currentThread().getThreadGroup()) ? group : null;
+        }
+
+        private static boolean within(ThreadGroup g, SubmissionGroup own) {
+            return g != null && own.parentOf(g);
+        }
+
+        // checkPermission varsayılan davranışta kalır (AccessController): yığında ya da thread'in
+        // devraldığı bağlamda kullanıcı sınıfı varsa izin yalnızca SubmissionLoader.DOMAIN'e göre
+        // verilir; JDK'nın doPrivileged blokları (ör. lambda üretimi) etkilenmez.
+
+        /**
+         * Kullanıcı thread'leri yalnızca kendi gruplarında thread / grup oluşturup değiştirebilir
+         * (ortak ForkJoinPool'un kendi grubunda thread açması da reddedilir).
+         */
+        @Override
+        public void checkAccess(ThreadGroup g) {
+            SubmissionGroup own = submission();
+            if (own == null) {
+                super.checkAccess(g);
+            } else if (!within(g, own)) {
+                throw new SecurityException("Bu thread grubuna erişime izin verilmiyor: " + g.getName());
+            }
+        }
+
+        @Override
+        public void checkAccess(Thread t) {
+            SubmissionGroup own = submission();
+            if (own == null) {
+                super.checkAccess(t);
+            } else if (!within(t.getThreadGroup(), own)) {
+                throw new SecurityException("Bu thread'e erişime izin verilmiyor: " + t.getName());
+            }
+        }
+
+        @Override
+        public void checkExit(int status) {
+            SubmissionGroup group = submission();
+            if (group == null) {
+                super.checkExit(status);  // yığında kullanıcı kodu varsa reddedilir
+                return;
+            }
+            if (group.exitCode == null) {
+                group.exitCode = status;
+            }
+            throw new ExitTrap(status);
+        }
+    }
+
+    /** İlk keep baytı saklar, tümünü sayar; toplam çıktı sınırı aşılınca kullanıcı thread'ini durdurur. */
+    static final class BoundedOutput extends OutputStream {
+        final ByteArrayOutputStream kept = new ByteArrayOutputStream();
+        private final int keep;
+        private final AtomicLong written;  // stdout + stderr
+        private final long limit;
+        volatile boolean armed = true;
+        volatile boolean exceeded;
+        long total;
+
+        BoundedOutput(int keep, AtomicLong written, long limit) {
+            this.keep = keep;
+            this.written = written;
+            this.limit = limit;
+        }
+
+        @Override
+        public void write(int b) {
+            write(new byte[] {(byte) b}, 0, 1);
+        }
+
+        @Override
+        public synchronized void write(byte[] b, int off, int len) {
+            total += len;
+            int room = keep - kept.size();
+            if (room > 0) {
+                kept.write(b, off, Math.min(room, len));
+            }
+            if (written.addAndGet(len) > limit && armed) {
+                exceeded = true;
+                throw new OutputLimitError();
+            }
+        }
+    }
+
+    static final class OutputLimitError extends Error {
+        OutputLimitError() {
+            super("output limit exceeded");
+        }
+    }
+}
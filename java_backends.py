@@ -0,0 +1,269 @@
+# java_backends.py
+"""
+Java analizi için arka uç yönlendirici: yerel javac + checkstyle (java_runner) veya Judge0.
+
+Her arka uç için kayan istatistikler tutulur: EWMA gecikme, EWMA hata oranı ve
+admission kuyruğundaki derinlik. Her istek beklenen süresi en düşük sağlıklı arka
+uca gider; altyapı hatası olursa sıradaki denenir. Art arda hatalar ya da aşırı
+yavaşlık devre kesiciyi açar: arka uç JAVA_BREAKER_COOLDOWN saniye atlanır, sonra
+tek bir deneme isteğiyle (half-open) yeniden sınanır.
+
+İki arka uç da aynı şemayı döndürür:
+    {"backend": "local" | "judge0",
+     "compiled": bool,
+     "compilation_errors": [{error_type, line, original_message, explanation, solution}],
+     "checkstyle": [...],   # yalnızca yerel arka uç doldurur
+     "run": {status, stdout, stderr, time, memory, truncated?} | None}   # Judge0 durum nesnesiyle
+
+Yerel arka uç kodu JVM havuzunda (java_runner.run_java) çalıştırır; havuz
+kullanılamıyorsa "run" None kalır.
+
+JAVA_BACKEND=local veya judge0 yönlendirmeyi tek arka uca sabitler (varsayılan: auto).
+İstatistikler gunicorn worker'ı (süreç) başınadır.
+"""
+import os
+import re
+import shutil
+import threading
+import time
+
+import requests
+
+from admission import BackendBusy, limit, limiters
+from java_daemon import JavaDaemonUnavailable
+from java_runner import analyze_java, run_java
+from judge0_client import run_code_on_judge0, JUDGE0_BASE
+from metrics import count_timeout
+
+JAVA_BACKEND = os.environ.get("JAVA_BACKEND", "auto").lower()
+JAVA_EWMA_ALPHA = float(os.environ.get("JAVA_EWMA_ALPHA", 0.2))
+JAVA_BREAKER_FAILURES = int(os.environ.get("JAVA_BREAKER_FAILURES", 3))  # art arda hata
+JAVA_BREAKER_ERROR_RATE = float(os.environ.get("JAVA_BREAKER_ERROR_RATE", 0.5))
+JAVA_BREAKER_SLOW = float(os.environ.get("JAVA_BREAKER_SLOW", 15))  # saniye (EWMA gecikme)
+JAVA_BREAKER_COOLDOWN = float(os.environ.get("JAVA_BREAKER_COOLDOWN", 30))  # saniye
+
+# Judge0 durum kodları: 3 Accepted, 4 Wrong Answer, 6 Compilation Error, 7-12 Runtime Error.
+# Zaman aşımı (5) ve iç hatalar (13, 14) yük/altyapıya bağlı olduğu için önbelleğe alınmaz.
+JUDGE0_CACHEABLE_STATUSES = {3, 4, 6, 7, 8, 9, 10, 11, 12}
+JUDGE0_INTERNAL_ERRORS = {13, 14}
+
+
+class JavaBackendsUnavailable(Exception):
+    pass
+
+
+class _BackendFailure(Exception):
+    """Arka ucun kendisinden kaynaklanan (kullanıcı kodundan bağımsız) hata."""
+
+
+# ----------------- Normalize şema -----------------
+def _compilation_error(line, message, explanation="Java derleyicisi hata raporu verdi.",
+                       solution="Hata mesajına göre kodu düzeltin."):
+    return {"error_type": "CompilationError", "line": line, "original_message": message,
+            "explanation": explanation, "solution": solution}
+
+
+def _run_fields(resp):
+    run = {field: resp.get(field) for field in ("status", "stdout", "stderr", "time", "memory")}
+    if resp.get("truncated"):
+        run["truncated"] = resp["truncated"]  # metin alanları baş/son olarak kısaltılmış
+    return run
+
+
+def normalize_local(result, run=None):
+    return {
+        "backend": "local",
+        "compiled": result["compiled"],
+        "compilation_errors": result.get("compilation_errors", []),
+        "checkstyle": result.get("checkstyle", []),
+        "run": _run_fields(run) if run is not None else None,
+    }
+
+
+def normalize_judge0(resp):
+    status = resp.get("status") or {}
+    if status.get("id") == 6:
+        output = resp.get("compile_output") or ""
+        # örnek: Main.java:3: error: ';' expected
+        errors = [_compilation_error(int(m.group(1)), m.group(2).strip())
+                  for m in re.finditer(r'^\S*\.java:(\d+):\s*(.*)$', output, flags=re.M)]
+        if not errors:
+            errors.append(_compilation_error("?", output.strip(), "Java kodu derlenemedi.",
+                                             "Derleyici çıktısını kontrol edin."))
+        return {"backend": "judge0", "compiled": False, "compilation_errors": errors, "checkstyle": [], "run": None}
+
+    return {"backend": "judge0", "compiled": True, "compilation_errors": [], "checkstyle": [],
+            "run": _run_fields(resp)}
+
+
+def is_cacheable(result):
+    # Zaman aşımı ve beklenmeyen hatalar sunucu yüküne bağlı; önbelleğe alınmaz
+    for err in result.get("compilation_errors", []):
+        if err.get("error_type") != "CompilationError":
+            return False
+    for item in result.get("checkstyle", []):
+        if item.get("message") == "Checkstyle timeout":
+            return False
+    run = result.get("run")
+    if run is not None and (run.get("status") or {}).get("id") not in JUDGE0_CACHEABLE_STATUSES:
+        return False
+    return True
+
+
+# ----------------- Arka uçlar -----------------
+class Backend:
+    name = None
+    limiter = None  # admission arka ucu (kuyruk derinliği için)
+    prior_latency = 1.0  # ilk ölçümden önceki tahmin (saniye)
+
+    def __init__(self):
+        self.latency = self.prior_latency
+        self.error_rate = 0.0
+        self.failures = 0  # art arda
+        self.opened_at = None  # devre kesici açıldığı an (None: kapalı)
+        self.probing = False
+        self._lock = threading.Lock()
+
+    def available(self):
+        return True
+
+    def run(self, code):
+        raise NotImplementedError
+
+    def allow(self):
+        """Kapalıysa True; açıksa bekleme süresi dolunca tek bir deneme isteğine izin verir."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self.probing or time.monotonic() - self.opened_at < JAVA_BREAKER_COOLDOWN:
+                return False
+            self.probing = True
+            return True
+
+    def release_probe(self):
+        with self._lock:
+            self.probing = False
+
+    def record(self, seconds, ok):
+        with self._lock:
+            self.latency += JAVA_EWMA_ALPHA * (seconds - self.latency)
+            self.error_rate += JAVA_EWMA_ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+            self.failures = 0 if ok else self.failures + 1
+            self.probing = False
+            if ok and self.latency < JAVA_BREAKER_SLOW:
+                self.opened_at = None
+            elif (self.failures >= JAVA_BREAKER_FAILURES or self.error_rate >= JAVA_BREAKER_ERROR_RATE
+                  or self.latency >= JAVA_BREAKER_SLOW or self.opened_at is not None):
+                # half-open denemesi başarısızsa yeniden açılır
+                self.opened_at = time.monotonic()
+
+    def expected_cost(self):
+        """Beklenen süre: gecikme × (önde bekleyen iş / eşzamanlılık)."""
+        queue = limiters[self.limiter].stats()
+        ahead = max(0, queue["active"] + queue["waiting"] + 1 - queue["concurrency"])
+        return self.latency * (1 + ahead / queue["concurrency"])
+
+    def stats(self):
+        with self._lock:
+            return {"latency": round(self.latency, 4), "error_rate": round(self.error_rate, 4),
+                    "breaker_open": int(self.opened_at is not None)}
+
+
+class LocalBackend(Backend):
+    name = "local"
+    limiter = "javac"
+    prior_latency = 0.5
+
+    def available(self):
+        return shutil.which("javac") is not None
+
+    def run(self, code):
+        result = analyze_java(code)  # javac yuvası alınamazsa BackendBusy
+        for err in result.get("compilation_errors", []):
+            if err.get("error_type") not in ("CompilationError", "TimeoutError"):
+                raise _BackendFailure(err.get("original_message", ""))
+        run = None
+        if result["compiled"]:
+            try:
+                run = run_java(code)  # java-run yuvası alınamazsa BackendBusy
+            except JavaDaemonUnavailable:
+                pass  # java var ama çalıştırma havuzu yok: yalnızca derleme + checkstyle
+        return normalize_local(result, run)
+
+
+class Judge0Backend(Backend):
+    name = "judge0"
+    limiter = "judge0"
+    prior_latency = 2.0
+
+    def available(self):
+        return bool(JUDGE0_BASE)
+
+    def run(self, code):
+        with limit("judge0"):
+            resp = run_code_on_judge0(code, language_substr="java", wait=True, cpu_time_limit=2.0)
+        if not isinstance(resp, dict) or resp.get("error"):
+            raise _BackendFailure((resp or {}).get("error", "Judge0 cevabı okunamadı."))
+        status_id = (resp.get("status") or {}).get("id")
+        if status_id in JUDGE0_INTERNAL_ERRORS:
+            raise _BackendFailure((resp.get("status") or {}).get("description", "Judge0 iç hatası"))
+        if status_id == 5:  # Time Limit Exceeded
+            count_timeout("judge0_run")
+        return normalize_judge0(resp)
+
+
+class JavaRouter:
+    def __init__(self, backends, mode=JAVA_BACKEND):
+        self.backends = {backend.name: backend for backend in backends}
+        self.mode = mode
+
+    def _candidates(self):
+        if self.mode in self.backends:
+            return [self.backends[self.mode]]
+        healthy = [b for b in self.backends.values() if b.available()]
+        healthy.sort(key=lambda b: b.expected_cost())
+        return healthy
+
+    def _admit(self, backend):
+        # sabitlenmiş arka uç: devre kesici atlanmaz. Diğerlerinde allow() yalnızca
+        # denenecek arka uç için çağrılır; half-open deneme hakkı boşa tutulmaz.
+        return self.mode in self.backends or backend.allow()
+
+    def analyze(self, code):
+        """
+        Normalize sonuç döndürür. Tüm arka uçlar meşgulse BackendBusy, hiçbiri
+        kullanılamıyorsa JavaBackendsUnavailable fırlatır.
+        """
+        busy = None
+        errors = []
+        for backend in self._candidates():
+            if not self._admit(backend):
+                continue
+            started = time.monotonic()
+            try:
+                result = backend.run(code)
+            except BackendBusy as e:
+                backend.release_probe()
+                busy = e
+                continue
+            except (_BackendFailure, requests.exceptions.RequestException) as e:
+                backend.record(time.monotonic() - started, ok=False)
+                errors.append(f"{backend.name}: {e}")
+                continue
+            backend.record(time.monotonic() - started, ok=True)
+            return result
+
+        if busy is not None and not errors:
+            raise busy
+        raise JavaBackendsUnavailable("Java analizi için kullanılabilir arka uç yok"
+                                      + (" (" + "; ".join(errors) + ")" if errors else "."))
+
+    def stats(self):
+        return {name: backend.stats() for name, backend in self.backends.items()}
+
+
+router = JavaRouter([LocalBackend(), Judge0Backend()])
+
+
+def route_java(code):
+    return router.analyze(code)
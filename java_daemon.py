@@ -0,0 +1,360 @@
+# java_daemon.py
+"""
+java/AnalyzerDaemon.java için istemci.
+
+javac ve checkstyle'ı her istekte iki ayrı JVM olarak başlatmak yerine tek bir
+uzun ömürlü JVM'e stdin/stdout üzerinden kod gönderilir. Derleme bellekte
+(javax.tools) yapılır, Checkstyle config'i bir kez yüklenir.
+
+Kod çalıştırma (RUN) ayrı bir JVM havuzunda (JavaRunPool) yapılır: her JVM önceden
+başlatılmıştır; gönderim yeni bir ClassLoader'da, süre sınırıyla ve yönlendirilmiş
+stdin/stdout ile çalışır. Zaman aşımı ya da bellek taşmasından sonra JVM kendini
+kapatır, havuz yerine arka planda yenisini başlatır.
+
+Daemon ölürse / cevap vermezse öldürülür ve bir sonraki istekte yeniden
+başlatılır. Art arda başlatma hatalarında bir süre JavaDaemonUnavailable
+fırlatılır; java_runner bu durumda eski subprocess yoluna (çalıştırmada Judge0'a) döner.
+"""
+import base64
+import os
+import queue
+import selectors
+import shutil
+import subprocess
+import threading
+import time
+
+JAVA_DAEMON = os.environ.get("JAVA_DAEMON", "1") != "0"
+JAVA_DAEMON_CLASSES = os.environ.get(
+    "JAVA_DAEMON_CLASSES", os.path.join(os.path.dirname(os.path.abspath(__file__)), "java", "build"))
+JAVA_DAEMON_HEAP = os.environ.get("JAVA_DAEMON_HEAP", "256m")
+HEALTH_CHECK_IDLE = 30  # bu kadar saniye boşta kalan daemon kullanılmadan önce PING'lenir
+RESTART_BACKOFF = 60  # başlatma başarısız olursa bu kadar saniye subprocess yoluna düşülür
+JAVA_RUN_POOL_SIZE = int(os.environ.get("JAVA_RUN_POOL_SIZE", 2))  # admission'daki java-run eşzamanlılığı
+JAVA_RUN_HEAP = os.environ.get("JAVA_RUN_HEAP", "256m")
+JAVA_RUN_MAX_RUNS = int(os.environ.get("JAVA_RUN_MAX_RUNS", 500))  # bu kadar çalıştırmadan sonra JVM yenilenir
+JAVA_RUN_COMPILE_TIMEOUT = 6  # RUN cevabı için süre sınırına eklenen derleme payı (saniye)
+# RUN'da SecurityManager kurulur (JDK 18+ bu bayrak olmadan izin vermez)
+JAVA_RUN_JVM_ARGS = ("-Djava.security.manager=allow",)
+
+
+class JavaDaemonUnavailable(Exception):
+    pass
+
+
+class JavaDaemonTimeout(Exception):
+    pass
+
+
+def _unescape(s):
+    out = []
+    i = 0
+    while i < len(s):
+        c = s[i]
+        if c == "\\" and i + 1 < len(s):
+            nxt = s[i + 1]
+            out.append({"n": "\n", "t": "\t", "\\": "\\"}.get(nxt, nxt))
+            i += 2
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out)
+
+
+class JavaDaemon:
+    def __init__(self, checkstyle_jar=None, checkstyle_config=None, heap=JAVA_DAEMON_HEAP, jvm_args=()):
+        self.checkstyle_jar = checkstyle_jar
+        self.checkstyle_config = checkstyle_config
+        self.heap = heap
+        self.jvm_args = tuple(jvm_args)
+        self.runs = 0
+        self.proc = None
+        self.last_used = 0.0
+        self.failed_at = 0.0
+        self._buf = b""
+        self._lock = threading.Lock()
+        self._pid = None
+
+    # ----------------- süreç yönetimi -----------------
+    def _start(self):
+        if not os.path.exists(os.path.join(JAVA_DAEMON_CLASSES, "AnalyzerDaemon.class")):
+            raise JavaDaemonUnavailable("AnalyzerDaemon derlenmemiş")
+        classpath = JAVA_DAEMON_CLASSES
+        if self.checkstyle_jar and os.path.exists(self.checkstyle_jar):
+            classpath += os.pathsep + self.checkstyle_jar
+        self.proc = subprocess.Popen(
+            ["java", f"-Xmx{self.heap}", "-XX:+UseSerialGC", "-XX:TieredStopAtLevel=1", *self.jvm_args,
+             "-cp", classpath, "AnalyzerDaemon", *([self.checkstyle_config] if self.checkstyle_config else [])],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+        self.runs = 0
+        self._buf = b""
+        self._pid = os.getpid()
+        self.last_used = time.monotonic()
+
+    def _kill(self):
+        if self.proc is not None:
+            try:
+                self.proc.kill()
+                self.proc.wait(2)
+            except Exception:
+                pass
+        self.proc = None
+
+    def _ensure_running(self):
+        if self._pid != os.getpid():
+            # fork ile kopyalanan pipe'lar bu süreçte kullanılamaz
+            self.proc = None
+        if self.proc is not None and self.proc.poll() is None:
+            if time.monotonic() - self.last_used > HEALTH_CHECK_IDLE and not self.ping():
+                self._kill()
+            else:
+                return
+        if time.monotonic() - self.failed_at < RESTART_BACKOFF:
+            raise JavaDaemonUnavailable("daemon yakın zamanda başlatılamadı")
+        try:
+            self._start()
+            if not self.ping(timeout=20):  # ilk açılışta JVM ısınması
+                raise JavaDaemonUnavailable("daemon PING'e cevap vermedi")
+        except (OSError, JavaDaemonUnavailable):
+            self._kill()
+            self.failed_at = time.monotonic()
+            raise JavaDaemonUnavailable("daemon başlatılamadı")
+
+    # ----------------- protokol -----------------
+    def _send(self, data):
+        self.proc.stdin.write(data)
+        self.proc.stdin.flush()
+
+    def _read_line(self, deadline):
+        fd = self.proc.stdout.fileno()
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while b"\n" not in self._buf:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not sel.select(remaining):
+                    raise JavaDaemonTimeout()
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    raise JavaDaemonUnavailable("daemon kapandı")
+                self._buf += chunk
+        line, self._buf = self._buf.split(b"\n", 1)
+        return line.decode("utf-8", errors="replace")
+
+    def ping(self, timeout=2):
+        """Sağlık kontrolü: daemon PONG dönerse True."""
+        try:
+            self._send(b"PING\n")
+            return self._read_line(time.monotonic() + timeout) == "PONG"
+        except (OSError, JavaDaemonTimeout, JavaDaemonUnavailable):
+            return False
+
+    def _exchange(self, payload, timeout):
+        """İsteği gönderir; END'e kadarki cevap satırlarını (TAB ile bölünmüş) döndürür."""
+        try:
+            self._send(payload)
+            deadline = time.monotonic() + timeout
+            lines = []
+            while True:
+                fields = self._read_line(deadline).split("\t")
+                if fields[0] == "END":
+                    return lines
+                lines.append(fields)
+        except (JavaDaemonTimeout, JavaDaemonUnavailable):
+            # yarıda kalan cevap protokolü bozar; daemon yeniden başlatılır
+            self._kill()
+            raise
+        except OSError:
+            self._kill()
+            raise JavaDaemonUnavailable("daemon ile iletişim koptu")
+        finally:
+            self.last_used = time.monotonic()
+
+    def analyze(self, rel_path, code, timeout=6):
+        """
+        Kodu derler ve checkstyle'dan geçirir.
+        Döndürür: {"compiled": bool, "errors": [(satır, mesaj)], "checkstyle": [...], "checkstyle_raw": str|None,
+                   "checkstyle_missing": bool, "timing": {"javac": sn, "checkstyle": sn}}
+        """
+        with self._lock:
+            self._ensure_running()
+            source = code.encode("utf-8")
+            result = {"compiled": False, "errors": [], "checkstyle": [],
+                      "checkstyle_raw": None, "checkstyle_missing": False, "timing": {}}
+            lines = self._exchange(b"ANALYZE %s %d\n" % (rel_path.encode("utf-8"), len(source)) + source, timeout)
+            try:
+                for fields in lines:
+                    kind = fields[0]
+                    if kind == "COMPILE":
+                        result["compiled"] = fields[1] == "ok"
+                    elif kind == "E":
+                        result["errors"].append((_line(fields[1]), _unescape(fields[2])))
+                    elif kind == "CS":
+                        result["checkstyle"].append({
+                            "line": _line(fields[1]),
+                            "severity": fields[2],
+                            "source": _unescape(fields[3]),
+                            "message": _unescape(fields[4]),
+                        })
+                    elif kind == "CSRAW":
+                        result["checkstyle_raw"] = _unescape(fields[1])
+                    elif kind == "CSMISSING":
+                        result["checkstyle_missing"] = True
+                    elif kind == "T":
+                        result["timing"][fields[1]] = int(fields[2]) / 1e6
+            except (IndexError, ValueError):
+                self._kill()
+                raise JavaDaemonUnavailable("daemon ile iletişim koptu")
+            return result
+
+    def run(self, rel_path, code, stdin="", time_limit=2.0, keep_bytes=65536, output_limit=8 * 1024 * 1024):
+        """
+        Kodu derler (aynı kaynak daemon'da önbellekte kalır) ve main'i çalıştırır.
+        Döndürür: {"compiled": bool, "errors": [(satır, mesaj)], "status": ok|exit|exception|timeout|output|nomain,
+                   "exit_code": int, "cpu_time": sn, "stdout": bytes, "stderr": bytes,
+                   "stdout_bytes": int, "stderr_bytes": int, "timing": {"javac": sn, "run": sn}}
+        stdout / stderr'in ilk keep_bytes baytı döner; *_bytes toplam çıktıdır.
+        """
+        with self._lock:
+            self._ensure_running()
+            source = code.encode("utf-8")
+            data = (stdin or "").encode("utf-8")
+            header = b"RUN %s %d %d %d %d %d\n" % (rel_path.encode("utf-8"), len(source), len(data),
+                                                   int(time_limit * 1000), keep_bytes, output_limit)
+            # JVM süre sınırını kendisi uygular; bu süre yalnızca takılan bir daemon içindir
+            lines = self._exchange(header + source + data, time_limit + JAVA_RUN_COMPILE_TIMEOUT)
+            self.runs += 1
+            result = {"compiled": False, "errors": [], "status": None, "exit_code": None, "cpu_time": None,
+                      "stdout": b"", "stderr": b"", "stdout_bytes": 0, "stderr_bytes": 0, "timing": {}}
+            try:
+                for fields in lines:
+                    kind = fields[0]
+                    if kind == "COMPILE":
+                        result["compiled"] = fields[1] == "ok"
+                    elif kind == "E":
+                        result["errors"].append((_line(fields[1]), _unescape(fields[2])))
+                    elif kind == "RUN":
+                        result.update(status=fields[1], exit_code=int(fields[2]), cpu_time=int(fields[3]) / 1e6,
+                                      stdout_bytes=int(fields[4]), stderr_bytes=int(fields[5]))
+                    elif kind == "OUT":
+                        result["stdout"] = base64.b64decode(fields[1])
+                    elif kind == "ERR" and len(fields) > 1 and result["status"] is None:
+                        # komut hatası (ör. bu JDK'da SecurityManager yok): bir süre kullanılmaz
+                        self._kill()
+                        self.failed_at = time.monotonic()
+                        raise JavaDaemonUnavailable(f"RUN desteklenmiyor: {fields[1]}")
+                    elif kind == "ERR":
+                        result["stderr"] = base64.b64decode(fields[1])
+                    elif kind == "RESTART":
+                        self._kill()  # JVM cevaptan sonra kendini kapatır
+                    elif kind == "T":
+                        result["timing"][fields[1]] = int(fields[2]) / 1e6
+            except (IndexError, ValueError):
+                self._kill()
+                raise JavaDaemonUnavailable("daemon ile iletişim koptu")
+            return result
+
+
+def _line(value):
+    return int(value) if value.isdigit() else "?"
+
+
+_daemon = None
+_daemon_lock = threading.Lock()
+
+
+def get_daemon(checkstyle_jar, checkstyle_config):
+    global _daemon
+    if not JAVA_DAEMON:
+        raise JavaDaemonUnavailable("JAVA_DAEMON=0")
+    with _daemon_lock:
+        if _daemon is None:
+            _daemon = JavaDaemon(checkstyle_jar, checkstyle_config)
+    return _daemon
+
+
+# ----------------- Çalıştırma havuzu -----------------
+class JavaRunPool:
+    """
+    Kod çalıştırmak için önceden başlatılmış JVM'ler. Eşzamanlılık admission'daki
+    java-run sınırıyla belirlenir; havuzdan alınamayan istek JavaDaemonUnavailable alır.
+    Yeniden başlatılması gereken JVM'in yerine yenisi arka planda ısıtılır.
+    """
+
+    def __init__(self, size=JAVA_RUN_POOL_SIZE, max_runs=JAVA_RUN_MAX_RUNS):
+        self.size = max(1, size)
+        self.max_runs = max_runs
+        self._idle = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # fork sonrası: üst sürecin JVM'leri bu süreçte kullanılamaz
+            self._idle = queue.Queue()
+            self._pid = os.getpid()
+            for _ in range(self.size):
+                self._replace(None)
+
+    def _replace(self, daemon):
+        """Havuza taze bir JVM koyar; başlatma arka planda yapılır."""
+        if daemon is not None:
+            daemon._kill()
+        fresh = JavaDaemon(heap=JAVA_RUN_HEAP, jvm_args=JAVA_RUN_JVM_ARGS)
+        if daemon is not None:
+            fresh.failed_at = daemon.failed_at  # başlatılamayan JVM için bekleme süresi korunur
+        threading.Thread(target=_warm, args=(fresh,), daemon=True).start()
+        self._idle.put(fresh)
+
+    def run(self, rel_path, code, stdin="", time_limit=2.0, keep_bytes=65536, output_limit=8 * 1024 * 1024):
+        """JavaDaemon.run; havuzdaki boş bir JVM'de çalışır."""
+        self._ensure_started()
+        idle = self._idle
+        try:
+            daemon = idle.get(timeout=time_limit + JAVA_RUN_COMPILE_TIMEOUT)
+        except queue.Empty:
+            raise JavaDaemonUnavailable("çalıştırma havuzunda boş JVM yok")
+        try:
+            return daemon.run(rel_path, code, stdin, time_limit, keep_bytes, output_limit)
+        finally:
+            if daemon.proc is None or daemon.runs >= self.max_runs:
+                self._replace(daemon)
+            else:
+                idle.put(daemon)
+
+    def prestart(self):
+        """JVM'leri ilk istekten önce başlatır (gunicorn post_fork)."""
+        self._ensure_started()
+
+
+def _warm(daemon):
+    with daemon._lock:
+        try:
+            daemon._ensure_running()
+        except JavaDaemonUnavailable:
+            pass  # ilk istek hatayı görür, çağıran Judge0'a döner
+
+
+_run_pool = None
+
+
+def get_run_pool():
+    global _run_pool
+    if not JAVA_DAEMON or JAVA_RUN_POOL_SIZE <= 0:
+        raise JavaDaemonUnavailable("yerel Java çalıştırma kapalı")
+    with _daemon_lock:
+        if _run_pool is None:
+            _run_pool = JavaRunPool()
+    return _run_pool
+
+
+def prestart():
+    """java kuruluysa çalıştırma havuzunu ısıtır; yoksa hiçbir şey yapmaz."""
+    if shutil.which("java") is None:
+        return
+    try:
+        get_run_pool().prestart()
+    except JavaDaemonUnavailable:
+        pass
@@ -1,15 +1,29 @@
 # java_runner.py
-import tempfile
 import os
 import subprocess
 import re
-import shutil
 import xml.etree.ElementTree as ET
 import resource
+from java_daemon import get_daemon, get_run_pool, JavaDaemonUnavailable, JavaDaemonTimeout
+from admission import limit
+from metrics import stage_timer, observe_stage, count_timeout
+import scratch
+from sandbox import run_subprocess
+from capture import CAPTURE_HEAD_BYTES, CAPTURE_OUTPUT_LIMIT
 
 # resource limits (saniye / byte)
 CPU_TIME_LIMIT = 4       # CPU seconds
 ADDRESS_SPACE_LIMIT = 300 * 1024 * 1024  # 300 MB
+JAVA_OUTPUT_HEAD_BYTES = int(os.environ.get("JAVA_OUTPUT_HEAD_MB", 4)) * 1024 * 1024
+JAVA_OUTPUT_LIMIT = int(os.environ.get("JAVA_OUTPUT_LIMIT_MB", 16)) * 1024 * 1024
+JAVA_RUN_TIME_LIMIT = float(os.environ.get("JAVA_RUN_TIME_LIMIT", 2.0))  # CPU saniyesi (Judge0 cpu_time_limit)
+
+# Yerel çalıştırma sonucu Judge0 durumlarıyla döner (index.html / judge aynı alanları okur)
+_STATUS_ACCEPTED = {"id": 3, "description": "Accepted"}
+_STATUS_TLE = {"id": 5, "description": "Time Limit Exceeded"}
+_STATUS_CE = {"id": 6, "description": "Compilation Error"}
+_STATUS_NZEC = {"id": 11, "description": "Runtime Error (NZEC)"}
+_STATUS_OTHER = {"id": 12, "description": "Runtime Error (Other)"}
 
 def _limit_resources():
     # Only works on Unix (Docker Linux). Limits apply to child process.
@@ -19,13 +33,98 @@ def _limit_resources():
     except Exception:
         pass
 
+CHECKSTYLE_JAR = "/usr/local/bin/checkstyle.jar"
+CHECKSTYLE_CONFIG = "/usr/local/etc/checkstyle/google_checks.xml"
+
 def _run_with_limits(cmd, cwd=None, timeout=6):
-    proc = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd,
-                          timeout=timeout, preexec_fn=_limit_resources)
-    return proc
+    # Çıktı sınırlı tamponlarla okunur; checkstyle XML'i ayrıştırılabilsin diye baş kısmı geniş tutulur
+    return run_subprocess(cmd, timeout=timeout, cwd=cwd, limits=_limit_resources,
+                          head_bytes=JAVA_OUTPUT_HEAD_BYTES, output_limit=JAVA_OUTPUT_LIMIT)
+
+def _java_rel_path(code):
+    """Kaynağın package/public class'ına göre göreli dosya yolu (ör. com/x/Main.java)."""
+    class_match = re.search(r'public\s+class\s+([A-Za-z_]\w*)', code)
+    classname = class_match.group(1) if class_match else "Main"
+    pkg_match = re.search(r'^\s*package\s+([\w.]+)\s*;', code, flags=re.M)
+    if pkg_match:
+        return os.path.join(*pkg_match.group(1).split('.'), f"{classname}.java")
+    return f"{classname}.java"
+
+def _analyze_with_daemon(code, timeout):
+    """Sıcak JVM daemon'ı ile analiz; daemon yoksa JavaDaemonUnavailable fırlatır."""
+    rel_path = _java_rel_path(code)
+    try:
+        res = get_daemon(CHECKSTYLE_JAR, CHECKSTYLE_CONFIG).analyze(rel_path, code, timeout=timeout)
+    except JavaDaemonTimeout:
+        count_timeout("javac")
+        return {
+            "compiled": False,
+            "compilation_errors": [{
+                "error_type": "TimeoutError",
+                "line": "?",
+                "original_message": "javac timed out",
+                "explanation": "Derleme zaman aşımına uğradı.",
+                "solution": "Kodu basitleştirin veya timeout'u artırın."
+            }]
+        }
+
+    for stage, seconds in res["timing"].items():  # daemon'un ölçtüğü javac / checkstyle süreleri
+        observe_stage(stage, seconds)
+
+    if not res["compiled"]:
+        errors = [{
+            "error_type": "CompilationError",
+            "line": line_no,
+            "original_message": msg,
+            "explanation": "Java derleyicisi hata raporu verdi.",
+            "solution": "Hata mesajına göre kodu düzeltin."
+        } for line_no, msg in res["errors"]]
+        if not errors:
+            errors.append({
+                "error_type": "CompilationError",
+                "line": "?",
+                "original_message": "",
+                "explanation": "Java kodu derlenemedi.",
+                "solution": "Derleyici çıktısını kontrol edin."
+            })
+        return {"compiled": False, "compilation_errors": errors}
+
+    if res["checkstyle_missing"]:
+        checkstyle_results = [{
+            "file": rel_path,
+            "line": "?",
+            "severity": "warning",
+            "message": "Checkstyle veya config bulunamadı (sunucuda yüklü olmalı)."
+        }]
+    elif res["checkstyle_raw"] is not None:
+        checkstyle_results = [{
+            "file": rel_path,
+            "line": "?",
+            "severity": "info",
+            "message": res["checkstyle_raw"]
+        }]
+    else:
+        checkstyle_results = [dict(item, file=rel_path) for item in res["checkstyle"]]
+
+    return {
+        "compiled": True,
+        "compilation_errors": [],
+        "checkstyle": checkstyle_results
+    }
 
 def analyze_java(code: str, timeout: int = 6):
-    temp_dir = tempfile.mkdtemp(prefix="java-")
+    """javac yuvası alınamazsa admission.BackendBusy fırlatır."""
+    with limit("javac"):
+        return _analyze_java(code, timeout)
+
+def _analyze_java(code: str, timeout: int):
+    try:
+        return _analyze_with_daemon(code, timeout)
+    except JavaDaemonUnavailable:
+        pass  # eski yol: her istekte javac + checkstyle JVM'leri
+
+    # tmpfs üzerinde yeniden kullanılan dizin (her istekte mkdtemp/rmtree yok)
+    temp_dir = scratch.acquire("java")
     try:
         # package detection
         pkg_match = re.search(r'^\s*package\s+([\w.]+)\s*;', code, flags=re.M)
@@ -50,8 +149,10 @@ def analyze_java(code: str, timeout: int = 6):
         # compile with javac -Xlint:all
         compile_cmd = ["javac", "-Xlint:all", java_file]
         try:
-            compile_proc = _run_with_limits(compile_cmd, cwd=temp_dir, timeout=timeout)
+            with stage_timer("javac"):
+                compile_proc = _run_with_limits(compile_cmd, cwd=temp_dir, timeout=timeout)
         except subprocess.TimeoutExpired:
+            count_timeout("javac")
             return {
                 "compiled": False,
                 "compilation_errors": [{
@@ -88,15 +189,17 @@ def analyze_java(code: str, timeout: int = 6):
             return {"compiled": False, "compilation_errors": errors}
 
         # derleme başarılı -> checkstyle çalıştır (checkstyle.jar ve config önceden Docker içinde konumlandırılmalı)
-        checkstyle_jar = "/usr/local/bin/checkstyle.jar"
-        checkstyle_config = "/usr/local/etc/checkstyle/google_checks.xml"
+        checkstyle_jar = CHECKSTYLE_JAR
+        checkstyle_config = CHECKSTYLE_CONFIG
         checkstyle_results = []
         if os.path.exists(checkstyle_jar) and os.path.exists(checkstyle_config):
             # checkstyle xml format output
             cs_cmd = ["java", "-jar", checkstyle_jar, "-c", checkstyle_config, "-f", "xml", java_file]
             try:
-                cs_proc = _run_with_limits(cs_cmd, cwd=temp_dir, timeout=timeout)
+                with stage_timer("checkstyle"):
+                    cs_proc = _run_with_limits(cs_cmd, cwd=temp_dir, timeout=timeout)
             except subprocess.TimeoutExpired:
+                count_timeout("checkstyle")
                 return {
                     "compiled": True,
                     "compilation_errors": [],
@@ -155,7 +258,165 @@ def analyze_java(code: str, timeout: int = 6):
             }]
         }
     finally:
+        scratch.release("java", temp_dir)
+
+def analyze_java_project(files, timeout=20):
+    """
+    Çok dosyalı Java projesi ({göreli yol: kaynak}) tek javac çalıştırmasında derlenir,
+    başarılıysa tüm dosyalar tek checkstyle çalıştırmasından geçer.
+    {"compiled": bool, "files": {yol: [bulgu]}, "checkstyle": {yol: [...]}} döndürür.
+    javac yuvası alınamazsa admission.BackendBusy fırlatır.
+    """
+    with limit("javac"):
+        return _analyze_java_project(files, timeout)
+
+def _project_path(root, path):
+    return os.path.relpath(path, root).replace(os.sep, "/")
+
+def _analyze_java_project(files, timeout):
+    result = {"compiled": False, "files": {path: [] for path in files}, "checkstyle": {path: [] for path in files}}
+    work_dir = scratch.acquire("java-project")
+    try:
+        src_dir = os.path.join(work_dir, "src")
+        out_dir = os.path.join(work_dir, "out")
+        os.makedirs(out_dir)
+        sources = []
+        for path, code in files.items():
+            target = os.path.join(src_dir, *path.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "w", encoding="utf-8") as f:
+                f.write(code)
+            sources.append(target)
+
+        compile_cmd = ["javac", "-Xlint:all", "-d", out_dir, "-sourcepath", src_dir] + sources
         try:
-            shutil.rmtree(temp_dir)
-        except Exception:
-            pass
+            with stage_timer("javac"):
+                compile_proc = _run_with_limits(compile_cmd, cwd=work_dir, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            count_timeout("javac")
+            result["compilation_errors"] = [{
+                "error_type": "TimeoutError",
+                "line": "?",
+                "original_message": "javac timed out",
+                "explanation": "Derleme zaman aşımına uğradı.",
+                "solution": "Kodu basitleştirin veya timeout'u artırın."
+            }]
+            return result
+
+        # örnek: /dev/shm/.../src/com/x/Main.java:3: error: ';' expected
+        for line in (compile_proc.stderr or compile_proc.stdout or "").splitlines():
+            m = re.match(r'^(.+\.java):(\d+):\s*(.*)$', line)
+            if not m:
+                continue
+            path = _project_path(src_dir, m.group(1))
+            if path in result["files"] and not m.group(3).startswith("warning"):
+                result["files"][path].append({
+                    "error_type": "CompilationError",
+                    "line": int(m.group(2)),
+                    "original_message": m.group(3).strip(),
+                    "explanation": "Java derleyicisi hata raporu verdi.",
+                    "solution": "Hata mesajına göre kodu düzeltin."
+                })
+        result["compiled"] = compile_proc.returncode == 0
+        if not result["compiled"]:
+            if not any(result["files"].values()):
+                result["compilation_errors"] = [{
+                    "error_type": "CompilationError",
+                    "line": "?",
+                    "original_message": (compile_proc.stderr or compile_proc.stdout or "").strip(),
+                    "explanation": "Java kodu derlenemedi.",
+                    "solution": "Derleyici çıktısını kontrol edin."
+                }]
+            return result
+
+        if not (os.path.exists(CHECKSTYLE_JAR) and os.path.exists(CHECKSTYLE_CONFIG)):
+            return result
+        cs_cmd = ["java", "-jar", CHECKSTYLE_JAR, "-c", CHECKSTYLE_CONFIG, "-f", "xml"] + sources
+        try:
+            with stage_timer("checkstyle"):
+                cs_proc = _run_with_limits(cs_cmd, cwd=work_dir, timeout=timeout)
+            root = ET.fromstring(cs_proc.stdout or cs_proc.stderr or "")
+        except subprocess.TimeoutExpired:
+            count_timeout("checkstyle")
+            return result
+        except ET.ParseError:
+            return result
+        for file_el in root.findall('file'):
+            path = _project_path(src_dir, file_el.get('name'))
+            for err in file_el.findall('error'):
+                result["checkstyle"].setdefault(path, []).append({
+                    "line": int(err.get('line')) if err.get('line') and err.get('line').isdigit() else "?",
+                    "severity": err.get('severity'),
+                    "message": err.get('message'),
+                    "source": err.get('source')
+                })
+        return result
+    finally:
+        scratch.release("java-project", work_dir)
+
+def run_java(code, stdin="", time_limit=JAVA_RUN_TIME_LIMIT, head_bytes=CAPTURE_HEAD_BYTES,
+             output_limit=CAPTURE_OUTPUT_LIMIT):
+    """
+    Kodu önceden başlatılmış JVM havuzunda (java_daemon.JavaRunPool) derleyip çalıştırır.
+    Judge0 gönderimiyle aynı alanları döndürür:
+        {"status": {"id", "description"}, "stdout", "stderr", "compile_output", "message",
+         "time", "memory", "truncated"?, "output_limit_exceeded"?}
+    java-run yuvası alınamazsa BackendBusy, havuz kullanılamazsa JavaDaemonUnavailable fırlatır.
+    """
+    with limit("java-run"):
+        return _run_java(code, stdin, time_limit, head_bytes, output_limit)
+
+def _decode_output(data, total):
+    text = data.decode("utf-8", errors="replace")
+    if total > len(data):
+        # JVM yalnızca baş kısmı döndürür (capture.OutputBuffer ile aynı işaret)
+        text += f"\n...[{total - len(data)} bytes omitted]...\n"
+    return text or None  # Judge0 boş akışı null döndürür
+
+def _run_java(code, stdin, time_limit, head_bytes, output_limit):
+    rel_path = _java_rel_path(code)
+    try:
+        res = get_run_pool().run(rel_path, code, stdin, time_limit, head_bytes, output_limit)
+    except JavaDaemonTimeout:
+        # JVM süre sınırında cevap vermedi (öldürüldü, havuz yenisini başlatır)
+        count_timeout("java_run")
+        return {"status": _STATUS_TLE, "stdout": None, "stderr": None, "compile_output": None,
+                "message": None, "time": f"{time_limit:.3f}", "memory": None}
+
+    for stage, seconds in res["timing"].items():  # daemon'un ölçtüğü javac / run süreleri
+        observe_stage(stage if stage == "javac" else "java_run", seconds)
+
+    result = {"status": None, "stdout": None, "stderr": None, "compile_output": None,
+              "message": None, "time": None, "memory": None}
+    if not res["compiled"]:
+        # javac çıktısı biçiminde (java_backends.normalize_judge0 aynı kalıpla ayrıştırır)
+        file_name = os.path.basename(rel_path)
+        result["compile_output"] = "\n".join(f"{file_name}:{line_no}: {msg}" for line_no, msg in res["errors"])
+        result["status"] = _STATUS_CE
+        return result
+
+    result["stdout"] = _decode_output(res["stdout"], res["stdout_bytes"])
+    result["stderr"] = _decode_output(res["stderr"], res["stderr_bytes"])
+    result["time"] = f"{res['cpu_time']:.3f}"
+    truncated = [field for field in ("stdout", "stderr") if res[f"{field}_bytes"] > len(res[field])]
+    if truncated:
+        result["truncated"] = truncated
+
+    status = res["status"]
+    if status == "ok":
+        result["status"] = _STATUS_ACCEPTED
+    elif status == "timeout":
+        count_timeout("java_run")
+        result["status"] = _STATUS_TLE
+    elif status == "output":
+        result["status"] = _STATUS_OTHER
+        result["message"] = "Output limit exceeded"
+        result["output_limit_exceeded"] = True
+    elif status == "nomain":
+        result["status"] = _STATUS_NZEC
+        result["stderr"] = f"Error: Main method not found in {rel_path}"
+        result["message"] = "Exited with error status 1"
+    else:  # exit / exception
+        result["status"] = _STATUS_NZEC
+        result["message"] = f"Exited with error status {res['exit_code']}"
+    return result
@@ -0,0 +1,379 @@
+# judge.py
+"""
+Test durumlarıyla değerlendirme (/judge).
+
+Gönderim N test durumuna karşı çalıştırılır; her durumun stdin'i, beklenen çıktısı
+ve isteğe bağlı süre/bellek sınırı vardır. Kaynak bir kez hazırlanır:
+
+  * Python (yerel): kod bir kez derlenir, sözdizimi hatası tüm durumlar için CE
+    olur. Zygote derlenmiş kod nesnesini önbellekte tutar (cache_compiled); her
+    durum için fork edilen çocuk kodu derlenmiş olarak devralır. Durumlar
+    python-run yuvalarında paralel çalışır; istek en fazla JUDGE_MAX_PARALLEL
+    yuva tutar ve her yuva sıradaki durumu alır.
+  * Java (yerel): durumlar önceden başlatılmış JVM havuzunda (java_runner.run_java)
+    java-run yuvalarında paralel çalışır. Kaynak havuzdaki JVM'de bir kez derlenir
+    ve önbellekte kalır; derleme hatasında tüm durumlar CE olur. Sonuç Judge0
+    şemasında döndüğü için Judge0 ile aynı şekilde değerlendirilir. JVM yığını
+    paylaşıldığından durum başına bellek sınırı uygulanmaz; OutOfMemoryError MLE
+    sayılır. Havuz kullanılamıyorsa (java yok) Judge0'a düşülür.
+  * backend=judge0: tüm durumlar /submissions/batch ile Judge0'a gider ve
+    judge0_jobs poller'ı üzerinden toplu olarak beklenir. İlk derleme hatasında
+    kalan durumlar beklenmeden CE olarak işaretlenir.
+
+stop_on_failure ile ilk başarısız durumdan sonra henüz başlamamış durumlar
+çalıştırılmaz ("SKIPPED").
+
+Kararlar: AC, WA, TLE, MLE, OLE (çıktı sınırı), RE, CE, SKIPPED ve IE (Judge0 iç
+hatası / cevapsızlık). Çıktılar satır sonu boşlukları ve sondaki boş satırlar yok
+sayılarak karşılaştırılır. Çıktının yalnızca beklenen uzunluk + JUDGE_OUTPUT_SLACK
+kadarı saklanır; daha uzun (kısaltılmış) çıktı eşleşemeyeceği için WA sayılır.
+"""
+import contextvars
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import scratch
+from capture import OutputLimitExceeded, CAPTURE_OUTPUT_LIMIT
+from admission import BackendBusy, limit, limiters
+from metrics import stage_timer, count_timeout
+from sandbox import run_python, run_subprocess, SandboxUnavailable, SANDBOX_MEMORY_LIMIT
+
+JUDGE_MAX_CASES = int(os.environ.get("JUDGE_MAX_CASES", 50))
+JUDGE_MAX_CASE_BYTES = int(os.environ.get("JUDGE_MAX_CASE_BYTES", 1024 * 1024))  # stdin ve beklenen çıktı
+JUDGE_DEFAULT_TIME_LIMIT = float(os.environ.get("JUDGE_DEFAULT_TIME_LIMIT", 2))  # saniye
+JUDGE_MAX_TIME_LIMIT = float(os.environ.get("JUDGE_MAX_TIME_LIMIT", 10))
+JUDGE_MAX_MEMORY_MB = int(os.environ.get("JUDGE_MAX_MEMORY_MB", 512))
+JUDGE_MAX_PARALLEL = int(os.environ.get("JUDGE_MAX_PARALLEL", 4))
+JUDGE_OUTPUT_PREVIEW = int(os.environ.get("JUDGE_OUTPUT_PREVIEW", 1000))  # cevapta gösterilen karakter
+JUDGE_JUDGE0_WAIT = float(os.environ.get("JUDGE_JUDGE0_WAIT", 60))  # tüm batch için saniye
+# beklenen çıktının ötesinde saklanan bayt (sondaki boşluklar yok sayıldığı için biraz pay)
+JUDGE_OUTPUT_SLACK = int(os.environ.get("JUDGE_OUTPUT_SLACK", 4096))
+
+MB = 1024 * 1024
+
+# Judge0 durum kodu -> karar (3 Accepted çıktısı burada karşılaştırılır)
+JUDGE0_VERDICTS = {4: "WA", 5: "TLE", 6: "CE", 7: "RE", 8: "RE", 9: "RE", 10: "RE", 11: "RE", 12: "RE"}
+
+
+class JudgeError(ValueError):
+    pass
+
+
+# ----------------- Girdi -----------------
+def _clamp(value, default, low, high):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return default
+    return max(low, min(high, value))
+
+
+def parse_cases(raw, time_limit=None, memory_limit_mb=None):
+    """
+    [{"id", "stdin", "expected_output", "time_limit", "memory_limit_mb"}] listesini doğrular.
+    Durumda verilmeyen sınırlar için isteğin genel time_limit / memory_limit_mb değerleri kullanılır.
+    """
+    if not isinstance(raw, list) or not raw:
+        raise JudgeError("Test durumu gönderilmedi.")
+    if len(raw) > JUDGE_MAX_CASES:
+        raise JudgeError(f"En fazla {JUDGE_MAX_CASES} test durumu gönderilebilir.")
+    default_time = _clamp(time_limit, JUDGE_DEFAULT_TIME_LIMIT, 0.1, JUDGE_MAX_TIME_LIMIT)
+    default_memory = _clamp(memory_limit_mb, SANDBOX_MEMORY_LIMIT // MB, 16, JUDGE_MAX_MEMORY_MB)
+    cases = []
+    for index, item in enumerate(raw):
+        if not isinstance(item, dict):
+            raise JudgeError(f"Geçersiz test durumu: {index}")
+        stdin, expected = item.get("stdin", ""), item.get("expected_output", "")
+        if not isinstance(stdin, str) or not isinstance(expected, str):
+            raise JudgeError(f"stdin ve expected_output metin olmalı: {index}")
+        if max(len(stdin.encode("utf-8")), len(expected.encode("utf-8"))) > JUDGE_MAX_CASE_BYTES:
+            raise JudgeError(f"Test durumu en fazla {JUDGE_MAX_CASE_BYTES // 1024} KB olabilir: {index}")
+        cases.append({
+            "id": item.get("id", index),
+            "stdin": stdin,
+            "expected_output": expected,
+            "time_limit": _clamp(item.get("time_limit"), default_time, 0.1, JUDGE_MAX_TIME_LIMIT),
+            "memory_limit_mb": int(_clamp(item.get("memory_limit_mb"), default_memory, 16, JUDGE_MAX_MEMORY_MB)),
+        })
+    return cases
+
+
+# ----------------- Sonuç -----------------
+def _normalize_output(text):
+    lines = [line.rstrip() for line in (text or "").replace("\r\n", "\n").split("\n")]
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def outputs_match(actual, expected):
+    return _normalize_output(actual) == _normalize_output(expected)
+
+
+def _case_result(case, verdict, stdout=None, stderr=None, usage=None, error=None):
+    result = {"id": case["id"], "verdict": verdict, "usage": usage}
+    # AC'de çıktı beklenenle aynı; yalnızca hatalı durumlarda kısaltılmış olarak döner
+    if verdict not in ("AC", "SKIPPED", "CE"):
+        if stdout:
+            result["stdout"] = stdout[:JUDGE_OUTPUT_PREVIEW]
+        if stderr:
+            result["stderr"] = stderr[:JUDGE_OUTPUT_PREVIEW]
+    if error:
+        result["error"] = error
+    return result
+
+
+def summarize(cases):
+    """Genel karar: sıradaki ilk başarısız durumun kararı (atlananlar hariç), yoksa AC."""
+    verdict = next((c["verdict"] for c in cases if c["verdict"] not in ("AC", "SKIPPED")), "AC")
+    return {"verdict": verdict, "passed": sum(c["verdict"] == "AC" for c in cases), "total": len(cases)}
+
+
+# ----------------- Python (yerel sandbox) -----------------
+def _python_verdict(proc, case):
+    if proc.returncode == 0:
+        if "stdout" in proc.truncated:
+            return "WA"
+        return "AC" if outputs_match(proc.stdout, case["expected_output"]) else "WA"
+    if proc.returncode == -signal.SIGXCPU:
+        return "TLE"
+    last_line = proc.stderr.strip().splitlines()[-1:] or [""]
+    if proc.returncode < 0 or last_line[0].startswith("MemoryError"):
+        # bellek sınırında yorumlayıcı traceback yazamadan sinyalle ölebilir
+        return "MLE"
+    return "RE"
+
+
+def _run_python_case(code, script, case):
+    timeout = case["time_limit"]
+    memory_limit = case["memory_limit_mb"] * MB
+    head_bytes = len(case["expected_output"].encode("utf-8")) + JUDGE_OUTPUT_SLACK
+    try:
+        try:
+            proc = run_python(code, timeout=timeout, stdin=case["stdin"], memory_limit=memory_limit,
+                              cache_compiled=True, head_bytes=head_bytes)
+        except SandboxUnavailable:
+            proc = run_subprocess([sys.executable, script], timeout=timeout, input=case["stdin"],
+                                  memory_limit=memory_limit, head_bytes=head_bytes)
+    except subprocess.TimeoutExpired as e:
+        count_timeout("judge_run")
+        return _case_result(case, "TLE", e.output, e.stderr, getattr(e, "usage", None))
+    except OutputLimitExceeded as e:
+        return _case_result(case, "OLE", e.output, e.stderr, e.usage)
+    return _case_result(case, _python_verdict(proc, case), proc.stdout, proc.stderr, proc.usage)
+
+
+def judge_python(code, cases, stop_on_failure=False):
+    """{"cases": [...], "compile_error": [bulgu]?} döndürür; python-run yuvası alınamazsa BackendBusy."""
+    try:
+        compile(code, "<string>", "exec")
+    except (SyntaxError, ValueError) as e:
+        finding = {"error_type": type(e).__name__, "line": getattr(e, "lineno", None) or "?",
+                   "original_message": str(e), "stage": "syntax"}
+        return {"compile_error": [finding], "cases": [_case_result(case, "CE") for case in cases]}
+
+    results = [None] * len(cases)
+    pending = deque(enumerate(cases))
+    failed = threading.Event()
+    workers = max(1, min(JUDGE_MAX_PARALLEL, limiters["python-run"].concurrency, len(cases)))
+
+    with scratch.workspace("judge") as root, stage_timer("judge_run"):
+        # zygote kullanılamazsa çalıştırılacak dosya; tmpfs'e tek yazım, tüm durumlar kullanır
+        script = os.path.join(root, "main.py")
+        with open(script, "w", encoding="utf-8") as f:
+            f.write(code)
+
+        def worker():
+            with limit("python-run"):
+                while True:
+                    try:
+                        index, case = pending.popleft()
+                    except IndexError:
+                        return
+                    if failed.is_set():
+                        results[index] = _case_result(case, "SKIPPED")
+                        continue
+                    results[index] = _run_python_case(code, script, case)
+                    if stop_on_failure and results[index]["verdict"] != "AC":
+                        failed.set()
+
+        busy = None
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, worker) for _ in range(workers)]
+            for future in futures:
+                try:
+                    future.result()
+                except BackendBusy as e:
+                    busy = e
+        # yuva alabilen worker'lar kuyruğu bitirir; hiçbiri alamadıysa istek reddedilir
+        if any(result is None for result in results):
+            raise busy
+    return {"cases": results}
+
+
+# ----------------- Java (yerel JVM havuzu) -----------------
+def _java_case(case, resp):
+    if resp.get("output_limit_exceeded"):
+        return _case_result(case, "OLE", resp.get("stdout"), resp.get("stderr"))
+    if "java.lang.OutOfMemoryError" in (resp.get("stderr") or ""):
+        return _case_result(case, "MLE", resp.get("stdout"), resp.get("stderr"))
+    if (resp.get("status") or {}).get("id") == 5:
+        # zaman aşımı java_runner'da java_run olarak sayıldı
+        return _case_result(case, "TLE", resp.get("stdout"), resp.get("stderr"),
+                            {"cpu_time": float(resp["time"]), "wall_time": None, "peak_rss_kb": None})
+    return _judge0_case(case, resp)
+
+
+def judge_java(code, cases, stop_on_failure=False):
+    """
+    {"cases": [...], "compile_error": [...]?} döndürür; java-run yuvası alınamazsa BackendBusy,
+    JVM havuzu kullanılamazsa JavaDaemonUnavailable.
+    """
+    from java_backends import normalize_judge0
+    from java_runner import _run_java
+
+    results = [None] * len(cases)
+    pending = deque(enumerate(cases))
+    failed = threading.Event()
+    compile_error = []
+    workers = max(1, min(JUDGE_MAX_PARALLEL, limiters["java-run"].concurrency, len(cases)))
+
+    def worker():
+        with limit("java-run"):
+            while True:
+                try:
+                    index, case = pending.popleft()
+                except IndexError:
+                    return
+                if compile_error:
+                    # aynı kaynak: bir durum derlenemediyse hiçbiri derlenmez
+                    results[index] = _case_result(case, "CE")
+                    continue
+                if failed.is_set():
+                    results[index] = _case_result(case, "SKIPPED")
+                    continue
+                head_bytes = len(case["expected_output"].encode("utf-8")) + JUDGE_OUTPUT_SLACK
+                resp = _run_java(code, case["stdin"], case["time_limit"], head_bytes, CAPTURE_OUTPUT_LIMIT)
+                results[index] = _java_case(case, resp)
+                if results[index]["verdict"] == "CE" and not compile_error:
+                    compile_error.extend(normalize_judge0(resp)["compilation_errors"])
+                if stop_on_failure and results[index]["verdict"] != "AC":
+                    failed.set()
+
+    busy = None
+    with stage_timer("judge_run"), ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, worker) for _ in range(workers)]
+        for future in futures:
+            try:
+                future.result()
+            except BackendBusy as e:
+                busy = e
+    if any(result is None for result in results):
+        raise busy
+    result = {"cases": results}
+    if compile_error:
+        # durumlar paralel çalıştığı için CE'den önce başlamış durumlar da CE'dir
+        result["cases"] = [_case_result(case, "CE") for case in cases]
+        result["compile_error"] = compile_error
+    return result
+
+
+# ----------------- Judge0 (batch) -----------------
+def _judge0_case(case, resp):
+    status_id = (resp.get("status") or {}).get("id")
+    usage = {"cpu_time": float(resp["time"]) if resp.get("time") else None, "wall_time": None,
+             "peak_rss_kb": resp.get("memory")}
+    if status_id == 3:
+        if "stdout" in resp.get("truncated", ()):
+            verdict = "WA"
+        else:
+            verdict = "AC" if outputs_match(resp.get("stdout"), case["expected_output"]) else "WA"
+    else:
+        verdict = JUDGE0_VERDICTS.get(status_id, "IE")
+    if verdict == "TLE":
+        count_timeout("judge0_run")
+    error = (resp.get("status") or {}).get("description") if verdict == "IE" else None
+    return _case_result(case, verdict, resp.get("stdout"), resp.get("stderr") or resp.get("message"),
+                        usage, error)
+
+
+def judge_judge0(code, cases, language_substr="java", stop_on_failure=False):
+    """
+    Tüm durumları Judge0'a toplu gönderir. {"cases": [...], "compile_error": [...]?}
+    ya da {"error": ...} döndürür; Judge0'a ulaşılamazsa requests istisnası yükselir.
+    """
+    # Judge0 modülleri (requests) yalnızca bu yol kullanılınca yüklenir
+    from java_backends import normalize_judge0
+    from judge0_client import get_client
+    from judge0_jobs import job_store, JOB_BATCH_SIZE
+    tokens = []
+    with limit("judge0"):
+        for i in range(0, len(cases), JOB_BATCH_SIZE):
+            chunk = cases[i:i + JOB_BATCH_SIZE]
+            resp = get_client().submit_batch(code, [{"stdin": case["stdin"], "cpu_time_limit": case["time_limit"],
+                                                     "memory_limit": case["memory_limit_mb"] * 1024}
+                                                    for case in chunk], language_substr=language_substr)
+            if isinstance(resp, dict):
+                return resp  # dil bulunamadı
+            tokens.extend((item or {}).get("token") for item in resp)
+
+    jobs = [job_store.track(token) if token else None for token in tokens]
+    deadline = time.monotonic() + JUDGE_JUDGE0_WAIT
+    results, compile_error, failed = [], None, False
+    with stage_timer("judge0_batch"):
+        for case, job in zip(cases, jobs):
+            if compile_error is not None:
+                # aynı kaynak: bir durum derlenemediyse hiçbiri derlenmez
+                results.append(_case_result(case, "CE"))
+                continue
+            if job is None:
+                results.append(_case_result(case, "IE", error="Judge0 gönderimi kabul etmedi."))
+            else:
+                if not (failed and stop_on_failure):
+                    job.done.wait(max(0.0, deadline - time.monotonic()))
+                if job.done.is_set():
+                    results.append(_judge0_case(case, job.result))
+                    if results[-1]["verdict"] == "CE":
+                        compile_error = normalize_judge0(job.result)["compilation_errors"]
+                elif failed and stop_on_failure:
+                    results.append(_case_result(case, "SKIPPED"))
+                else:
+                    results.append(_case_result(case, "IE", error="Judge0 sonucu zamanında gelmedi."))
+            if results[-1]["verdict"] not in ("AC", "SKIPPED"):
+                failed = True
+
+    result = {"cases": results}
+    if compile_error is not None:
+        result["compile_error"] = compile_error
+    return result
+
+
+def judge(code, prog_lang, cases, stop_on_failure=False, backend="local"):
+    """
+    Gönderimi test durumlarıyla değerlendirir: {"backend", "verdict", "passed", "total",
+    "wall_time", "cases": [...], "compile_error"?} ya da {"error": ...}.
+    """
+    started = time.monotonic()
+    result = None
+    if prog_lang == "java" and backend != "judge0":
+        from java_daemon import JavaDaemonUnavailable
+        try:
+            result = judge_java(code, cases, stop_on_failure)
+            backend = "local"
+        except JavaDaemonUnavailable:
+            pass  # yerel JVM havuzu yok: Judge0
+    if result is None and (prog_lang == "java" or backend == "judge0"):
+        backend = "judge0"
+        result = judge_judge0(code, cases, "java" if prog_lang == "java" else "python", stop_on_failure)
+    elif result is None:
+        backend = "local"
+        result = judge_python(code, cases, stop_on_failure)
+    if result.get("error"):
+        return result
+    return dict(result, backend=backend, wall_time=round(time.monotonic() - started, 3), **summarize(result["cases"]))
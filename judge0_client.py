@@ -1,27 +1,218 @@
 # judge0_client.py
+import json
 import os
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from capture import clip_text
+from metrics import stage_timer, count_timeout
 
 # Varsayılan public Judge0 instance (hızlı test için). Üretimde kendi instance'ını veya API anahtarını kullan.
 JUDGE0_BASE = os.environ.get("JUDGE0_BASE", "https://ce.judge0.com")
 JUDGE0_API_KEY = os.environ.get("JUDGE0_API_KEY", "")  # opsiyonel
 
+# Bağlantı havuzu / dil tablosu önbelleği / tekrar deneme ayarları
+JUDGE0_POOL_SIZE = int(os.environ.get("JUDGE0_POOL_SIZE", 10))
+JUDGE0_LANGUAGES_TTL = float(os.environ.get("JUDGE0_LANGUAGES_TTL", 3600))  # saniye
+JUDGE0_RETRIES = int(os.environ.get("JUDGE0_RETRIES", 3))
+JUDGE0_BACKOFF = float(os.environ.get("JUDGE0_BACKOFF", 0.5))  # 0.5, 1, 2 ... saniye
+
+# Dil adının başı: "java" JavaScript'le, "python" Python 2 ile ("Python (2.7.17)") eşleşmesin
+LANGUAGE_NAME_PREFIXES = {"java": "java (", "python": "python (3"}
+
+# Sonuç okurken istenen alanlar (frontend'in kullandıkları + token)
+SUBMISSION_FIELDS = "token,stdout,stderr,compile_output,message,status,time,memory"
+
+# Cevaplar parça parça okunur; bu boyutu aşan cevap okunmaz (toplu sorguda 20 gönderim)
+JUDGE0_MAX_RESPONSE_BYTES = int(os.environ.get("JUDGE0_MAX_RESPONSE_MB", 32)) * 1024 * 1024
+# Metin alanlarından saklanan baş kısmı (Judge0'ın varsayılan çıktı sınırı 1 MB; sondan da bir parça tutulur)
+JUDGE0_OUTPUT_HEAD_BYTES = int(os.environ.get("JUDGE0_OUTPUT_HEAD_KB", 1024)) * 1024
+CLIPPED_FIELDS = ("stdout", "stderr", "compile_output", "message")
+
 HEADERS = {"Content-Type": "application/json"}
 if JUDGE0_API_KEY:
     HEADERS["X-Auth-Token"] = JUDGE0_API_KEY
 
+
+class Judge0ResponseTooLarge(requests.exceptions.RequestException):
+    pass
+
+
+def clip_submission(sub):
+    """Metin alanlarını baş/son kuralıyla kısaltır; kısaltılan alanlar "truncated" listesine yazılır."""
+    if not isinstance(sub, dict):
+        return sub
+    truncated = []
+    for field in CLIPPED_FIELDS:
+        if isinstance(sub.get(field), str):
+            sub[field], clipped = clip_text(sub[field], JUDGE0_OUTPUT_HEAD_BYTES)
+            if clipped:
+                truncated.append(field)
+    if truncated:
+        sub["truncated"] = truncated
+    return sub
+
+
+def _read_json(r):
+    """stream=True ile alınmış cevabı en fazla JUDGE0_MAX_RESPONSE_BYTES okuyarak çözer."""
+    try:
+        r.raise_for_status()
+        body = bytearray()
+        for chunk in r.iter_content(65536):
+            body += chunk
+            if len(body) > JUDGE0_MAX_RESPONSE_BYTES:
+                raise Judge0ResponseTooLarge(f"Judge0 cevabı {JUDGE0_MAX_RESPONSE_BYTES // (1024 * 1024)} MB'ı aşıyor.")
+    finally:
+        r.close()
+    return json.loads(bytes(body))
+
+
+class Judge0Client:
+    """
+    Keep-alive bağlantı havuzlu Judge0 istemcisi.
+    Dil tablosu bir kez çekilir ve TTL dolana kadar bellekte tutulur.
+    GET istekleri 429/5xx cevaplarında üstel bekleme ile tekrar denenir. POST (gönderim)
+    idempotent değildir: Judge0'ın kabul ettiği bir gönderim tekrarlanırsa kopya oluşur,
+    bu yüzden yalnızca bağlantı kurulamadığında (istek hiç gitmeden) tekrar denenir.
+    """
+
+    def __init__(self, base=JUDGE0_BASE, headers=None, pool_size=JUDGE0_POOL_SIZE,
+                 languages_ttl=JUDGE0_LANGUAGES_TTL, retries=JUDGE0_RETRIES, backoff=JUDGE0_BACKOFF):
+        self.base = base.rstrip("/")
+        self.languages_ttl = languages_ttl
+        self.session = requests.Session()
+        self.session.headers.update(headers or HEADERS)
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),  # bağlantı hataları her yöntemde tekrar denenir
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._languages = None
+        self._languages_loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def languages(self, refresh=False):
+        """Judge0 dil listesini döndürür (TTL süresince önbellekten)."""
+        with self._lock:
+            languages, loaded_at = self._languages, self._languages_loaded_at
+        if not refresh and languages is not None and time.monotonic() - loaded_at <= self.languages_ttl:
+            return languages
+        # İstek kilit dışında yapılır; süren bir yenileme diğer gönderimleri bekletmesin
+        r = self.session.get(f"{self.base}/languages", timeout=10)
+        r.raise_for_status()
+        languages = r.json()
+        with self._lock:
+            self._languages = languages
+            self._languages_loaded_at = time.monotonic()
+        return languages
+
+    def find_language_id(self, substr="java"):
+        """
+        Judge0'daki diller listesinden dile uyan ilk language_id'yi döndürür. Bilinen dillerde
+        (LANGUAGE_NAME_PREFIXES) ad o önekle başlamalıdır; diğerlerinde adın substr içermesi yeter.
+        """
+        prefix = LANGUAGE_NAME_PREFIXES.get(substr)
+        for item in self.languages():
+            for name in ((item.get("name") or "").lower(), (item.get("display_name") or "").lower()):
+                if name.startswith(prefix) if prefix else substr in name:
+                    return item.get("id")
+        return None
+
+    def submit(self, source_code, language_substr="java", stdin="", wait=True, cpu_time_limit=2.0):
+        with stage_timer("judge0_languages"):
+            lang_id = self.find_language_id(language_substr)
+        if not lang_id:
+            return {"error": "Judge0 üzerinde uygun language_id bulunamadı."}
+
+        url = f"{self.base}/submissions?base64_encoded=false&wait={'true' if wait else 'false'}"
+        payload = {
+            "source_code": source_code,
+            "language_id": lang_id,
+            "stdin": stdin,
+            # CPU limit string format bazı instance'larda farklı olabilir; Judge0 instance'ına göre uyarlayın
+            "cpu_time_limit": str(cpu_time_limit)
+        }
+
+        try:
+            with stage_timer("judge0_submit"):
+                r = self.session.post(url, json=payload, timeout=30, stream=True)
+                result = _read_json(r)
+        except requests.exceptions.Timeout:
+            count_timeout("judge0_submit")
+            raise
+        return clip_submission(result)
+
+    def submit_batch(self, source_code, cases, language_substr="java"):
+        """
+        Aynı kaynağı farklı girdilerle tek istekte gönderir (POST /submissions/batch, wait yok).
+        cases: [{"stdin", "cpu_time_limit", "memory_limit" (KB)}]; gönderim sırasıyla
+        [{"token": ...} | {"error": ...}] döndürür.
+        """
+        with stage_timer("judge0_languages"):
+            lang_id = self.find_language_id(language_substr)
+        if not lang_id:
+            return {"error": "Judge0 üzerinde uygun language_id bulunamadı."}
+
+        submissions = []
+        for case in cases:
+            item = {
+                "source_code": source_code,
+                "language_id": lang_id,
+                "stdin": case.get("stdin", ""),
+                "cpu_time_limit": str(case.get("cpu_time_limit", 2.0)),
+            }
+            if case.get("memory_limit"):
+                item["memory_limit"] = case["memory_limit"]
+            submissions.append(item)
+
+        try:
+            with stage_timer("judge0_submit"):
+                r = self.session.post(f"{self.base}/submissions/batch?base64_encoded=false",
+                                      json={"submissions": submissions}, timeout=30, stream=True)
+                return _read_json(r)
+        except requests.exceptions.Timeout:
+            count_timeout("judge0_submit")
+            raise
+
+    def get_submissions(self, tokens, fields=SUBMISSION_FIELDS):
+        """Birden fazla gönderimin durumunu tek istekte çeker (/submissions/batch)."""
+        if not tokens:
+            return []
+        url = f"{self.base}/submissions/batch"
+        params = {"tokens": ",".join(tokens), "base64_encoded": "false", "fields": fields}
+        with stage_timer("judge0_poll"):
+            r = self.session.get(url, params=params, timeout=10, stream=True)
+            result = _read_json(r)
+        return [clip_submission(sub) for sub in result.get("submissions", [])]
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_client():
+    """Süreç başına paylaşılan Judge0 istemcisi."""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Judge0Client()
+    return _default_client
+
+
 def find_language_id_by_name(substr="java"):
     """Judge0'daki diller listesinden 'java' içeren bir language_id döndürür."""
-    url = f"{JUDGE0_BASE}/languages"
-    r = requests.get(url, headers=HEADERS, timeout=10)
-    r.raise_for_status()
-    langs = r.json()
-    for item in langs:
-        name = (item.get("name") or "").lower()
-        display = (item.get("display_name") or "").lower()
-        if substr in name or substr in display:
-            return item.get("id")
-    return None
+    return get_client().find_language_id(substr)
 
 def run_code_on_judge0(source_code, language_substr="java", stdin="", wait=True, cpu_time_limit=2.0):
     """
@@ -31,19 +222,5 @@ def run_code_on_judge0(source_code, language_substr="java", stdin="", wait=True,
     cpu_time_limit: Judge0 tarafı için talep edilen CPU süresi (saniye)
     Döndürür: Judge0'dan gelen JSON cevabı (compile_output, stdout, stderr, status vb.)
     """
-    lang_id = find_language_id_by_name(language_substr)
-    if not lang_id:
-        return {"error": "Judge0 üzerinde uygun language_id bulunamadı."}
-
-    url = f"{JUDGE0_BASE}/submissions?base64_encoded=false&wait={'true' if wait else 'false'}"
-    payload = {
-        "source_code": source_code,
-        "language_id": lang_id,
-        "stdin": stdin,
-        # CPU limit string format bazı instance'larda farklı olabilir; Judge0 instance'ına göre uyarlayın
-        "cpu_time_limit": str(cpu_time_limit)
-    }
-
-    r = requests.post(url, json=payload, headers=HEADERS, timeout=30)
-    r.raise_for_status()
-    return r.json()
+    return get_client().submit(source_code, language_substr=language_substr, stdin=stdin,
+                               wait=wait, cpu_time_limit=cpu_time_limit)
@@ -0,0 +1,192 @@
+# judge0_jobs.py
+"""
+Java gönderimleri için asenkron iş takibi.
+
+Gönderim Judge0'a wait=false ile yapılır ve Judge0 token'ı iş kimliği olarak
+döner; gunicorn worker'ı derleme/çalıştırma süresince bloke olmaz. Arka plandaki
+tek bir poller thread'i bekleyen tüm token'ları /submissions/batch ile toplu
+olarak sorgular.
+
+Yalnızca bu servisin gönderdiği token'lar takip edilir: submit token'ı JOB_DIR
+(tmpfs) altına kaydeder, böylece başka bir worker'ın oluşturduğu iş de sorgulanabilir.
+Kaydı olmayan ya da JOB_RESULT_TTL'den eski token için get None döndürür (404).
+"""
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+import scratch
+from judge0_client import get_client
+
+JOB_POLL_INTERVAL = float(os.environ.get("JOB_POLL_INTERVAL", 0.5))  # saniye
+JOB_BATCH_SIZE = int(os.environ.get("JOB_BATCH_SIZE", 20))  # Judge0 batch limiti varsayılan 20
+JOB_RESULT_TTL = float(os.environ.get("JOB_RESULT_TTL", 600))  # biten işler bu süre tutulur
+JOB_MAX_WAIT = float(os.environ.get("JOB_MAX_WAIT", 10))  # long-poll üst sınırı
+# worker'lar arası gönderim kaydı: token -> meta (dosya adı token'dır)
+JOB_DIR = os.environ.get("JOB_DIR") or os.path.join(scratch.SCRATCH_ROOT, "kod-analiz-jobs")
+
+# Judge0 durum kodları: 1 In Queue, 2 Processing; diğerleri sonuçlanmış
+PENDING_STATUSES = {1, 2}
+
+_TOKEN_RE = re.compile(r"^[A-Za-z0-9-]{1,64}$")
+
+
+def is_valid_job_id(job_id):
+    return bool(job_id and _TOKEN_RE.match(job_id))
+
+
+class _Job:
+    def __init__(self, token, meta=None):
+        self.token = token
+        self.meta = meta
+        self.result = None
+        self.done = threading.Event()
+        self.created_at = time.monotonic()
+        self.finished_at = None
+
+    def to_dict(self):
+        if self.done.is_set():
+            return {"job_id": self.token, "status": "done", "java_result": self.result}
+        return {"job_id": self.token, "status": "pending"}
+
+
+class JobStore:
+    def __init__(self, poll_interval=JOB_POLL_INTERVAL, batch_size=JOB_BATCH_SIZE, directory=JOB_DIR):
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.directory = directory
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pid = None
+        self._last_sweep = 0.0
+
+    def _ensure_poller(self):
+        # Thread'ler fork ile kopyalanmaz; her gunicorn worker'ı kendi poller'ını başlatır
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            threading.Thread(target=self._poll_loop, name="judge0-poller", daemon=True).start()
+
+    def submit(self, source_code, language_substr="java", stdin="", cpu_time_limit=2.0, meta=None):
+        """Kodu Judge0'a beklemeden gönderir, iş kaydını döndürür (hata varsa dict)."""
+        resp = get_client().submit(source_code, language_substr=language_substr, stdin=stdin,
+                                   wait=False, cpu_time_limit=cpu_time_limit)
+        if resp.get("error"):
+            return resp
+        self._record(resp["token"], meta)
+        job = self.track(resp["token"], meta=meta)
+        return job.to_dict()
+
+    def _record(self, token, meta):
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"meta": meta}, f)
+            os.replace(tmp_path, os.path.join(self.directory, token))
+        except (OSError, TypeError, ValueError):
+            # kayıt yazılamazsa iş yalnızca bu worker'dan sorgulanabilir
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _recorded(self, token):
+        """Bu servisin gönderdiği, süresi dolmamış token'ın kaydı ({"meta": ...}); yoksa None."""
+        path = os.path.join(self.directory, token)
+        try:
+            if time.time() - os.stat(path).st_mtime > JOB_RESULT_TTL:
+                return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def track(self, token, meta=None):
+        self._ensure_poller()
+        with self._lock:
+            job = self._jobs.get(token)
+            if job is None:
+                job = _Job(token, meta=meta)
+                self._jobs[token] = job
+                self._wakeup.set()
+        return job
+
+    def get(self, token, wait=0.0):
+        """
+        İşi döndürür; wait > 0 ise sonuç gelene kadar en fazla o kadar bekler.
+        Bu servisin göndermediği (ya da süresi dolmuş) token için None.
+        """
+        with self._lock:
+            job = self._jobs.get(token)
+        if job is None:
+            record = self._recorded(token)
+            if record is None:
+                return None
+            job = self.track(token, meta=record.get("meta"))
+        if wait > 0:
+            job.done.wait(min(wait, JOB_MAX_WAIT))
+        return job
+
+    def _poll_loop(self):
+        while True:
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            try:
+                self._poll_once()
+            except Exception:
+                # Judge0'a ulaşılamadı; bir sonraki turda tekrar denenir
+                time.sleep(self.poll_interval)
+
+    def _sweep(self):
+        # süresi dolan gönderim kayıtları (her worker'ın poller'ı ara sıra temizler)
+        now = time.time()
+        if now - self._last_sweep < JOB_RESULT_TTL / 2:
+            return
+        self._last_sweep = now
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                if now - os.stat(path).st_mtime > JOB_RESULT_TTL:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def _poll_once(self):
+        self._sweep()
+        now = time.monotonic()
+        with self._lock:
+            for token, job in list(self._jobs.items()):
+                # Biten işler ve hiç sonuçlanmayan işler TTL sonunda atılır
+                started = job.finished_at if job.finished_at is not None else job.created_at
+                if now - started > JOB_RESULT_TTL:
+                    del self._jobs[token]
+            pending = [t for t, job in self._jobs.items() if not job.done.is_set()]
+
+        for i in range(0, len(pending), self.batch_size):
+            chunk = pending[i:i + self.batch_size]
+            for sub in get_client().get_submissions(chunk):
+                if not sub:
+                    continue
+                status_id = (sub.get("status") or {}).get("id")
+                if status_id in PENDING_STATUSES:
+                    continue
+                with self._lock:
+                    job = self._jobs.get(sub.get("token"))
+                if job is not None and not job.done.is_set():
+                    job.result = sub
+                    job.finished_at = time.monotonic()
+                    job.done.set()
+
+
+job_store = JobStore()
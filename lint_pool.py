@@ -0,0 +1,228 @@
+# lint_pool.py
+"""
+Pylint'i her istekte yeni bir süreç (yeni interpreter + astroid + tüm checker'lar)
+olarak başlatmak yerine, pylint'i önceden yüklemiş uzun ömürlü worker süreçleri.
+
+Kod worker'a pipe üzerinden gönderilir ve pylint'e `--from-stdin` ile verilir
+(diske dosya yazılmaz); sonuç `pylint --output-format=json` çıktısıyla aynı
+şekilde (dict listesi) geri döner. Çok dosyalı projeler için worker'a diskteki
+dosyaların listesi de verilebilir (lint_files); aynı çalıştırmadaki modüller
+astroid AST'lerini paylaşır. Her worker belirli sayıda
+işten sonra yenilenir (astroid önbelleği / bellek birikmesin diye).
+
+Worker'lar forkserver'dan fork edilir: pylint ve standart kütüphane modüllerinin
+astroid önbelleği (astroid_cache) forkserver'da bir kez yüklenir, yeni worker
+(ilk başlatma ya da yenileme) hiçbir şeyi yeniden içe aktarmaz / kurmaz.
+"""
+import io
+import os
+import queue
+import sys
+import threading
+import time
+import multiprocessing
+
+LINT_POOL_SIZE = int(os.environ.get("LINT_POOL_SIZE", 2))
+LINT_WORKER_MAX_JOBS = int(os.environ.get("LINT_WORKER_MAX_JOBS", 200))
+LINT_TIMEOUT = float(os.environ.get("LINT_TIMEOUT", 20))
+# Bulgularda görünen dosya adı; dosya gerçekte yoktur
+SUBMISSION_PATH = "submission.py"
+
+# forkserver / spawn: worker'lar Flask/gunicorn durumunu (thread, soket vb.) miras almasın.
+# forkserver olmayan platformlarda spawn; her worker pylint'i ve önbelleği kendisi yükler.
+LINT_START_METHOD = os.environ.get("LINT_START_METHOD") or (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+_ctx = multiprocessing.get_context(LINT_START_METHOD)
+if LINT_START_METHOD == "forkserver":
+    _ctx.set_forkserver_preload(["astroid_cache"])
+
+
+def _worker_main(conn):
+    # Bu importlar worker başına yalnızca bir kez yapılır (asıl kazanç burada);
+    # forkserver'da hepsi zaten yüklüdür
+    import astroid_cache
+    from astroid import MANAGER
+    from pylint.lint import Run
+    from pylint.reporters import CollectingReporter
+    from pylint.reporters.json_reporter import JSONReporter
+
+    class _PipeReporter(CollectingReporter):
+        # Her bulgu üretildiği anda gönderilir (akış endpoint'i bunları tek tek iletir)
+        def __init__(self, root=None):
+            super().__init__()
+            self.root = root
+
+        def handle_message(self, msg):
+            item = JSONReporter.serialize(msg)
+            if self.root:
+                item["path"] = os.path.relpath(msg.abspath, self.root).replace(os.sep, "/")
+            conn.send(("msg", item))
+
+    # forkserver'da ön yükleme sırasında zaten yüklendi (çağrı bir şey yapmaz); spawn'da burada yüklenir
+    astroid_cache.install()
+
+    while True:
+        try:
+            code = conn.recv()
+        except (EOFError, OSError):
+            break
+        if code is None:
+            break
+
+        try:
+            if isinstance(code, dict):
+                # proje: {"root": dizin, "files": [mutlak yollar]}
+                Run([f"--source-roots={code['root']}", *code["files"]], reporter=_PipeReporter(code["root"]),
+                    exit=False)
+            else:
+                # pylint --from-stdin, sys.stdin'i detach edip UTF-8 olarak yeniden sarar
+                sys.stdin = io.TextIOWrapper(io.BytesIO(code.encode("utf-8")), encoding="utf-8")
+                Run(["--from-stdin", SUBMISSION_PATH], reporter=_PipeReporter(), exit=False)
+            conn.send(("ok", None))
+        except BaseException as e:  # pylint SystemExit da fırlatabilir
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+        finally:
+            # Aynı modül adı tekrar kullanıldığı için astroid önbelleğinde kalmış olabilecek
+            # eski modülü atmazsak bir sonraki iş bayat AST ile analiz edilir.
+            root = code["root"] if isinstance(code, dict) else None
+            for modname, module in list(MANAGER.astroid_cache.items()):
+                path = getattr(module, "file", None) or ""
+                if path == SUBMISSION_PATH or (root and path.startswith(root + os.sep)):
+                    del MANAGER.astroid_cache[modname]
+            if root:
+                # proje dizinleri yeniden kullanılır; modül adı -> dosya eşlemesi de bayatlamasın
+                getattr(MANAGER, "_mod_file_cache", {}).clear()
+
+
+class _LintWorker:
+    def __init__(self):
+        self.conn, child_conn = _ctx.Pipe()
+        self.process = _ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except Exception:
+            pass
+        self.kill(grace=1)
+
+    def kill(self, grace=0):
+        try:
+            self.process.join(grace)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join(1)
+        except Exception:
+            pass
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+
+class LintPool:
+    """Sabit boyutlu pylint worker havuzu. Thread-safe."""
+
+    def __init__(self, size=LINT_POOL_SIZE, max_jobs=LINT_WORKER_MAX_JOBS):
+        self.size = max(1, size)
+        self.max_jobs = max(1, max_jobs)
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def _ensure_started(self):
+        # gunicorn fork'undan sonra her süreç kendi havuzunu kurmalı
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._idle = queue.Queue()
+            for _ in range(self.size):
+                self._idle.put(_LintWorker())
+            self._pid = os.getpid()
+
+    def _release(self, worker):
+        if worker is None:
+            self._idle.put(_LintWorker())
+        elif worker.jobs >= self.max_jobs:
+            worker.stop()
+            self._idle.put(_LintWorker())
+        else:
+            self._idle.put(worker)
+
+    def iter_lint(self, code, timeout=LINT_TIMEOUT):
+        """
+        Pylint bulgularını (pylint JSON çıktısındaki dict'ler) üretildikçe döndüren generator.
+        code bir kaynak metni ya da {"root": dizin, "files": [yollar]} proje işidir.
+        """
+        self._ensure_started()
+        deadline = time.monotonic() + timeout
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("Boşta pylint worker'ı bulunamadı.")
+
+        finished = False
+        try:
+            worker.conn.send(code)
+            while True:
+                if not worker.conn.poll(max(0.0, deadline - time.monotonic())):
+                    raise TimeoutError("Pylint analizi zaman aşımına uğradı.")
+                status, payload = worker.conn.recv()
+                if status == "msg":
+                    yield payload
+                    continue
+                finished = True
+                worker.jobs += 1
+                if status != "ok":
+                    raise RuntimeError(payload)
+                return
+        except (EOFError, OSError):
+            raise RuntimeError("Pylint worker'ı beklenmedik şekilde sonlandı.")
+        finally:
+            if not finished:
+                # zaman aşımı, worker ölümü ya da tüketicinin yarıda bırakması:
+                # pipe'ta kalan mesajlar bir sonraki işe karışmasın diye worker yenilenir
+                worker.kill()
+                worker = None
+            self._release(worker)
+
+    def lint(self, code, timeout=LINT_TIMEOUT):
+        """Kodu pylint ile analiz eder; pylint JSON çıktısındaki dict listesini döndürür."""
+        return list(self.iter_lint(code, timeout=timeout))
+
+    def shutdown(self):
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            while True:
+                try:
+                    self._idle.get_nowait().stop()
+                except queue.Empty:
+                    break
+            self._pid = None
+
+
+_pool = LintPool()
+
+
+def prestart():
+    """Havuzu (forkserver + worker'lar) ilk istekten önce başlatır; gunicorn post_fork'tan çağrılır."""
+    _pool._ensure_started()
+
+
+def lint_code(code, timeout=LINT_TIMEOUT):
+    return _pool.lint(code, timeout=timeout)
+
+
+def iter_lint_code(code, timeout=LINT_TIMEOUT):
+    return _pool.iter_lint(code, timeout=timeout)
+
+
+def lint_files(root, files, timeout=LINT_TIMEOUT):
+    """root altındaki dosyaları tek pylint çalıştırmasında analiz eder; "path" root'a görelidir."""
+    return _pool.lint({"root": root, "files": [os.path.join(root, f) for f in files]}, timeout=timeout)
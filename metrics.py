@@ -0,0 +1,318 @@
+# metrics.py
+"""
+Aşama süreleri ve sayaçlar: Prometheus metin formatında /metrics ve istek başına
+Server-Timing başlığı.
+
+Harici bağımlılık yoktur; sayaçlar ve histogramlar süreç içinde tutulur. gunicorn
+birden fazla worker çalıştırdığında her worker kendi anlık görüntüsünü
+METRICS_DIR altına periyodik olarak yazar, /metrics cevabı yaşayan tüm
+worker'ların değerlerini toplar.
+
+Kullanım:
+    with stage_timer("pylint"):
+        ...
+    count_timeout("python_run")
+
+Örneklenmiş yapılandırılmış log: log_event(...) LOG_SAMPLE_RATE oranında
+JSON satırı olarak "kod_analiz" logger'ına yazar (kod içeriği yazılmaz).
+"""
+import bisect
+import contextvars
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+METRICS_DIR = os.environ.get("METRICS_DIR", os.path.join(tempfile.gettempdir(), "kod-analiz-metrics"))
+METRICS_FLUSH_INTERVAL = float(os.environ.get("METRICS_FLUSH_INTERVAL", 5))  # saniye
+LOG_SAMPLE_RATE = float(os.environ.get("LOG_SAMPLE_RATE", 0.01))
+
+# saniye; en hızlı aşama (fast checker) mikro saniyeler, en yavaşı Judge0 saniyeler sürer
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+logger = logging.getLogger("kod_analiz")
+if not logger.handlers:
+    # gunicorn kök logger'ı yapılandırmaz; örneklenmiş satırlar doğrudan stderr'e gider
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help_text, labelnames):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def snapshot(self):
+        with self._lock:
+            return {json.dumps(key): value if not isinstance(value, list) else list(value)
+                    for key, value in self._values.items()}
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            # [kova sayıları..., +Inf, toplam, adet]; kovalar birikimli değil, render'da toplanır
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            entry[bisect.bisect_left(self.buckets, value)] += 1
+            entry[-2] += value
+            entry[-1] += 1
+
+    def quantile(self, q, min_count=1, **labels):
+        """
+        Bu süreçteki gözlemlerin q. yüzdeliğinin üst sınırı (kova sınırı; +Inf kovasında ortalama
+        ile son sınırın büyüğü). min_count'tan az gözlem varsa None.
+        """
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            if entry is None or entry[-1] < min_count:
+                return None
+            target = q * entry[-1]
+            cumulative = 0
+            for bound, count in zip(self.buckets, entry):
+                cumulative += count
+                if cumulative >= target:
+                    return bound
+            return max(self.buckets[-1], entry[-2] / entry[-1])
+
+
+STAGE_SECONDS = Histogram("kod_analiz_stage_seconds", "Analiz aşamalarının süresi", ["stage"])
+REQUEST_SECONDS = Histogram("kod_analiz_request_seconds", "HTTP isteklerinin toplam süresi", ["endpoint"])
+REQUESTS = Counter("kod_analiz_requests_total", "HTTP istekleri", ["endpoint", "status"])
+TIMEOUTS = Counter("kod_analiz_timeouts_total", "Zaman aşımına uğrayan aşamalar", ["stage"])
+CACHE = Counter("kod_analiz_cache_total", "Analiz önbelleği sorguları", ["result"])
+ERRORS = Counter("kod_analiz_findings_total", "Kullanıcıya dönen bulgular (hata türüne göre)", ["error_type"])
+REJECTED = Counter("kod_analiz_rejected_total", "Kabul kontrolünün reddettiği istekler (429)", ["backend"])
+COALESCED = Counter("kod_analiz_coalesced_total", "Süren özdeş bir işin sonucunu alan istekler",
+                    ["scope"])
+
+_REGISTRY = (STAGE_SECONDS, REQUEST_SECONDS, REQUESTS, TIMEOUTS, CACHE, ERRORS, REJECTED, COALESCED)
+
+
+# ----------------- Server-Timing -----------------
+_timings = contextvars.ContextVar("server_timings", default=None)
+
+
+def start_request():
+    """İstek başında çağrılır; bu istekteki aşama süreleri toplanmaya başlar."""
+    _timings.set({})
+
+
+def server_timing_header():
+    timings = _timings.get()
+    if not timings:
+        return None
+    # Aynı aşama birden çok kez çalıştıysa (toplu analiz) süreler toplanır
+    return ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in timings.items())
+
+
+def observe_stage(stage, seconds):
+    STAGE_SECONDS.observe(seconds, stage=stage)
+    timings = _timings.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+    _ensure_flusher()
+
+
+@contextmanager
+def stage_timer(stage):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - started)
+
+
+def stage_quantile(stage, q=0.9, min_count=1):
+    """Aşama süresinin gözlenen q. yüzdeliği (saniye, bu worker); yeterli gözlem yoksa None."""
+    return STAGE_SECONDS.quantile(q, min_count, stage=stage)
+
+
+def count_timeout(stage):
+    TIMEOUTS.inc(stage=stage)
+
+
+def count_cache(hit):
+    CACHE.inc(result="hit" if hit else "miss")
+
+
+def count_rejected(backend):
+    REJECTED.inc(backend=backend)
+
+
+def count_coalesced(scope):
+    # scope: "process" (aynı worker'daki lider) veya "worker" (başka worker'ın sonucu)
+    COALESCED.inc(scope=scope)
+
+
+def finish_request(endpoint, status, seconds):
+    REQUEST_SECONDS.observe(seconds, endpoint=endpoint)
+    REQUESTS.inc(endpoint=endpoint, status=status)
+    _ensure_flusher()
+
+
+def count_findings(findings):
+    for item in findings:
+        ERRORS.inc(error_type=item.get("error_type", "?"))
+
+
+# ----------------- Örneklenmiş log -----------------
+def log_event(event, **fields):
+    if LOG_SAMPLE_RATE <= 0 or random.random() >= LOG_SAMPLE_RATE:
+        return
+    logger.info(json.dumps({"event": event, "ts": round(time.time(), 3), "pid": os.getpid(), **fields},
+                           ensure_ascii=False, default=str))
+
+
+# ----------------- worker'lar arası toplama -----------------
+_flusher_pid = None
+_flusher_lock = threading.Lock()
+
+
+def _snapshot():
+    return {metric.name: metric.snapshot() for metric in _REGISTRY}
+
+
+def _flush():
+    if not METRICS_DIR:
+        return
+    try:
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        path = os.path.join(METRICS_DIR, f"{os.getpid()}.json")
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_snapshot(), f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _flush_loop():
+    while True:
+        time.sleep(METRICS_FLUSH_INTERVAL)
+        _flush()
+
+
+def _ensure_flusher():
+    global _flusher_pid
+    if _flusher_pid == os.getpid() or not METRICS_DIR:
+        return
+    with _flusher_lock:
+        if _flusher_pid != os.getpid():
+            _flusher_pid = os.getpid()
+            threading.Thread(target=_flush_loop, name="metrics-flush", daemon=True).start()
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+
+
+def _collect():
+    """Bu süreç + diğer yaşayan worker'ların son anlık görüntüleri."""
+    snapshots = [_snapshot()]
+    if METRICS_DIR and os.path.isdir(METRICS_DIR):
+        for filename in os.listdir(METRICS_DIR):
+            if not filename.endswith(".json"):
+                continue
+            pid = int(filename[:-5]) if filename[:-5].isdigit() else None
+            if pid is None or pid == os.getpid() or not _pid_alive(pid):
+                continue
+            try:
+                with open(os.path.join(METRICS_DIR, filename), encoding="utf-8") as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+
+    merged = {}
+    for snapshot in snapshots:
+        for name, values in snapshot.items():
+            target = merged.setdefault(name, {})
+            for key, value in values.items():
+                if isinstance(value, list):
+                    current = target.get(key)
+                    target[key] = value if current is None else [a + b for a, b in zip(current, value)]
+                else:
+                    target[key] = target.get(key, 0) + value
+    return merged
+
+
+def _labels(names, key, extra=None):
+    pairs = list(zip(names, json.loads(key)))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    body = ",".join('%s="%s"' % (n, str(v).replace("\\", "\\\\").replace('"', '\\"')) for n, v in pairs)
+    return "{" + body + "}"
+
+
+def render(gauges=()):
+    """
+    Prometheus metin formatı. gauges: (isim, açıklama, {etiket: değer} veya değer) demetleri;
+    anlık değerler (önbellek boyutu, kuyruk uzunlukları) bu süreçten okunur.
+    """
+    merged = _collect()
+    out = []
+    for metric in _REGISTRY:
+        out.append(f"# HELP {metric.name} {metric.help}")
+        out.append(f"# TYPE {metric.name} {metric.kind}")
+        for key, value in sorted(merged.get(metric.name, {}).items()):
+            if metric.kind == "counter":
+                out.append(f"{metric.name}{_labels(metric.labelnames, key)} {value}")
+                continue
+            cumulative = 0
+            for bound, count in zip(list(metric.buckets) + ["+Inf"], value[:-2]):
+                cumulative += count
+                le = ("le", bound if bound == "+Inf" else repr(float(bound)))
+                out.append(f"{metric.name}_bucket{_labels(metric.labelnames, key, le)} {cumulative}")
+            out.append(f"{metric.name}_sum{_labels(metric.labelnames, key)} {value[-2]}")
+            out.append(f"{metric.name}_count{_labels(metric.labelnames, key)} {value[-1]}")
+    for name, help_text, value in gauges:
+        out.append(f"# HELP {name} {help_text}")
+        out.append(f"# TYPE {name} gauge")
+        if isinstance(value, dict):
+            for (label, label_value), sample in value.items():
+                out.append(f'{name}{{{label}="{label_value}"}} {sample}')
+        else:
+            out.append(f"{name} {value}")
+    return "\n".join(out) + "\n"
+
+
@@ -0,0 +1,314 @@
+# project.py
+"""
+Çok dosyalı proje analizi (/analyze/project).
+
+Proje JSON dosya haritası ({"yol": "içerik"}) ya da zip olarak gelir. Python için:
+
+  1. Her modül bir kez ast.parse edilir; aynı ağaç hem import grafiği hem hızlı
+     denetleyici (fast_checker) için kullanılır.
+  2. İmport grafiğinin bağlı bileşenleri, birbirini import eden modüller aynı
+     pylint çalıştırmasına düşecek şekilde lint worker sayısı kadar gruba
+     bölünür (aynı çalıştırmadaki modüller astroid AST'lerini paylaşır). Tek bir
+     bileşen payından büyükse bağımlılık sırasıyla parçalanır; dosyalar diskte
+     olduğu için importlar yine çözülür.
+  3. Gruplar lint havuzunda paralel çalışır; proje pylint yuvalarından en fazla
+     havuz boyutu kadarını tutar.
+
+Java projeleri java_runner.analyze_java_project ile tek javac çalıştırmasında
+derlenir (paketler arası bağımlılıkları javac kendisi çözer).
+
+Kod çalıştırılmaz; sonuçlar dosyaya göre gruplanır.
+"""
+import ast
+import contextvars
+import io
+import math
+import os
+import posixpath
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import scratch
+from admission import limit
+from fast_checker import check as fast_check
+from lint_pool import lint_files, LINT_POOL_SIZE
+from metrics import stage_timer
+
+PROJECT_MAX_FILES = int(os.environ.get("PROJECT_MAX_FILES", 200))
+PROJECT_MAX_BYTES = int(os.environ.get("PROJECT_MAX_BYTES", 2 * 1024 * 1024))  # toplam, sıkıştırılmamış
+PROJECT_LINT_TIMEOUT = float(os.environ.get("PROJECT_LINT_TIMEOUT", 60))
+
+SOURCE_EXTENSIONS = {".py": "python", ".java": "java"}
+
+
+class ProjectError(ValueError):
+    pass
+
+
+# ----------------- Girdi -----------------
+def _clean_path(path):
+    """Göreli, normalize edilmiş posix yolu; proje dışına çıkan yollar reddedilir."""
+    path = posixpath.normpath(str(path).replace("\\", "/")).lstrip("/")
+    if not path or path == "." or path.startswith("../") or path == "..":
+        raise ProjectError(f"Geçersiz dosya yolu: {path}")
+    return path
+
+
+def _check_limits(count, size):
+    if count > PROJECT_MAX_FILES:
+        raise ProjectError(f"En fazla {PROJECT_MAX_FILES} dosya gönderilebilir.")
+    if size > PROJECT_MAX_BYTES:
+        raise ProjectError(f"Proje en fazla {PROJECT_MAX_BYTES // 1024} KB olabilir.")
+
+
+def load_json_files(files):
+    """{"yol": "içerik"} haritası; kaynak olmayan dosyalar atlanır."""
+    if not isinstance(files, dict) or not files:
+        raise ProjectError("Dosya haritası gönderilmedi.")
+    result = {}
+    for path, content in files.items():
+        if not isinstance(content, str):
+            raise ProjectError(f"Dosya içeriği metin olmalı: {path}")
+        path = _clean_path(path)
+        if posixpath.splitext(path)[1] in SOURCE_EXTENSIONS:
+            result[path] = content
+    _check_limits(len(result), sum(len(c.encode("utf-8")) for c in result.values()))
+    return result
+
+
+def load_zip(blob):
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(blob))
+    except zipfile.BadZipFile:
+        raise ProjectError("Zip dosyası okunamadı.")
+    members = [info for info in archive.infolist()
+               if not info.is_dir() and posixpath.splitext(info.filename)[1] in SOURCE_EXTENSIONS
+               and not any(part.startswith((".", "__MACOSX")) for part in info.filename.split("/"))]
+    # sıkıştırılmış boyuta değil, açılmış boyuta göre sınırla (zip bombası)
+    _check_limits(len(members), sum(info.file_size for info in members))
+    result = {}
+    for info in members:
+        try:
+            result[_clean_path(info.filename)] = archive.read(info).decode("utf-8")
+        except UnicodeDecodeError:
+            raise ProjectError(f"Dosya UTF-8 değil: {info.filename}")
+    _strip_common_root(result)
+    return result
+
+
+def _strip_common_root(files):
+    # "proje/main.py", "proje/pkg/a.py" -> "main.py", "pkg/a.py" (zip'ler genelde tek klasörle gelir)
+    while files:
+        heads = {path.split("/", 1)[0] for path in files}
+        if len(heads) != 1 or any("/" not in path for path in files):
+            return
+        for path in list(files):
+            files[path.split("/", 1)[1]] = files.pop(path)
+
+
+def detect_language(files):
+    counts = {}
+    for path in files:
+        language = SOURCE_EXTENSIONS[posixpath.splitext(path)[1]]
+        counts[language] = counts.get(language, 0) + 1
+    if not counts:
+        raise ProjectError("Projede .py veya .java dosyası yok.")
+    return max(counts, key=counts.get)
+
+
+# ----------------- Python import grafiği -----------------
+def module_name(path):
+    parts = path[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _imported_modules(tree, current, is_package):
+    """Modülün import ettiği (mutlak) modül adları; göreli importlar çözülür."""
+    package = current if is_package else current.rpartition(".")[0]
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                anchor = package.split(".") if package else []
+                anchor = anchor[:len(anchor) - (node.level - 1)] if node.level > 1 else anchor
+                base = ".".join(anchor + ([node.module] if node.module else []))
+            if base:
+                yield base
+            for alias in node.names:
+                if alias.name != "*":
+                    # from pkg import modul
+                    yield f"{base}.{alias.name}" if base else alias.name
+
+
+def build_graph(files):
+    """
+    Her .py dosyasını bir kez parse eder.
+    (ağaçlar {yol: ast}, sözdizimi hataları {yol: bulgu}, grafik {yol: {bağımlı yollar}}) döndürür.
+    """
+    modules = {module_name(path): path for path in files if path.endswith(".py")}
+    trees, syntax_errors, graph = {}, {}, {}
+    for path in sorted(p for p in files if p.endswith(".py")):
+        try:
+            trees[path] = ast.parse(files[path], filename=path)
+        except (SyntaxError, ValueError) as e:
+            syntax_errors[path] = {"error_type": "SyntaxError", "line": getattr(e, "lineno", None) or "?",
+                                   "original_message": str(e), "stage": "syntax"}
+            continue
+        deps = set()
+        for name in _imported_modules(trees[path], module_name(path), path.endswith("__init__.py")):
+            # a.b.c importu a, a.b ve a.b.c'nin (projede olanlarını) yükler
+            parts = name.split(".")
+            for i in range(1, len(parts) + 1):
+                target = modules.get(".".join(parts[:i]))
+                if target and target != path:
+                    deps.add(target)
+        graph[path] = deps
+    # sözdizimi hatalı modüller lint gruplarına girmez
+    graph = {path: {dep for dep in deps if dep in trees} for path, deps in graph.items()}
+    return trees, syntax_errors, graph
+
+
+def _components(graph):
+    undirected = {path: set(deps) for path, deps in graph.items()}
+    for path, deps in graph.items():
+        for dep in deps:
+            undirected.setdefault(dep, set()).add(path)
+    seen, components = set(), []
+    for start in sorted(undirected):
+        if start in seen:
+            continue
+        stack, component = [start], []
+        seen.add(start)
+        while stack:
+            node = stack.pop()
+            component.append(node)
+            for other in undirected[node]:
+                if other not in seen:
+                    seen.add(other)
+                    stack.append(other)
+        components.append(component)
+    return components
+
+
+def _dependency_order(component, graph):
+    # bağımlılıklar önce (döngülerde sıra önemli değil)
+    order, visited = [], set()
+
+    def visit(node):
+        if node in visited:
+            return
+        visited.add(node)
+        for dep in sorted(graph.get(node, ())):
+            if dep in component_set:
+                visit(dep)
+        order.append(node)
+
+    component_set = set(component)
+    for node in sorted(component):
+        visit(node)
+    return order
+
+
+def plan_groups(graph, sizes, workers):
+    """
+    Dosyaları en fazla `workers` lint grubuna böler: bileşenler bütün kalır, payından
+    (toplam/workers) büyük bileşenler bağımlılık sırasıyla parçalanır; parçalar en boş gruba
+    (büyükten küçüğe) yerleştirilir.
+    """
+    if not graph:
+        return []
+    workers = max(1, min(workers, len(graph)))
+    share = math.ceil(sum(sizes[p] for p in graph) / workers) or 1
+    chunks = []
+    for component in _components(graph):
+        ordered = _dependency_order(component, graph)
+        chunk, chunk_size = [], 0
+        for path in ordered:
+            if chunk and chunk_size + sizes[path] > share:
+                chunks.append(chunk)
+                chunk, chunk_size = [], 0
+            chunk.append(path)
+            chunk_size += sizes[path]
+        chunks.append(chunk)
+
+    groups = [[] for _ in range(workers)]
+    loads = [0] * workers
+    for chunk in sorted(chunks, key=lambda c: sum(sizes[p] for p in c), reverse=True):
+        i = loads.index(min(loads))
+        groups[i].extend(chunk)
+        loads[i] += sum(sizes[p] for p in chunk)
+    return [group for group in groups if group]
+
+
+# ----------------- Analiz -----------------
+def _lint_finding(item):
+    return {
+        "error_type": item.get("type", "error"),
+        "line": item.get("line", "?"),
+        "original_message": item.get("message", ""),
+        "stage": "pylint"
+    }
+
+
+def _write_files(root, files):
+    for path, content in files.items():
+        target = os.path.join(root, *path.split("/"))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+def analyze_python_project(files, deep=True):
+    """
+    {"files": {yol: [bulgu]}, "graph": {yol: [import edilen yollar]}, "lint_groups": n} döndürür.
+    Bulgular çevrilmemiştir (app.translate_findings ile çevrilir).
+    """
+    with stage_timer("project_parse"):
+        trees, syntax_errors, graph = build_graph(files)
+    findings = {path: [] for path in files}
+    for path, finding in syntax_errors.items():
+        findings[path].append(finding)
+
+    with stage_timer("fast"):
+        for path, tree in trees.items():
+            findings[path].extend(dict(item, stage="fast") for item in fast_check(files[path], tree=tree))
+
+    groups = []
+    if deep and graph:
+        sizes = {path: len(files[path]) for path in graph}
+        groups = plan_groups(graph, sizes, LINT_POOL_SIZE)
+        with scratch.workspace("python-project") as root, stage_timer("pylint"):
+            # sözdizimi hatalı dosyalar da diskte olsun ki onları import eden modüller çözülebilsin
+            _write_files(root, {p: c for p, c in files.items() if p.endswith(".py")})
+            pending = list(groups)
+
+            def lint_worker():
+                # proje, havuz boyutundan fazla pylint yuvası tutmaz; her yuva sıradaki grubu alır
+                results = []
+                with limit("pylint"):
+                    while True:
+                        try:
+                            group = pending.pop()
+                        except IndexError:
+                            return results
+                        results.extend(lint_files(root, group, timeout=PROJECT_LINT_TIMEOUT))
+
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                futures = [executor.submit(contextvars.copy_context().run, lint_worker) for _ in groups]
+                for future in futures:
+                    for item in future.result():
+                        if item.get("path") in findings:
+                            findings[item["path"]].append(_lint_finding(item))
+
+    for items in findings.values():
+        items.sort(key=lambda f: f["line"] if isinstance(f["line"], int) else 0)
+    return {
+        "files": findings,
+        "graph": {path: sorted(deps) for path, deps in graph.items()},
+        "lint_groups": len(groups),
+    }
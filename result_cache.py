@@ -0,0 +1,185 @@
+# result_cache.py
+"""
+/analyze sonuçları için içerik adresli önbellek.
+
+Anahtar: normalize edilmiş kod + programlama dili + araç sürümleri (python,
+pylint, javac, checkstyle) üzerinden SHA-256. Arayüz dili (lang) anahtara
+girmez; çeviri önbellekten sonra yapılır, böylece tek bir analiz tüm dillere
+hizmet eder.
+
+İki katman:
+  * bellek: sınırlı boyutlu LRU, TTL'li (her gunicorn worker'ı için ayrı)
+  * disk (opsiyonel, ANALYSIS_CACHE_DIR): tüm worker'ların paylaştığı JSON dosyaları
+"""
+import functools
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from metrics import count_cache
+
+CACHE_MAX_ENTRIES = int(os.environ.get("ANALYSIS_CACHE_MAX_ENTRIES", 1024))
+CACHE_TTL = float(os.environ.get("ANALYSIS_CACHE_TTL", 600))  # saniye
+CACHE_DIR = os.environ.get("ANALYSIS_CACHE_DIR", "")  # boşsa disk katmanı kapalı
+
+CHECKSTYLE_JAR = "/usr/local/bin/checkstyle.jar"
+
+
+@functools.lru_cache(maxsize=None)
+def _pylint_version():
+    try:
+        from importlib.metadata import version
+        return version("pylint")
+    except Exception:
+        return "none"
+
+
+@functools.lru_cache(maxsize=None)
+def _javac_version():
+    try:
+        proc = subprocess.run(["javac", "-version"], capture_output=True, text=True, timeout=10)
+        return (proc.stdout or proc.stderr).strip() or "unknown"
+    except Exception:
+        return "none"
+
+
+@functools.lru_cache(maxsize=None)
+def _checkstyle_version():
+    try:
+        st = os.stat(CHECKSTYLE_JAR)
+        return f"{st.st_size}-{int(st.st_mtime)}"
+    except OSError:
+        return "none"
+
+
+def tool_versions(programming_language):
+    """Sonucu etkileyen araçların sürümleri (anahtarın parçası)."""
+    if programming_language == "java":
+        return {"javac": _javac_version(), "checkstyle": _checkstyle_version()}
+    return {"python": platform.python_version(), "pylint": _pylint_version()}
+
+
+def normalize_code(code):
+    # Satır sonlarını eşitle; girinti/boşluklar pylint sonucunu etkilediği için korunur
+    return code.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def make_key(code, programming_language, **extra):
+    """Kod + dil + araç sürümleri (+ ek ayarlar) için önbellek anahtarı."""
+    meta = {
+        "programming_language": programming_language,
+        "tools": tool_versions(programming_language),
+        "extra": extra,
+    }
+    h = hashlib.sha256()
+    h.update(json.dumps(meta, sort_keys=True).encode("utf-8"))
+    h.update(b"\0")
+    h.update(normalize_code(code).encode("utf-8"))
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Bellekte LRU + TTL, isteğe bağlı olarak diskte paylaşılan ikinci katman."""
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, cache_dir=CACHE_DIR):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    count_cache(True)
+                    return entry[1]
+                del self._entries[key]
+
+        value = self._disk_get(key, now)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                count_cache(False)
+                return None
+            self.disk_hits += 1
+            count_cache(True)
+            self._memory_put(key, value, now + self.ttl)
+        return value
+
+    def put(self, key, value):
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._memory_put(key, value, expires_at)
+        self._disk_put(key, value, expires_at)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def _memory_put(self, key, value, expires_at):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+    def _disk_get(self, key, now):
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("expires_at", 0) <= now:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry.get("value")
+
+    def _disk_put(self, key, value, expires_at):
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Önce geçici dosyaya yaz, sonra atomik olarak yerine koy (okuyan worker yarım dosya görmesin)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"expires_at": expires_at, "value": value}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+analysis_cache = ResultCache()
@@ -0,0 +1,614 @@
+# sandbox.py
+"""
+Python kodunu çalıştırmak için önceden başlatılmış "zygote" süreci.
+
+Her istekte yeni bir interpreter başlatıp geçici dosya yazmak yerine, öğrencilerin
+sık kullandığı standart kütüphane modüllerini önceden import etmiş tek bir zygote
+süreci tutulur. Her iş için zygote fork edilir; çocuk süreç root ise önce ayrıcalıksız
+kullanıcıya (SANDBOX_UID / SANDBOX_GID) geçer, ardından rlimit'leri (CPU, bellek, dosya
+boyutu, fork yasağı) uygular ve kodu doğrudan bellekten çalıştırır.
+
+Parent (gunicorn worker'ı) çocuğun stdout/stderr pipe'larını kendisi okur,
+zamanlamayı kendisi uygular; zygote yalnızca fork eder ve çıkış durumunu bildirir.
+
+Zygote kullanılamazsa SandboxUnavailable fırlatılır; çağıran taraf eski
+subprocess yoluna düşer (run_subprocess: aynı rlimit'ler, aynı kaynak ölçümü).
+
+Her çalıştırmanın sonucunda `usage` bulunur: çocuğun CPU süresi, duvar saati süresi
+ve tepe RSS'i (getrusage / wait4). profile=True ise çocuk ITIMER_PROF ile örnekleyen
+hafif bir profiler altında çalışır; en sıcak fonksiyonlar ve satırlar `profile`
+alanında döner.
+
+stdin verilirse çocuğun stdin'i bir pipe'tır (yoksa /dev/null). cache_compiled=True
+ise zygote kodu fork'tan önce derler ve derlenmiş kod nesnesini küçük bir önbellekte
+tutar; aynı kodun tekrar tekrar çalıştırıldığı durumlarda (test durumları) her çocuk
+kodu derlenmiş olarak devralır.
+
+Çıktı capture.OutputBuffer ile okunur: akış başına baştan head_bytes ve sondan
+CAPTURE_TAIL_BYTES bayt tutulur, `.truncated` kısaltılan akışların adlarını verir.
+Toplam çıktı output_limit'i geçerse çocuk öldürülür ve OutputLimitExceeded fırlatılır.
+"""
+import hashlib
+import json
+import os
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+from capture import OutputBuffer, OutputLimitExceeded, drain, CAPTURE_HEAD_BYTES, CAPTURE_OUTPUT_LIMIT
+
+SANDBOX_ZYGOTE = os.environ.get("SANDBOX_ZYGOTE", "1") != "0"
+SANDBOX_MEMORY_LIMIT = int(os.environ.get("SANDBOX_MEMORY_LIMIT_MB", 256)) * 1024 * 1024
+SANDBOX_FILE_SIZE_LIMIT = int(os.environ.get("SANDBOX_FILE_SIZE_LIMIT_MB", 10)) * 1024 * 1024
+SANDBOX_PROFILE_INTERVAL = float(os.environ.get("SANDBOX_PROFILE_INTERVAL_MS", 5)) / 1000  # saniye
+SANDBOX_PROFILE_TOP = int(os.environ.get("SANDBOX_PROFILE_TOP", 10))
+# Zaman aşımında profil raporunun yazılması için çocuğa tanınan süre
+SANDBOX_PROFILE_GRACE = 0.3
+# root olarak çalışırken kodun çalıştırıldığı kullanıcı / grup (varsayılan: nobody / nogroup)
+SANDBOX_UID = int(os.environ.get("SANDBOX_UID", 65534))
+SANDBOX_GID = int(os.environ.get("SANDBOX_GID", 65534))
+SANDBOX_COMPILED_CACHE = int(os.environ.get("SANDBOX_COMPILED_CACHE", 16))  # zygote'ta tutulan kod nesnesi
+# Linux pipe tamponu: bundan küçük stdin tek yazımda, bloklamadan gider
+_PIPE_BUFFER = 65536
+
+# Öğrenci kodlarında sık görülen modüller: zygote'ta bir kez import edilir,
+# fork edilen her çocuk bunları hazır (copy-on-write) bulur.
+PRELOAD_MODULES = (
+    "math", "random", "collections", "itertools", "functools", "string", "re",
+    "datetime", "time", "json", "statistics", "heapq", "bisect", "fractions",
+    "decimal", "operator", "copy", "typing", "dataclasses", "array", "enum",
+)
+
+_HEADER = struct.Struct("!I")
+
+
+class SandboxUnavailable(Exception):
+    pass
+
+
+# ---------------------------------------------------------------
+# Zygote tarafı (ayrı süreçte çalışır: python sandbox.py --zygote <fd>)
+# ---------------------------------------------------------------
+def _recv_exact(sock, n, initial=b""):
+    buf = bytearray(initial)
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise EOFError
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def drop_privileges(uid=SANDBOX_UID, gid=SANDBOX_GID):
+    """
+    Root ise ek grupları bırakıp ayrıcalıksız kullanıcıya geçer. Geçilemezse OSError
+    fırlatılır ve kod çalıştırılmaz (zygote çocuğu 70 ile çıkar, subprocess yolu hata verir).
+    """
+    if os.geteuid() != 0:
+        return
+    os.setgroups([])
+    os.setgid(gid)
+    os.setuid(uid)
+
+
+def apply_limits(timeout, memory_limit=SANDBOX_MEMORY_LIMIT, file_size_limit=SANDBOX_FILE_SIZE_LIMIT):
+    """Çocuk süreçte çağrılır: ayrıcalıkları bırakır; CPU, adres alanı, dosya boyutu ve fork sınırları."""
+    import resource
+
+    # RLIMIT_NPROC root'a (CAP_SYS_RESOURCE) uygulanmaz; sınırlar kullanıcı değiştikten sonra konur
+    drop_privileges()
+    limits = (
+        (resource.RLIMIT_CPU, int(timeout) + 1),
+        (resource.RLIMIT_AS, memory_limit),
+        (resource.RLIMIT_FSIZE, file_size_limit),
+        (resource.RLIMIT_NPROC, 0),  # fork yasağı
+    )
+    for which, value in limits:
+        try:
+            resource.setrlimit(which, (value, value))
+        except (ValueError, OSError):
+            pass
+
+
+class _SamplingProfiler:
+    """
+    ITIMER_PROF ile örnekleyen profiler. Yalnızca kullanıcı kodunun (<string>) çerçeveleri
+    sayılır: satır sayımı en içteki kullanıcı çerçevesine, fonksiyon sayımı yığındaki her
+    kullanıcı fonksiyonuna (kapsayıcı) yazılır.
+    """
+
+    def __init__(self, interval=SANDBOX_PROFILE_INTERVAL):
+        self.interval = interval
+        self.samples = 0
+        self.lines = {}  # (fonksiyon, satır) -> örnek
+        self.functions = {}  # (fonksiyon, tanım satırı) -> örnek
+
+    def _sample(self, signum, frame):
+        self.samples += 1
+        innermost = True
+        seen = set()
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename == "<string>":
+                if innermost:
+                    key = (code.co_name, frame.f_lineno)
+                    self.lines[key] = self.lines.get(key, 0) + 1
+                    innermost = False
+                key = (code.co_name, code.co_firstlineno)
+                if key not in seen:
+                    seen.add(key)
+                    self.functions[key] = self.functions.get(key, 0) + 1
+            frame = frame.f_back
+
+    def start(self):
+        signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, signal.SIG_IGN)
+
+    def report(self, top=SANDBOX_PROFILE_TOP):
+        total = self.samples or 1
+
+        def rows(counts):
+            ranked = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)[:top]
+            return [{"function": name, "line": line, "samples": n, "percent": round(100 * n / total, 1)}
+                    for (name, line), n in ranked]
+
+        return {"interval_ms": self.interval * 1000, "samples": self.samples,
+                "functions": rows(self.functions), "lines": rows(self.lines)}
+
+
+def _write_profile(profiler, fd):
+    profiler.stop()
+    try:
+        os.write(fd, json.dumps(profiler.report()).encode("utf-8"))
+    except (OSError, ValueError):
+        pass
+
+
+def _run_child(job, out_fd, err_fd, profile_fd=None, stdin_fd=None, compiled=None):
+    """Fork edilen çocukta çalışır; asla geri dönmez."""
+    import builtins
+    import linecache
+    import random
+    import resource
+    import traceback
+
+    os.setpgid(0, 0)
+    os.dup2(stdin_fd if stdin_fd is not None else os.open(os.devnull, os.O_RDONLY), 0)
+    os.dup2(out_fd, 1)
+    os.dup2(err_fd, 2)
+    if profile_fd is not None:
+        os.dup2(profile_fd, 3)
+        profile_fd = 3
+    # Zygote'un diğer işlere ait status pipe'ları bu çocukta açık kalmasın
+    os.closerange(3 if profile_fd is None else 4, resource.getrlimit(resource.RLIMIT_NOFILE)[0])
+
+    apply_limits(job["timeout"], job["memory_limit"], job["file_size_limit"])
+
+    sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+    sys.stderr = open(2, "w", encoding="utf-8", closefd=False, buffering=1)
+    sys.argv = ["<string>"]
+    random.seed()  # zygote'un rastgele durumu tüm çocuklara kopyalanmasın
+
+    code = job["code"]
+    # Traceback'lerde kaynak satırlarının da görünmesi için
+    linecache.cache["<string>"] = (len(code), None, code.splitlines(True), "<string>")
+
+    profiler = None
+    if profile_fd is not None:
+        profiler = _SamplingProfiler()
+        # zaman aşımında parent SIGUSR2 gönderir: o ana kadarki profil yazılır
+        signal.signal(signal.SIGUSR2, lambda *_: (_write_profile(profiler, profile_fd), os._exit(124)))
+        profiler.start()
+
+    exit_code = 0
+    try:
+        exec(compiled or compile(code, "<string>", "exec"), {"__name__": "__main__", "__builtins__": builtins})
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException as e:
+        # İlk çerçeve (bu fonksiyon) atlanır; çıktı normal bir python sürecininkiyle aynı olur
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        exit_code = 1
+    finally:
+        if profiler is not None:
+            _write_profile(profiler, profile_fd)
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except BaseException:
+            pass
+    os._exit(exit_code & 0xFF)
+
+
+class _Reaper:
+    """Zygote'un çocuklarını bekler ve çıkış durumlarını status pipe'ına yazar."""
+
+    def __init__(self):
+        self._lock = threading.Condition()
+        self._status_fds = {}  # pid -> status fd
+        self._early = {}  # kayıt olmadan önce biten çocuklar
+
+    def register(self, pid, status_fd):
+        with self._lock:
+            if pid in self._early:
+                self._report(status_fd, self._early.pop(pid))
+            else:
+                self._status_fds[pid] = status_fd
+            self._lock.notify()
+
+    def _report(self, status_fd, result):
+        status, rusage = result
+        line = "exit %d %f %f %d\n" % (os.waitstatus_to_exitcode(status),
+                                       rusage.ru_utime, rusage.ru_stime, rusage.ru_maxrss)
+        try:
+            os.write(status_fd, line.encode())
+        except OSError:
+            pass
+        os.close(status_fd)
+
+    def run(self):
+        while True:
+            try:
+                pid, status, rusage = os.wait4(-1, 0)
+            except ChildProcessError:
+                with self._lock:
+                    self._lock.wait(1)
+                continue
+            with self._lock:
+                status_fd = self._status_fds.pop(pid, None)
+                if status_fd is None:
+                    self._early[pid] = (status, rusage)
+                    continue
+                self._report(status_fd, (status, rusage))
+
+
+class _CompiledCache:
+    """Zygote'ta kod metninin özeti -> derlenmiş kod nesnesi (en eskisi atılır)."""
+
+    def __init__(self, size=SANDBOX_COMPILED_CACHE):
+        self.size = size
+        self._items = {}
+
+    def get(self, code):
+        key = hashlib.sha1(code.encode("utf-8", "surrogatepass")).digest()
+        compiled = self._items.get(key)
+        if compiled is None:
+            try:
+                compiled = compile(code, "<string>", "exec")
+            except (SyntaxError, ValueError):
+                return None  # hatayı çocuk kendi derlemesinde raporlar
+            if len(self._items) >= self.size:
+                del self._items[next(iter(self._items))]
+            self._items[key] = compiled
+        return compiled
+
+
+def zygote_main(control_fd):
+    for name in PRELOAD_MODULES:
+        try:
+            __import__(name)
+        except ImportError:
+            pass
+
+    sock = socket.socket(fileno=control_fd)
+    reaper = _Reaper()
+    compiled_cache = _CompiledCache()
+    threading.Thread(target=reaper.run, daemon=True).start()
+
+    while True:
+        try:
+            head, fds, _, _ = socket.recv_fds(sock, _HEADER.size, 5)
+            if not head:
+                break
+            head = _recv_exact(sock, _HEADER.size, head)
+            (size,) = _HEADER.unpack(head)
+            job = json.loads(_recv_exact(sock, size))
+        except (EOFError, OSError, ValueError):
+            break
+        # sıra: stdout, stderr, status, [stdin], [profile]
+        out_fd, err_fd, status_fd = fds[:3]
+        extra = fds[3:]
+        stdin_fd = extra.pop(0) if job.get("stdin") else None
+        profile_fd = extra.pop(0) if extra else None
+        compiled = compiled_cache.get(job["code"]) if job.get("cache_compiled") else None
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                sock.close()
+                os.close(status_fd)
+                _run_child(job, out_fd, err_fd, profile_fd, stdin_fd, compiled)
+            finally:
+                os._exit(70)
+
+        os.close(out_fd)
+        os.close(err_fd)
+        for fd in (stdin_fd, profile_fd):
+            if fd is not None:
+                os.close(fd)
+        try:
+            os.write(status_fd, b"pid %d\n" % pid)
+        except OSError:
+            pass
+        reaper.register(pid, status_fd)
+
+
+# ---------------------------------------------------------------
+# Parent tarafı (gunicorn worker'ı)
+# ---------------------------------------------------------------
+class _Zygote:
+    def __init__(self):
+        parent_sock, child_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.proc = subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), "--zygote", str(child_sock.fileno())],
+                pass_fds=(child_sock.fileno(),),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+            )
+        finally:
+            child_sock.close()
+        self.sock = parent_sock
+        self.send_lock = threading.Lock()
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def send(self, job, fds):
+        payload = json.dumps(job).encode("utf-8")
+        with self.send_lock:
+            socket.send_fds(self.sock, [_HEADER.pack(len(payload))], fds)
+            self.sock.sendall(payload)
+
+    def close(self):
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+        try:
+            self.proc.kill()
+            self.proc.wait(1)
+        except Exception:
+            pass
+
+
+_zygote = None
+_zygote_pid = None
+_zygote_lock = threading.Lock()
+
+
+def _get_zygote():
+    global _zygote, _zygote_pid
+    with _zygote_lock:
+        # fork sonrası (gunicorn) her süreç kendi zygote'unu başlatır
+        if _zygote is None or _zygote_pid != os.getpid() or not _zygote.alive():
+            if _zygote is not None and _zygote_pid == os.getpid():
+                _zygote.close()
+            _zygote = _Zygote()
+            _zygote_pid = os.getpid()
+        return _zygote
+
+
+def _parse_status(text):
+    pid, exit_line = None, None
+    for line in text.splitlines():
+        if line.startswith("pid "):
+            pid = int(line.split()[1])
+        elif line.startswith("exit "):
+            exit_line = line.split()
+    return pid, exit_line
+
+
+def _kill_group(pid):
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except OSError:
+        # çocuk henüz kendi süreç grubunu kuramamış olabilir
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+def _usage(cpu_time, wall_time, peak_rss_kb):
+    return {"cpu_time": round(cpu_time, 3) if cpu_time is not None else None,
+            "wall_time": round(wall_time, 3),
+            "peak_rss_kb": peak_rss_kb}
+
+
+def _finish(cmd, state, timeout, output_limit, returncode, out, err, usage, profile=None):
+    """drain sonucuna göre CompletedProcess döndürür ya da TimeoutExpired / OutputLimitExceeded fırlatır."""
+    stdout, stderr = out.text(), err.text()
+    truncated = tuple(name for name, buffer in (("stdout", out), ("stderr", err)) if buffer.truncated)
+    if state == "eof":
+        result = subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+    elif state == "timeout":
+        result = subprocess.TimeoutExpired(cmd, timeout, output=stdout, stderr=stderr)
+    else:
+        result = OutputLimitExceeded(cmd, output_limit, output=stdout, stderr=stderr)
+        truncated = ("stdout", "stderr")  # çocuk yazmayı bitirmeden öldürüldü
+    result.usage, result.profile, result.truncated = usage, profile, truncated
+    if state != "eof":
+        raise result
+    return result
+
+
+def _feed(fd, data):
+    """stdin verisini yazar ve pipe'ı kapatır; okumadan çıkan çocuk (EPIPE) sorun değildir."""
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _start_feed(fd, data):
+    # Pipe tamponuna sığmayan girdi ayrı thread'de yazılır; çocuk girdiyi okumadan
+    # çıktı üretirken parent çıktıyı boşaltmaya devam edebilsin
+    if len(data) <= _PIPE_BUFFER:
+        _feed(fd, data)
+    else:
+        threading.Thread(target=_feed, args=(fd, data), daemon=True).start()
+
+
+def run_python(code, timeout=3, profile=False, stdin=None, memory_limit=SANDBOX_MEMORY_LIMIT,
+               cache_compiled=False, head_bytes=CAPTURE_HEAD_BYTES, output_limit=CAPTURE_OUTPUT_LIMIT):
+    """
+    Kodu zygote'tan fork edilen bir çocukta çalıştırır.
+    subprocess.CompletedProcess döndürür (ek olarak .usage, .profile ve .truncated alanlarıyla);
+    süre aşılırsa subprocess.TimeoutExpired, çıktı sınırı aşılırsa OutputLimitExceeded
+    fırlatılır (ikisi de aynı alanları taşır).
+    """
+    if not SANDBOX_ZYGOTE or not hasattr(socket, "send_fds") or not hasattr(os, "fork"):
+        raise SandboxUnavailable("zygote devre dışı")
+
+    job = {
+        "code": code,
+        "timeout": timeout,
+        "memory_limit": memory_limit,
+        "file_size_limit": SANDBOX_FILE_SIZE_LIMIT,
+        "stdin": stdin is not None,
+        "cache_compiled": cache_compiled,
+    }
+    pipes = [os.pipe() for _ in range(3)]
+    readers = [r for r, _ in pipes]
+    out_r, err_r, status_r = readers
+    # çocuğa giden uçlar; stdin pipe'ının okuma ucu çocuğa, yazma ucu bize kalır
+    child_fds = [w for _, w in pipes]
+    stdin_w = None
+    if stdin is not None:
+        stdin_r, stdin_w = os.pipe()
+        child_fds.append(stdin_r)
+    profile_r = None
+    if profile:
+        profile_r, profile_w = os.pipe()
+        readers.append(profile_r)
+        child_fds.append(profile_w)
+    started = time.monotonic()
+    try:
+        for attempt in range(2):
+            try:
+                _get_zygote().send(job, child_fds)
+                break
+            except OSError:
+                if attempt:
+                    raise SandboxUnavailable("zygote'a ulaşılamadı")
+    except BaseException:
+        for fd in readers + ([stdin_w] if stdin_w is not None else []):
+            os.close(fd)
+        raise
+    finally:
+        for fd in child_fds:
+            os.close(fd)
+    if stdin_w is not None:
+        _start_feed(stdin_w, stdin.encode("utf-8"))
+
+    # status ve profil küçük, iç kullanımlı pipe'lar: yalnızca baştan okunur
+    buffers = {out_r: OutputBuffer(head_bytes), err_r: OutputBuffer(head_bytes),
+               status_r: OutputBuffer(tail_bytes=0)}
+    if profile_r is not None:
+        buffers[profile_r] = OutputBuffer(1024 * 1024, 0)
+    try:
+        state = drain(buffers, started + timeout, output_limit)
+        wall_time = time.monotonic() - started
+        pid, exit_line = _parse_status(buffers[status_r].data().decode())
+        if state != "eof" and pid:
+            if profile_r is not None:
+                try:
+                    os.kill(pid, signal.SIGUSR2)
+                except OSError:
+                    pass
+                drain({profile_r: buffers[profile_r]}, time.monotonic() + SANDBOX_PROFILE_GRACE)
+            _kill_group(pid)
+            # zygote çıkış satırını (rusage) öldürülen çocuk için de yazar
+            drain({status_r: buffers[status_r]}, time.monotonic() + 1)
+            pid, exit_line = _parse_status(buffers[status_r].data().decode())
+    finally:
+        for fd in readers:
+            os.close(fd)
+
+    if exit_line is not None:
+        usage = _usage(float(exit_line[2]) + float(exit_line[3]), wall_time, int(exit_line[4]))
+    else:
+        usage = _usage(None, wall_time, None)
+    profile_report = None
+    if profile_r is not None:
+        try:
+            profile_report = json.loads(buffers[profile_r].data() or b"null")
+        except ValueError:
+            pass
+
+    if state == "eof" and exit_line is None:
+        raise SandboxUnavailable("zygote çıkış durumunu bildirmedi")
+    return _finish("<sandbox>", state, timeout, output_limit, int(exit_line[1]) if exit_line else None,
+                   buffers[out_r], buffers[err_r], usage, profile_report)
+
+
+def run_subprocess(cmd, timeout=3, input=None, memory_limit=SANDBOX_MEMORY_LIMIT, cwd=None, limits=None,
+                   head_bytes=CAPTURE_HEAD_BYTES, output_limit=CAPTURE_OUTPUT_LIMIT):
+    """
+    Zygote yokken kullanılan yol: ayrı bir interpreter aynı rlimit'lerle çalışır,
+    kaynak kullanımı wait4 ile okunur. run_python ile aynı dönüş/istisna biçimi (profile=None).
+    input verilirse stdin'e yazılır (ör. `python -` için kodun kendisi). limits verilirse
+    apply_limits yerine çocukta o çağrılır (ör. JVM için farklı rlimit'ler).
+    """
+    started = time.monotonic()
+    limits = limits or (lambda: apply_limits(timeout, memory_limit))
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL if input is None else subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd,
+                            preexec_fn=lambda: (os.setpgid(0, 0), limits()))
+    if input is not None:
+        # stdin'in sahipliği _feed'e geçer (pipe'ı o kapatır)
+        stdin_fd = os.dup(proc.stdin.fileno())
+        proc.stdin.close()
+        _start_feed(stdin_fd, input.encode("utf-8"))
+    out_r, err_r = proc.stdout.fileno(), proc.stderr.fileno()
+    buffers = {out_r: OutputBuffer(head_bytes), err_r: OutputBuffer(head_bytes)}
+    try:
+        deadline = started + timeout
+        state = drain(buffers, deadline, output_limit)
+        # pipe'lar kapandı ama süreç hâlâ yaşıyor olabilir (ör. stdout'u kapatıp uyuyan kod)
+        reaped = None
+        while state == "eof":
+            reaped = os.wait4(proc.pid, os.WNOHANG)
+            if reaped[0]:
+                break
+            if time.monotonic() >= deadline:
+                state = "timeout"
+            else:
+                time.sleep(0.005)
+        if state != "eof":
+            _kill_group(proc.pid)
+            reaped = os.wait4(proc.pid, 0)
+        _, status, rusage = reaped
+        wall_time = time.monotonic() - started
+        proc.returncode = os.waitstatus_to_exitcode(status)
+    finally:
+        proc.stdout.close()
+        proc.stderr.close()
+
+    usage = _usage(rusage.ru_utime + rusage.ru_stime, wall_time, rusage.ru_maxrss)
+    return _finish(cmd, state, timeout, output_limit, proc.returncode, buffers[out_r], buffers[err_r], usage)
+
+
+if __name__ == "__main__" and len(sys.argv) == 3 and sys.argv[1] == "--zygote":
+    zygote_main(int(sys.argv[2]))
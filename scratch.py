@@ -0,0 +1,139 @@
+# scratch.py
+"""
+Gerçek dosya isteyen araçlar (javac, checkstyle) için yeniden kullanılan çalışma dizinleri.
+
+Her istekte mkdtemp + rmtree yerine her süreç (gunicorn worker'ı) tmpfs üzerinde
+(/dev/shm varsa) küçük bir dizin havuzu tutar. Dizin iş bitince silinmez, içi
+yerinde boşaltılıp havuza geri konur; overlay dosya sisteminde dizin oluşturma /
+silme ve fsync yükü oluşmaz.
+
+    with workspace("java") as path:
+        ...
+
+Kodu stdin'den okuyabilen araçlar (python -, pylint --from-stdin) hiç dosya kullanmaz.
+"""
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+
+
+def _default_root():
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return tempfile.gettempdir()
+
+
+SCRATCH_ROOT = os.environ.get("SCRATCH_ROOT") or _default_root()
+SCRATCH_MAX_IDLE = int(os.environ.get("SCRATCH_MAX_IDLE", 8))  # tür başına havuzda bekleyen dizin
+
+
+def clean(path):
+    """Dizinin içini boşaltır; dizinin kendisi kalır."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+class ScratchPool:
+    """Süreç başına yeniden kullanılan çalışma dizinleri. Thread-safe."""
+
+    def __init__(self, root=SCRATCH_ROOT, max_idle=SCRATCH_MAX_IDLE):
+        self.root = root
+        self.max_idle = max_idle
+        self._idle = {}  # tür -> boş dizin listesi
+        self._count = 0
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def _base(self):
+        # gunicorn fork'undan sonra her süreç kendi dizinini kullanır
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._idle = {}
+                    self._pid = os.getpid()
+                    self._remove_stale()
+                    atexit.register(shutil.rmtree, self._dir(), True)
+        return self._dir()
+
+    def _dir(self):
+        return os.path.join(self.root, f"kod-analiz-{os.getpid()}")
+
+    def _remove_stale(self):
+        # ölmüş worker'lardan kalan dizinler
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return
+        for name in names:
+            pid = name[len("kod-analiz-"):]
+            if name.startswith("kod-analiz-") and pid.isdigit() and not _pid_alive(int(pid)):
+                shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+
+    def acquire(self, kind):
+        base = self._base()
+        with self._lock:
+            idle = self._idle.get(kind)
+            if idle:
+                return idle.pop()
+            self._count += 1
+            path = os.path.join(base, f"{kind}-{self._count}")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def release(self, kind, path):
+        try:
+            clean(path)
+        except OSError:
+            shutil.rmtree(path, ignore_errors=True)
+            return
+        with self._lock:
+            idle = self._idle.setdefault(kind, [])
+            if len(idle) < self.max_idle:
+                idle.append(path)
+                return
+        shutil.rmtree(path, ignore_errors=True)
+
+    @contextmanager
+    def workspace(self, kind):
+        path = self.acquire(kind)
+        try:
+            yield path
+        finally:
+            self.release(kind, path)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+
+
+_pool = ScratchPool()
+
+
+def workspace(kind):
+    """`with workspace("java") as path:` — iş bitince içi boşaltılıp havuza döner."""
+    return _pool.workspace(kind)
+
+
+def acquire(kind):
+    return _pool.acquire(kind)
+
+
+def release(kind, path):
+    _pool.release(kind, path)
@@ -0,0 +1,204 @@
+# singleflight.py
+"""
+Aynı anda gelen özdeş isteklerin tek çalıştırmada birleştirilmesi (single-flight).
+
+Öğretmen "şimdi çalıştırın" dediğinde aynı kod bir saniye içinde onlarca kez gelir.
+Anahtarı (result_cache.make_key: kod + dil + araç ayarları; arayüz dili hariç) aynı
+olan isteklerde işi yalnızca ilk istek yapar, diğerleri onun sonucunu bekler. Çeviri
+her isteğin kendi dilinde sonradan yapılır.
+
+İki seviye:
+  * süreç içi: anahtar başına bir çağrı kaydı; aynı worker'daki takipçi thread'ler
+    lideri bekler (lider istisna fırlatırsa aynı istisnayı alırlar).
+  * worker'lar arası: lider SINGLEFLIGHT_DIR (tmpfs) altındaki <anahtar>.lock
+    dosyasını flock ile tutar ve bitince sonucu <anahtar>.json'a yazar. Kilidi
+    alamayan worker kilit bırakılana kadar bekler, sonra bu sonucu okur. Sonuç
+    yoksa (lider öldü, istisna fırlattı ya da sonuç JSON'a çevrilemedi) işi
+    kendisi yapar; kilidi tuttuğu için kendi takipçileri de onu bekler.
+
+Bu bir önbellek değildir: sonuç yalnızca istek geldiğinde sürmekte olan işin
+sonucuysa kullanılır. Biten sonuçların yeniden kullanımı result_cache'in işidir.
+
+    result = coalesce(cache_key, lambda: analyze_python(code))
+"""
+import fcntl
+import json
+import os
+import tempfile
+import threading
+import time
+
+import scratch
+from metrics import count_coalesced
+
+SINGLEFLIGHT = os.environ.get("SINGLEFLIGHT", "1") != "0"
+SINGLEFLIGHT_DIR = os.environ.get("SINGLEFLIGHT_DIR") or os.path.join(scratch.SCRATCH_ROOT,
+                                                                      "kod-analiz-singleflight")
+SINGLEFLIGHT_WAIT = float(os.environ.get("SINGLEFLIGHT_WAIT", 60))  # takipçinin en fazla beklediği süre
+SINGLEFLIGHT_POLL = float(os.environ.get("SINGLEFLIGHT_POLL", 0.02))  # başka worker'ın kilidini yoklama
+# Bu yaştan eski kilit/sonuç dosyaları silinir (bekleme süresinden uzun olmalı)
+SINGLEFLIGHT_SWEEP_AGE = float(os.environ.get("SINGLEFLIGHT_SWEEP_AGE", 300))
+
+_MISSING = object()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self, directory=SINGLEFLIGHT_DIR, wait=SINGLEFLIGHT_WAIT, poll=SINGLEFLIGHT_POLL):
+        self.directory = directory
+        self.wait = wait
+        self.poll = poll
+        self._calls = {}  # anahtar -> _Call (bu süreçte süren)
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+
+    def do(self, key, fn):
+        """fn() sonucunu döndürür; aynı anahtarla süren bir çağrı varsa onun sonucunu bekler."""
+        arrived = time.time()
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(self.wait):
+                return fn()  # lider çok uzun sürdü; daha fazla bekletmeden kendimiz çalıştırırız
+            count_coalesced("process")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._across_workers(key, fn, arrived)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    # ----------------- worker'lar arası -----------------
+    def _path(self, key, suffix):
+        return os.path.join(self.directory, key + suffix)
+
+    def _across_workers(self, key, fn, arrived):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            lock_fd = self._try_lock(self._path(key, ".lock"))
+        except OSError:
+            return fn()  # koordinasyon dizini kullanılamıyor: yalnızca süreç içi birleştirme
+
+        if lock_fd is None:
+            lock_fd = self._wait_lock(key)
+            if lock_fd is None:
+                return fn()
+        try:
+            # lider biz kilidi beklerken (ya da kilidi denemeden hemen önce) bitirmiş olabilir
+            result = self._read_result(key, arrived)
+            if result is not _MISSING:
+                count_coalesced("worker")
+                return result
+            result = fn()
+            self._write_result(key, result)
+            return result
+        finally:
+            os.close(lock_fd)  # flock da bırakılır
+            self._maybe_sweep()
+
+    def _try_lock(self, path):
+        """Kilit alınırsa fd, başka süreç tutuyorsa None döndürür."""
+        while True:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return None
+            # süpürücü dosyayı biz kilitlemeden hemen önce silmiş olabilir; o zaman yeniden dene
+            try:
+                if os.fstat(fd).st_ino == os.stat(path).st_ino:
+                    return fd
+            except FileNotFoundError:
+                pass
+            os.close(fd)
+
+    def _wait_lock(self, key):
+        deadline = time.monotonic() + self.wait
+        path = self._path(key, ".lock")
+        while time.monotonic() < deadline:
+            time.sleep(self.poll)
+            try:
+                fd = self._try_lock(path)
+            except OSError:
+                return None
+            if fd is not None:
+                return fd
+        return None
+
+    def _read_result(self, key, arrived):
+        try:
+            with open(self._path(key, ".json"), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return _MISSING
+        # istekten önce bitmiş bir çalıştırmanın sonucu kullanılmaz (önbellek değil)
+        if entry.get("finished_at", 0) < arrived:
+            return _MISSING
+        return entry.get("result")
+
+    def _write_result(self, key, result):
+        path = self._path(key, ".json")
+        tmp_path = None
+        try:
+            # okuyan worker yarım dosya görmesin: geçici dosya + atomik yer değiştirme
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"finished_at": time.time(), "result": result}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _maybe_sweep(self):
+        now = time.time()
+        if now - self._last_sweep < SINGLEFLIGHT_SWEEP_AGE / 2:
+            return
+        self._last_sweep = now
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                if now - os.stat(path).st_mtime < SINGLEFLIGHT_SWEEP_AGE:
+                    continue
+                if not name.endswith(".lock"):
+                    os.remove(path)
+                    continue
+                # kilit dosyası yalnızca kimse tutmuyorsa, kilit bizdeyken silinir
+                fd = self._try_lock(path)
+                if fd is not None:
+                    os.remove(path)
+                    os.close(fd)
+            except OSError:
+                pass
+
+
+_flight = SingleFlight()
+
+
+def coalesce(key, fn):
+    """`key` için süren özdeş bir iş varsa onun sonucunu bekler; yoksa fn()'i çalıştırır."""
+    if not SINGLEFLIGHT:
+        return fn()
+    return _flight.do(key, fn)
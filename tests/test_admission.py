@@ -0,0 +1,103 @@
+# tests/test_admission.py
+"""
+admission: istemciler arası sıralı (round-robin) yuva dağıtımı, BackendBusy ve 429
+cevabı, X-Forwarded-For'dan istemci kimliği.
+"""
+import threading
+import time
+
+import pytest
+from werkzeug.test import EnvironBuilder
+from werkzeug.wrappers import Request
+
+import admission
+from admission import BackendBusy, Limiter, client_id_from_request
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "koşul zamanında sağlanmadı"
+        time.sleep(0.001)
+
+
+def test_waiting_clients_are_served_round_robin():
+    limiter = Limiter("test", concurrency=1, queue_depth=10, wait_timeout=5, per_client_queue=4)
+    order = []
+
+    def worker(client, label):
+        with limiter.slot(client):
+            order.append(label)
+
+    limiter.acquire("holder")
+    threads = []
+    # A üç, ardından B bir istek kuyruğa koyar
+    for client, label in (("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1")):
+        thread = threading.Thread(target=worker, args=(client, label))
+        thread.start()
+        threads.append(thread)
+        _wait_until(lambda: limiter.stats()["waiting"] == len(threads))
+    limiter.release()
+    for thread in threads:
+        thread.join(2)
+
+    assert order == ["a1", "b1", "a2", "a3"]
+    assert limiter.stats()["active"] == 0
+
+
+def test_full_queues_raise_backend_busy():
+    limiter = Limiter("test", concurrency=1, queue_depth=1, wait_timeout=5, per_client_queue=1)
+    limiter.acquire("holder")
+    waiter = threading.Thread(target=limiter.acquire, args=("a",))
+    waiter.start()
+    _wait_until(lambda: limiter.stats()["waiting"] == 1)
+
+    with pytest.raises(BackendBusy) as busy:
+        limiter.acquire("b")  # toplam kuyruk dolu
+    assert busy.value.backend == "test" and busy.value.retry_after >= 1
+    assert limiter.stats()["rejected"] == 1
+
+    limiter.release()
+    waiter.join(2)
+
+
+def test_wait_timeout_raises_backend_busy():
+    limiter = Limiter("test", concurrency=1, queue_depth=4, wait_timeout=5)
+    limiter.acquire("holder")
+    started = time.monotonic()
+    with pytest.raises(BackendBusy):
+        limiter.acquire("a", wait=0.05)  # istek bütçesi wait_timeout'tan kısa
+    assert time.monotonic() - started < 1
+    assert limiter.stats()["waiting"] == 0
+
+
+def test_backend_busy_becomes_429_with_retry_after(monkeypatch):
+    import app
+
+    def busy(*args, **kwargs):
+        raise BackendBusy("python-run", 7)
+
+    monkeypatch.setattr(app, "run_analysis", busy)
+    response = app.app.test_client().post("/analyze", json={"code": "print(1)\n"})
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "7"
+    assert response.get_json()["backend"] == "python-run"
+    assert response.get_json()["retry_after"] == 7
+
+
+def _request(forwarded=None, remote_addr="10.0.0.2"):
+    headers = {"X-Forwarded-For": forwarded} if forwarded is not None else {}
+    return Request(EnvironBuilder(headers=headers, environ_base={"REMOTE_ADDR": remote_addr}).get_environ())
+
+
+@pytest.mark.parametrize("hops, forwarded, expected", [
+    (1, None, "10.0.0.2"),
+    (1, "203.0.113.5", "203.0.113.5"),
+    (1, "6.6.6.6, 203.0.113.5", "203.0.113.5"),  # soldaki girdi istemcinin uydurması
+    (2, "6.6.6.6, 203.0.113.5, 10.1.1.1", "203.0.113.5"),
+    (2, "203.0.113.5", "10.0.0.2"),  # proxy'yi atlayan istek
+    (0, "6.6.6.6", "10.0.0.2"),
+])
+def test_client_id_uses_trusted_hops(monkeypatch, hops, forwarded, expected):
+    monkeypatch.setattr(admission, "TRUSTED_PROXY_HOPS", hops)
+    assert client_id_from_request(_request(forwarded)) == expected
@@ -0,0 +1,63 @@
+# tests/test_astroid_cache.py
+"""
+astroid_cache: dosyaya yazılan önbellek yeni bir süreçte yüklenir ve pylint bulguları
+önbelleksiz çalıştırmayla aynı kalır. Her adım temiz bir MANAGER için ayrı süreçtir.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pylint")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = """import collections
+import datetime
+import math
+import random
+
+
+def main():
+    counts = collections.Counter("abca")
+    print(math.sqroot(2), random.randint(1), counts.most_commonx(1))
+    print(datetime.datetime.now().yearx, math.pi.real)
+"""
+
+LINT = """
+import json, sys
+import astroid_cache
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+reporter = CollectingReporter()
+Run(["--disable=all", "--enable=E", sys.argv[1]], reporter=reporter, exit=False)
+print(json.dumps({"installed": astroid_cache.installed,
+                  "messages": sorted((m.line, m.symbol, m.msg) for m in reporter.messages)}))
+"""
+
+
+def _lint(tmp_path, path, **env):
+    proc = subprocess.run([sys.executable, "-c", LINT, str(path)], cwd=ROOT, capture_output=True, text=True,
+                          timeout=300, env={**os.environ, "ASTROID_CACHE_DIR": str(tmp_path / "cache"), **env})
+    assert proc.returncode == 0, proc.stderr
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def test_saved_cache_loads_and_lints_like_a_fresh_build(tmp_path):
+    path = tmp_path / "sample.py"
+    path.write_text(SAMPLE)
+
+    built = _lint(tmp_path, path)
+    assert built["installed"]["source"] == "built"
+    assert built["installed"]["modules"] > 0  # dosya yazılabildi
+    loaded = _lint(tmp_path, path)
+    assert loaded["installed"]["source"] == "disk"
+    assert loaded["installed"]["modules"] == built["installed"]["modules"]
+    uncached = _lint(tmp_path, path, ASTROID_CACHE="0")
+    assert uncached["installed"] is None
+
+    assert loaded["messages"] == uncached["messages"] == built["messages"]
+    assert {symbol for _, symbol, _ in loaded["messages"]} >= {"no-member", "no-value-for-parameter"}
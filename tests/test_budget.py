@@ -0,0 +1,92 @@
+# tests/test_budget.py
+"""
+budget: seviyeye ve kalan süreye göre aşama planı, kısmi sonuç, istek doğrulaması.
+"""
+import pytest
+
+import budget
+from budget import Budget, BudgetError, parse_budget
+
+
+@pytest.fixture
+def latencies(monkeypatch):
+    """Gözlenen aşama süreleri (saniye); verilmeyen aşamada STAGE_PRIORS kullanılır."""
+    observed = {}
+    monkeypatch.setattr(budget, "stage_quantile", lambda stage, q, min_samples: observed.get(stage))
+    return observed
+
+
+def test_without_deadline_every_stage_of_the_level_runs(latencies):
+    latencies.update(fast=10.0, python_run=10.0, pylint=10.0)
+    plan = Budget("deep")
+    plan.plan()
+    assert [plan.wants(s) for s in ("fast", "python_run", "pylint")] == [True, True, True]
+    assert not plan.partial
+    assert plan.remaining() is None and plan.limit(3) == 3
+
+
+def test_level_selects_stages(latencies):
+    plan = Budget("quick", deadline_ms=10000)
+    plan.plan()
+    assert plan.wants("fast") and not plan.wants("python_run") and not plan.wants("pylint")
+    assert not plan.partial  # istenmeyen aşama atlanmış sayılmaz
+
+
+def test_stage_that_does_not_fit_is_skipped(latencies):
+    latencies.update(fast=0.001, python_run=0.5, pylint=0.02)
+    plan = Budget("deep", deadline_ms=100)
+    plan.plan()
+    assert not plan.wants("python_run")
+    # pylint çalıştırmayla paralel yürür: yalnızca kendi süresi sığmalı
+    assert plan.wants("pylint")
+    assert plan.partial and plan.skipped == ["python_run"]
+
+
+def test_priors_fit_a_warm_run_into_a_short_deadline(latencies):
+    # gözlem yokken 50 ms'lik bütçede çalıştırma yapılır, yalnızca pylint atlanır
+    plan = Budget("deep", deadline_ms=50)
+    plan.plan()
+    assert plan.wants("fast") and plan.wants("python_run")
+    assert plan.skipped == ["pylint"]
+
+
+def test_sequential_stages_share_the_budget(latencies):
+    latencies.update(fast=0.06, python_run=0.06)
+    plan = Budget("standard", deadline_ms=100)
+    plan.plan()
+    assert plan.wants("fast") and not plan.wants("python_run")
+
+
+def test_limit_leaves_room_for_reserved_stages(latencies):
+    latencies.update(fast=0.2)
+    plan = Budget("standard", deadline_ms=1000)
+    assert plan.limit(3, reserve=("fast",)) == pytest.approx(0.8, abs=0.05)
+    assert plan.limit(0.1) == 0.1
+    plan.skip("fast")
+    assert plan.limit(3, reserve=("fast",)) == pytest.approx(1.0, abs=0.05)  # atlanan aşama pay almaz
+
+
+def test_skip_marks_result_partial_once():
+    plan = Budget("deep")
+    plan.skip("pylint")
+    plan.skip("pylint")
+    assert plan.skipped == ["pylint"] and plan.partial and not plan.wants("pylint")
+
+
+def test_parse_budget():
+    assert parse_budget({}) is None
+    assert parse_budget({"deadline_ms": 50, "deep": True}).level == "deep"
+    assert parse_budget({"level": "QUICK"}).level == "quick"
+    assert parse_budget({"level": "quick"}).deadline is None
+
+
+@pytest.mark.parametrize("data", [
+    {"level": "thorough"},
+    {"deadline_ms": 0},
+    {"deadline_ms": -5},
+    {"deadline_ms": "50"},
+    {"deadline_ms": True},
+])
+def test_parse_budget_rejects_invalid_requests(data):
+    with pytest.raises(BudgetError):
+        parse_budget(data)
@@ -0,0 +1,100 @@
+# tests/test_fast_checker.py
+"""
+fast_checker.check: sık yapılan hatalar bulunur, yanlış alarm üretilmez.
+"""
+import pytest
+
+from fast_checker import check
+
+
+def _found(code):
+    return [(f["error_type"], f["line"]) for f in check(code)]
+
+
+def _cpython_message(code):
+    try:
+        exec(compile(code, "<test>", "exec"), {})
+    except TypeError as e:
+        return str(e)
+    raise AssertionError("TypeError bekleniyordu")
+
+
+def test_clean_code_has_no_findings():
+    code = (
+        "import math\n"
+        "from collections import *\n"
+        "def area(r, *, precise=False):\n"
+        "    total = 0\n"
+        "    for i in range(3):\n"
+        "        total += i\n"
+        "    squares = [k * k for k in range(total) if (m := k)]\n"
+        "    return math.pi * r * r + len(squares) + m + later()\n"
+        "def later():\n"
+        "    return len(Counter('ab'))\n"
+        "print(area(2, precise=True))\n"
+    )
+    assert _found(code) == []
+
+
+def test_undefined_name():
+    assert check("print(totl)\n") == [
+        {"error_type": "NameError", "line": 1, "original_message": "name 'totl' is not defined"}]
+
+
+def test_class_scope_is_not_visible_in_methods():
+    code = "class A:\n    size = 3\n    def f(self):\n        return size\n"
+    assert _found(code) == [("NameError", 4)]
+
+
+def test_star_import_suppresses_name_errors():
+    assert _found("from math import *\nprint(sqrt(2))\n") == []
+
+
+@pytest.mark.parametrize("code", [
+    "def f(a, b):\n    return a\nf(1)\n",
+    "def f(a, b=1):\n    return a\nf(1, 2, 3)\n",
+    "def f(a):\n    return a\nf(1, a=2)\n",
+    "def f(a):\n    return a\nf(b=2)\n",
+    "def f(a, *, key):\n    return a\nf(1)\n",
+])
+def test_argument_errors_match_cpython(code):
+    findings = check(code)
+    assert [f["error_type"] for f in findings] == ["TypeError"]
+    assert findings[0]["original_message"] == _cpython_message(code)
+
+
+def test_calls_that_cannot_be_counted_are_not_reported():
+    code = ("def f(a, b):\n    return a\n"
+            "args = (1, 2)\nf(*args)\n"
+            "def g(a):\n    return a\ndef g(a, b):\n    return b\ng(1, 2)\n")
+    assert _found(code) == []
+
+
+def test_unused_variable_in_function():
+    code = "def f():\n    x = 1\n    _y = 2\n    for i in range(3):\n        pass\n    return 0\n"
+    assert _found(code) == [("UnusedVariable", 2)]
+
+
+def test_bare_annotation_is_not_a_binding():
+    assert _found("def f():\n    x: int\n    return 1\n") == []
+    assert _found("def f():\n    x: int = 1\n    return 1\n") == [("UnusedVariable", 2)]
+    assert _found("def f():\n    y: int\n    return y\n") == [("NameError", 3)]
+    assert _found("class P:\n    def __init__(self):\n        self.x: int\n") == []
+
+
+def test_dynamic_scope_suppresses_unused_variable():
+    assert _found("def f():\n    x = 1\n    return locals()\n") == []
+
+
+def test_unreachable_code_after_return():
+    code = "def f():\n    return 1\n    print('never')\n"
+    assert _found(code) == [("UnreachableCode", 3)]
+
+
+def test_shadowed_builtin_reported_once_per_scope():
+    code = "list = [1]\nlist = [2]\ndef f(sum):\n    return sum\n"
+    assert _found(code) == [("ShadowedBuiltin", 1), ("ShadowedBuiltin", 3)]
+
+
+def test_syntax_error_yields_nothing():
+    assert check("def f(:\n") == []
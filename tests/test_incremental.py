@@ -0,0 +1,98 @@
+# tests/test_incremental.py
+"""
+incremental.lint_incremental: değişmeyen tanımlar taslakla değiştirilir, önbellekteki
+bulguları yeni satırlarına taşınır; iskelet değişince tüm dosya yeniden lint edilir.
+"""
+import pytest
+
+import incremental
+
+
+class _FakeLint:
+    """'# BAD' içeren her satır için pylint JSON'una benzer bir bulgu üretir."""
+
+    def __init__(self):
+        self.sources = []
+
+    def __call__(self, source):
+        self.sources.append(source)
+        return [{"line": n, "endLine": n, "column": 4, "symbol": "bad"}
+                for n, line in enumerate(source.splitlines(), 1) if "# BAD" in line]
+
+
+@pytest.fixture(autouse=True)
+def sessions(monkeypatch):
+    monkeypatch.setattr(incremental, "sessions", incremental.SessionStore())
+
+
+V1 = """import math
+
+def a():
+    return 1  # BAD
+
+def b():
+    x = 2  # BAD
+    return x
+
+def c():
+    return a()
+
+print(math.pi)
+"""
+
+# a iki satır uzadı ve düzeldi; b ile iskelet aynı
+V2 = """import math
+
+def a():
+    y = 1
+    z = 2
+    return y + z
+
+def b():
+    x = 2  # BAD
+    return x
+
+def c():
+    return a()
+
+print(math.pi)
+"""
+
+
+def _lines(findings):
+    return [f["line"] for f in findings]
+
+
+def test_first_revision_is_linted_in_full():
+    lint = _FakeLint()
+    assert _lines(incremental.lint_incremental("s", V1, lint)) == [4, 7]
+    assert lint.sources == [V1]
+
+
+def test_unchanged_definition_is_stubbed_and_its_findings_move():
+    lint = _FakeLint()
+    incremental.lint_incremental("s", V1, lint)
+    findings = incremental.lint_incremental("s", V2, lint)
+
+    source = lint.sources[-1]
+    assert len(source.splitlines()) == len(V2.splitlines())  # satır numaraları kaymaz
+    assert "x = 2" not in source  # b taslakla değiştirildi
+    assert "def b(*args, **kwargs)" in source
+    assert "return a()" in source  # c, değişen a'yı kullandığı için açık verilir
+    # b'nin önbellekteki bulgusu 7. satırdan 9. satıra taşınır
+    assert findings == [{"line": 9, "endLine": 9, "column": 4, "symbol": "bad"}]
+
+
+def test_skeleton_change_relints_whole_file():
+    lint = _FakeLint()
+    incremental.lint_incremental("s", V1, lint)
+    v3 = "import os\n" + V1
+    assert _lines(incremental.lint_incremental("s", v3, lint)) == [5, 8]
+    assert lint.sources[-1] == v3
+
+
+def test_sessions_are_independent():
+    lint = _FakeLint()
+    incremental.lint_incremental("s1", V1, lint)
+    incremental.lint_incremental("s2", V2, lint)
+    assert lint.sources[-1] == V2
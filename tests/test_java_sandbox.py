@@ -0,0 +1,132 @@
+# tests/test_java_sandbox.py
+"""
+AnalyzerDaemon RUN yalıtımı: gönderim kendi thread grubundan kaçamaz, izinsiz işlemler
+reddedilir, çalıştırmadan arta kalan thread JVM'i yeniletir; sıradan kod çalışmaya devam eder.
+JDK (javac) ya da checkstyle.jar yoksa atlanır (Docker imajında ikisi de vardır).
+"""
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import java_daemon
+from java_runner import CHECKSTYLE_JAR
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+pytestmark = pytest.mark.skipif(shutil.which("javac") is None or not os.path.exists(CHECKSTYLE_JAR),
+                                reason="JDK veya checkstyle.jar yok")
+
+
+@pytest.fixture(scope="module")
+def daemon(tmp_path_factory):
+    build = tmp_path_factory.mktemp("javad-build")
+    subprocess.run(["javac", "-cp", CHECKSTYLE_JAR, "-d", str(build),
+                    os.path.join(ROOT, "java", "AnalyzerDaemon.java")], check=True)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(java_daemon, "JAVA_DAEMON_CLASSES", str(build))
+        d = java_daemon.JavaDaemon(heap=java_daemon.JAVA_RUN_HEAP, jvm_args=java_daemon.JAVA_RUN_JVM_ARGS)
+        yield d
+        d._kill()
+
+
+def _run(daemon, body, stdin="", time_limit=2.0):
+    code = "import java.util.*;\nimport java.io.*;\npublic class Main {\n" + body + "\n}\n"
+    result = daemon.run("Main.java", code, stdin, time_limit)
+    assert result["compiled"], result["errors"]
+    return result
+
+
+def test_thread_in_parent_group_is_denied(daemon, tmp_path):
+    marker = tmp_path / "escaped"
+    result = _run(daemon, """
+    public static void main(String[] args) throws Exception {
+        ThreadGroup parent = Thread.currentThread().getThreadGroup().getParent();
+        Thread t = new Thread(parent, () -> {
+            try { new FileWriter("%s").close(); } catch (IOException e) { }
+            System.exit(7);
+        });
+        t.start();
+        t.join();
+        System.out.println("escaped");
+    }""" % marker)
+    assert result["status"] == "exception"
+    assert b"java.lang.SecurityException" in result["stderr"]
+    assert b"escaped" not in result["stdout"]
+    assert not marker.exists()
+
+
+def test_thread_started_in_own_group_inherits_restrictions(daemon, tmp_path):
+    marker = tmp_path / "written"
+    result = _run(daemon, """
+    public static void main(String[] args) throws Exception {
+        final Throwable[] error = new Throwable[1];
+        Thread t = new Thread(() -> {
+            try { new FileWriter("%s").close(); } catch (Throwable e) { error[0] = e; }
+        });
+        t.start();
+        t.join();
+        System.out.println(error[0]);
+    }""" % marker)
+    assert result["status"] == "ok"
+    assert result["stdout"].startswith(b"java.security.AccessControlException")
+    assert not marker.exists()
+
+
+def test_reflection_and_context_loader_are_denied(daemon):
+    result = _run(daemon, """
+    static final class Other { private int hidden; }
+    public static void main(String[] args) throws Exception {
+        try {
+            Other.class.getDeclaredField("hidden").setAccessible(true);
+            System.out.println("reflection allowed");
+        } catch (SecurityException e) {
+            System.out.println("reflection denied");
+        }
+        try {
+            Thread.currentThread().setContextClassLoader(null);
+            System.out.println("loader allowed");
+        } catch (SecurityException e) {
+            System.out.println("loader denied");
+        }
+    }""")
+    assert result["stdout"].split() == [b"reflection", b"denied", b"loader", b"denied"]
+
+
+def test_exit_is_reported_as_exit_code(daemon):
+    result = _run(daemon, """
+    public static void main(String[] args) {
+        System.out.println("before");
+        System.exit(3);
+    }""")
+    assert (result["status"], result["exit_code"], result["stdout"]) == ("exit", 3, b"before\n")
+    assert daemon.proc is not None  # JVM yeniden kullanılır
+
+
+def test_leftover_thread_restarts_jvm(daemon):
+    result = _run(daemon, """
+    public static void main(String[] args) {
+        Thread t = new Thread(() -> {
+            while (true) { try { Thread.sleep(1000); } catch (InterruptedException e) { } }
+        });
+        t.setDaemon(true);
+        t.start();
+    }""", time_limit=0.5)
+    assert result["status"] == "timeout"
+    assert daemon.proc is None  # RESTART: sonraki çalıştırma taze JVM'de
+
+
+def test_ordinary_submission_still_runs(daemon):
+    result = _run(daemon, """
+    interface Op { int apply(int a, int b); }
+    public static void main(String[] args) {
+        Scanner in = new Scanner(System.in);
+        int a = in.nextInt(), b = in.nextInt();
+        Op add = (x, y) -> x + y;
+        List<Integer> list = new ArrayList<>(List.of(b, a));
+        list.sort(Comparator.naturalOrder());
+        System.out.println("sum=" + add.apply(a, b) + " sorted=" + list);
+    }""", stdin="5 3\n")
+    assert result["status"] == "ok", result["stderr"]
+    assert result["stdout"] == b"sum=8 sorted=[3, 5]\n"
@@ -0,0 +1,28 @@
+# tests/test_judge0_client.py
+"""
+Judge0Client.find_language_id: Judge0 CE dil tablosunda doğru sürüm seçilir.
+"""
+import time
+
+from bench.fake_judge0 import LANGUAGES
+from judge0_client import Judge0Client
+
+
+def _client(languages):
+    client = Judge0Client(base="http://judge0.invalid")
+    client._languages, client._languages_loaded_at = languages, time.monotonic()
+    return client
+
+
+def test_python_resolves_to_python3_not_python2():
+    assert _client(LANGUAGES).find_language_id("python") == 71
+
+
+def test_java_does_not_match_javascript():
+    languages = [{"id": 63, "name": "JavaScript (Node.js 12.14.0)"}, {"id": 62, "name": "Java (OpenJDK 13.0.1)"}]
+    assert _client(languages).find_language_id("java") == 62
+
+
+def test_other_languages_match_by_substring():
+    assert _client([{"id": 54, "name": "C++ (GCC 9.2.0)"}]).find_language_id("c++") == 54
+    assert _client(LANGUAGES).find_language_id("rust") is None
@@ -0,0 +1,91 @@
+# tests/test_result_cache.py
+"""
+result_cache: anahtar normalizasyonu, TTL, LRU tahliyesi ve paylaşılan disk katmanı.
+"""
+import pytest
+
+import result_cache
+from result_cache import ResultCache, make_key
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(result_cache.time, "time", clock)
+    return clock
+
+
+def test_key_ignores_line_endings_but_not_indentation():
+    assert make_key("x = 1\r\ny = 2\r\n", "python") == make_key("x = 1\ny = 2\n", "python")
+    assert make_key("x = 1\ry = 2\r", "python") == make_key("x = 1\ny = 2\n", "python")
+    assert make_key("if x:\n    y\n", "python") != make_key("if x:\n  y\n", "python")
+
+
+def test_key_depends_on_language_and_settings():
+    base = make_key("x = 1\n", "python")
+    assert make_key("x = 1\n", "python", deep=True) != base
+    assert make_key("x = 1\n", "python", deep=True) == make_key("x = 1\n", "python", deep=True)
+    assert make_key("x = 1\n", "python", include_all=False, deep=True) == \
+        make_key("x = 1\n", "python", deep=True, include_all=False)
+    assert make_key("x = 1\n", "java") != base
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = ResultCache(max_entries=8, ttl=10, cache_dir="")
+    cache.put("k", {"findings": []})
+    clock.now += 9.9
+    assert cache.get("k") == {"findings": []}
+    clock.now += 0.2
+    assert cache.get("k") is None
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1, "entries": 0}
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResultCache(max_entries=2, ttl=60, cache_dir="")
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # a en son kullanılan olur
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_zero_entries_disables_memory_tier(clock):
+    cache = ResultCache(max_entries=0, ttl=60, cache_dir="")
+    cache.put("a", 1)
+    assert cache.get("a") is None
+
+
+def test_disk_tier_is_shared_between_instances(clock, tmp_path):
+    writer = ResultCache(max_entries=8, ttl=60, cache_dir=str(tmp_path))
+    reader = ResultCache(max_entries=8, ttl=60, cache_dir=str(tmp_path))  # başka worker
+    writer.put("ab12", {"findings": [{"error_type": "E"}]})
+    assert (tmp_path / "ab" / "ab12.json").exists()
+    assert reader.get("ab12") == {"findings": [{"error_type": "E"}]}
+    assert reader.stats()["disk_hits"] == 1
+    # diskten okunan değer belleğe alınır
+    assert reader.get("ab12") == {"findings": [{"error_type": "E"}]}
+    assert reader.stats()["hits"] == 1
+
+
+def test_expired_disk_entry_is_removed(clock, tmp_path):
+    writer = ResultCache(max_entries=8, ttl=5, cache_dir=str(tmp_path))
+    writer.put("cd34", [1])
+    clock.now += 6
+    assert ResultCache(max_entries=8, ttl=5, cache_dir=str(tmp_path)).get("cd34") is None
+    assert not (tmp_path / "cd" / "cd34.json").exists()
+
+
+def test_unserializable_value_stays_in_memory_only(clock, tmp_path):
+    cache = ResultCache(max_entries=8, ttl=60, cache_dir=str(tmp_path))
+    cache.put("ef56", {"value": object()})
+    assert cache.get("ef56") is not None
+    assert list(tmp_path.rglob("*")) in ([], [tmp_path / "ef"])
@@ -0,0 +1,127 @@
+# tests/test_singleflight.py
+"""
+singleflight: aynı anahtarla süren işin sonucu hem aynı süreçteki thread'lere hem de
+(kilit + sonuç dosyasıyla) başka worker'lara verilir. Worker'lar burada aynı dizini
+paylaşan ayrı SingleFlight örnekleridir; flock her open() için ayrı tutulur.
+"""
+import threading
+import time
+
+import pytest
+
+from singleflight import SingleFlight
+
+
+@pytest.fixture
+def flights(tmp_path):
+    return (SingleFlight(directory=str(tmp_path), wait=5, poll=0.005),
+            SingleFlight(directory=str(tmp_path), wait=5, poll=0.005))
+
+
+def _waiting(flight):
+    """flight'ın başka worker'ın kilidini beklemeye başladığını bildiren olay."""
+    event = threading.Event()
+    wait_lock = flight._wait_lock
+
+    def wrapped(key):
+        event.set()
+        return wait_lock(key)
+
+    flight._wait_lock = wrapped
+    return event
+
+
+def _start(target, results, name):
+    def run():
+        try:
+            results[name] = target()
+        except Exception as e:
+            results[name] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_follower_worker_receives_leaders_result(flights):
+    leader, follower = flights
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append("leader")
+        release.wait(5)
+        return {"findings": [{"line": 1}]}
+
+    follower_waiting = _waiting(follower)
+    results = {}
+    threads = [_start(lambda: leader.do("k", slow), results, "leader")]
+    while not calls:
+        time.sleep(0.001)
+    threads.append(_start(lambda: follower.do("k", lambda: calls.append("follower")), results, "follower"))
+    assert follower_waiting.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == ["leader"]
+    assert results["leader"] == results["follower"] == {"findings": [{"line": 1}]}
+
+
+def test_follower_runs_itself_when_leader_fails(flights):
+    leader, follower = flights
+    release = threading.Event()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("lider düştü")
+
+    follower_waiting = _waiting(follower)
+    results = {}
+    threads = [_start(lambda: leader.do("k", failing), results, "leader")]
+    assert started.wait(5)
+    threads.append(_start(lambda: follower.do("k", lambda: "kendi sonucu"), results, "follower"))
+    assert follower_waiting.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert isinstance(results["leader"], RuntimeError)
+    assert results["follower"] == "kendi sonucu"
+
+
+def test_finished_result_is_not_reused(flights):
+    leader, follower = flights
+    assert leader.do("k", lambda: "ilk") == "ilk"
+    assert follower.do("k", lambda: "ikinci") == "ikinci"  # önbellek değil
+
+
+def test_threads_in_one_worker_share_a_call(flights):
+    flight, _ = flights
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return "tek"
+
+    results = {}
+    first = _start(lambda: flight.do("k", slow), results, "first")
+    while not calls:
+        time.sleep(0.001)
+    # ikinci thread liderin çağrısını beklemeye başlayınca haber ver
+    done = flight._calls["k"].done
+    following = threading.Event()
+    done_wait = done.wait
+    done.wait = lambda timeout=None: (following.set(), done_wait(timeout))[1]
+    second = _start(lambda: flight.do("k", slow), results, "second")
+    assert following.wait(5)
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert calls == [1]
+    assert results == {"first": "tek", "second": "tek"}